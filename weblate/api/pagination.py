@@ -2,14 +2,52 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from rest_framework.pagination import PageNumberPagination
+from rest_framework import pagination
+from rest_framework.exceptions import ValidationError
 from rest_framework.settings import api_settings
 
 
-class StandardPagination(PageNumberPagination):
+class CursorPagination(pagination.CursorPagination):
+    """
+    Cursor pagination following the ordering of the queryset.
+
+    The primary key is appended to make the ordering stable. Pages are
+    filtered only on the first ordering field, items sharing its value with
+    the cursor are skipped using an offset. This stays fast for deep pages as
+    long as the first field is indexed and mostly unique. No count is needed.
+    """
+
+    page_size_query_param = "page_size"
+
+    def get_ordering(self, request, queryset, view):
+        ordering = tuple(queryset.query.order_by) or ("id",)
+        if any(not isinstance(field, str) or "__" in field for field in ordering):
+            raise ValidationError("Cursor pagination is not supported here.")
+        if ordering[-1].lstrip("-") not in {"id", "pk"}:
+            ordering = (*ordering, "-id" if ordering[-1].startswith("-") else "id")
+        return ordering
+
+
+class StandardPagination(pagination.PageNumberPagination):
+    """Page number pagination, switching to cursor one when cursor is passed."""
+
     page_size = api_settings.PAGE_SIZE
     page_size_query_param = "page_size"
     max_page_size = 1000
+    cursor_paginator: CursorPagination | None = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if CursorPagination.cursor_query_param in request.query_params:
+            self.cursor_paginator = CursorPagination()
+            self.cursor_paginator.page_size = self.page_size
+            self.cursor_paginator.max_page_size = self.max_page_size
+            return self.cursor_paginator.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
 
 
 class LargePagination(StandardPagination):
@@ -0,0 +1,42 @@
+# Copyright © Michal Čihař <michal@weblate.org>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+from rest_framework.renderers import BaseRenderer
+
+
+def escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class PrometheusRenderer(BaseRenderer):
+    """
+    Renderer for the Prometheus text exposition format.
+
+    Numeric values are rendered as gauges and dictionaries of numeric values
+    as gauges labeled by the key, other values are skipped.
+    """
+
+    media_type = "text/plain"
+    format = "prometheus"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        lines = []
+        for key, value in data.items():
+            metric = f"weblate_{key}"
+            if isinstance(value, dict):
+                values = [
+                    (f'{metric}{{key="{escape_label(str(label))}"}}', item)
+                    for label, item in value.items()
+                    if isinstance(item, int | float) and not isinstance(item, bool)
+                ]
+            elif isinstance(value, int | float) and not isinstance(value, bool):
+                values = [(metric, value)]
+            else:
+                continue
+            lines.append(f"# TYPE {metric} gauge")
+            lines.extend(f"{name} {item}" for name, item in values)
+        return "".join(f"{line}\n" for line in lines)
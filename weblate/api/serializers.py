@@ -1123,6 +1123,33 @@ class UnitWriteSerializer(serializers.ModelSerializer[Unit]):
         return super().to_internal_value(data)
 
 
+class BulkUnitSerializer(serializers.Serializer):
+    """Serializer for a single string in a bulk update."""
+
+    id = serializers.IntegerField(required=False)
+    id_hash = serializers.IntegerField(required=False)
+    target = PluralField(required=False)
+    state = serializers.IntegerField(required=False)
+    extra_flags = serializers.CharField(required=False, allow_blank=True)
+
+    def to_internal_value(self, data):
+        # Allow blank target for untranslated strings, the field is shared
+        # by all items so it has to be set for each of them
+        self.fields["target"].child.allow_blank = isinstance(data, dict) and data.get(
+            "state"
+        ) in {0, "0"}
+        return super().to_internal_value(data)
+
+    def validate(self, attrs):
+        if "id" not in attrs and "id_hash" not in attrs:
+            raise serializers.ValidationError("Either id or id_hash is required.")
+        return attrs
+
+
+class BulkUnitsSerializer(serializers.Serializer):
+    units = BulkUnitSerializer(many=True, allow_empty=False, max_length=1000)
+
+
 class NewUnitSerializer(serializers.Serializer):
     state = serializers.ChoiceField(
         choices=[
@@ -2,11 +2,14 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import json
 import os
 from copy import copy
 from datetime import timedelta
 from io import BytesIO
+from unittest.mock import patch
 
+from django.core.cache import cache
 from django.core.files import File
 from django.urls import reverse
 from rest_framework.exceptions import ErrorDetail
@@ -17,6 +20,11 @@ from weblate.accounts.models import Subscription
 from weblate.auth.models import Group, Role, User
 from weblate.lang.models import Language
 from weblate.memory.models import Memory
+from weblate.metrics.counters import (
+    get_counter_key,
+    get_counters,
+    reconcile_counters,
+)
 from weblate.screenshots.models import Screenshot
 from weblate.trans.models import (
     Category,
@@ -88,6 +96,27 @@ class APIBaseTest(APITestCase, RepoTestMixin):
             self.user.save()
         self.client.credentials(HTTP_AUTHORIZATION="Token " + self.user.auth_token.key)
 
+    def fetch_ndjson(self, url, params=None) -> list:
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        content = b"".join(response.streaming_content).decode()
+        return [json.loads(line) for line in content.splitlines()]
+
+    def fetch_cursor_pages(self, url, params=None) -> list:
+        """Return results of all pages using cursor pagination."""
+        results = []
+        response = self.client.get(
+            url, {"cursor": "", "page_size": 5, **(params or {})}
+        )
+        while True:
+            self.assertEqual(response.status_code, 200)
+            self.assertNotIn("count", response.data)
+            results.extend(response.data["results"])
+            if not response.data["next"]:
+                return results
+            response = self.client.get(response.data["next"])
+
     def do_request(
         self,
         name,
@@ -1046,6 +1075,17 @@ class ProjectAPITest(APIBaseTest):
         request = self.do_request("api:project-statistics", self.project_kwargs)
         self.assertEqual(request.data["total"], 16)
 
+    def test_units_export(self) -> None:
+        self.authenticate()
+        rows = self.fetch_ndjson(
+            reverse("api:project-units-export", kwargs=self.project_kwargs)
+        )
+        self.assertEqual(
+            len(rows),
+            Unit.objects.filter(translation__component__project__slug="test").count(),
+        )
+        self.assertEqual({row["project"] for row in rows}, {"test"})
+
     def test_languages(self) -> None:
         request = self.do_request("api:project-languages", self.project_kwargs)
         self.assertEqual(len(request.data), 4)
@@ -2021,6 +2061,18 @@ class ComponentAPITest(APIBaseTest):
             skip=("results", "previous", "next"),
         )
 
+    def test_units_export(self) -> None:
+        self.authenticate()
+        rows = self.fetch_ndjson(
+            reverse("api:component-units-export", kwargs=self.component_kwargs)
+        )
+        self.assertEqual(len(rows), 16)
+        rows = self.fetch_ndjson(
+            reverse("api:component-units-export", kwargs=self.component_kwargs),
+            {"q": "language:cs"},
+        )
+        self.assertEqual({row["language"] for row in rows}, {"cs"})
+
     def test_new_template_404(self) -> None:
         self.do_request("api:component-new-template", self.component_kwargs, code=404)
 
@@ -2824,6 +2876,76 @@ class TranslationAPITest(APIBaseTest):
         request = self.do_request("api:translation-units", self.translation_kwargs)
         self.assertEqual(request.data["count"], 4)
 
+    def test_units_cursor(self) -> None:
+        self.authenticate()
+        results = self.fetch_cursor_pages(
+            reverse("api:translation-units", kwargs=self.translation_kwargs)
+        )
+        ids = [item["id"] for item in results]
+        self.assertEqual(len(ids), 4)
+        self.assertEqual(ids, sorted(ids))
+
+    def test_units_export(self) -> None:
+        self.authenticate()
+        url = reverse("api:translation-units-export", kwargs=self.translation_kwargs)
+        rows = self.fetch_ndjson(url)
+        self.assertEqual(len(rows), 4)
+        self.assertEqual(rows[0]["language"], "cs")
+        self.assertEqual(rows[0]["component"], "test")
+        self.assertIsInstance(rows[0]["source"], list)
+        self.assertEqual([row["id"] for row in rows], sorted(row["id"] for row in rows))
+        rows = self.fetch_ndjson(url, {"q": "source:Thank"})
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["source"], ["Thank you for using Weblate."])
+        response = self.client.get(url, {"q": "invalid:("})
+        self.assertEqual(response.status_code, 400)
+
+    def test_units_bulk(self) -> None:
+        unit = Unit.objects.get(
+            translation__language_code="cs", source="Hello, world!\n"
+        )
+        other = Unit.objects.get(
+            translation__language_code="cs", source="Thank you for using Weblate."
+        )
+        url = reverse("api:translation-units-bulk", kwargs=self.translation_kwargs)
+        request = {
+            "units": [
+                {"id": unit.pk, "target": ["Nazdar svete!\n"], "state": 20},
+                {"id_hash": other.id_hash, "target": ["Díky"], "state": 10},
+                {"id": unit.pk, "target": ["Nazdar"], "state": 5},
+                {"id": -1, "target": ["Nazdar"], "state": 20},
+            ]
+        }
+        response = self.do_request(url, method="post", request=request, format="json")
+        self.assertEqual(response.data["updated"], 2)
+        self.assertEqual(
+            [item["result"] for item in response.data["results"]],
+            [True, True, False, False],
+        )
+        self.assertIn("state", response.data["results"][2]["error"])
+        self.assertEqual(response.data["results"][3]["error"], "String not found.")
+        unit.refresh_from_db()
+        self.assertEqual(unit.target, "Nazdar svete!\n")
+        self.assertEqual(unit.state, STATE_TRANSLATED)
+        other.refresh_from_db()
+        self.assertEqual(other.target, "Díky")
+
+        # Invalid payload
+        self.do_request(
+            url,
+            method="post",
+            request={"units": [{"target": ["Nazdar"], "state": 20}]},
+            format="json",
+            code=400,
+        )
+
+    def test_changes_cursor(self) -> None:
+        self.authenticate()
+        results = self.fetch_cursor_pages(
+            reverse("api:translation-changes", kwargs=self.translation_kwargs)
+        )
+        self.assertEqual(len({item["id"] for item in results}), 5)
+
     def test_autotranslate(self, format: str = "multipart") -> None:  # noqa: A002
         self.do_request(
             "api:translation-autotranslate",
@@ -3242,6 +3364,16 @@ class UnitAPITest(APIBaseTest):
         response = self.client.get(reverse("api:unit-list"))
         self.assertEqual(response.data["count"], 16)
 
+    def test_list_units_cursor(self) -> None:
+        results = self.fetch_cursor_pages(reverse("api:unit-list"))
+        ids = [item["id"] for item in results]
+        self.assertEqual(len(ids), 16)
+        self.assertEqual(ids, sorted(ids))
+        results = self.fetch_cursor_pages(
+            reverse("api:unit-list"), {"q": "is:translated"}
+        )
+        self.assertEqual(len(results), 6)
+
     def test_list_units_filter(self) -> None:
         response = self.client.get(reverse("api:unit-list"), {"q": "is:translated"})
         self.assertEqual(response.data["count"], 6)
@@ -3874,6 +4006,12 @@ class ChangeAPITest(APIBaseTest):
         response = self.client.get(reverse("api:change-list"))
         self.assertEqual(response.data["count"], 30)
 
+    def test_list_changes_cursor(self) -> None:
+        response = self.client.get(reverse("api:change-list"), {"page_size": 30})
+        expected = [item["id"] for item in response.data["results"]]
+        results = self.fetch_cursor_pages(reverse("api:change-list"))
+        self.assertEqual([item["id"] for item in results], expected)
+
     def test_filter_changes_after(self) -> None:
         """Filter changes since timestamp."""
         start = Change.objects.order().last().timestamp
@@ -3903,10 +4041,53 @@ class ChangeAPITest(APIBaseTest):
 
 
 class MetricsAPITest(APIBaseTest):
+    def setUp(self) -> None:
+        super().setUp()
+        # Counters might be left from other tests
+        reconcile_counters()
+
     def test_metrics(self) -> None:
         self.authenticate()
         response = self.client.get(reverse("api:metrics"))
         self.assertEqual(response.data["projects"], 1)
+        self.assertIn("hits", response.data["vcs_blob_hash_cache"])
+
+    def test_metrics_counters(self) -> None:
+        self.authenticate()
+        project = Project.objects.create(name="Other", slug="other")
+        with self.assertNumQueries(0):
+            counters = get_counters()
+        self.assertEqual(counters["projects"], 2)
+        response = self.client.get(reverse("api:metrics"))
+        self.assertEqual(response.data["projects"], 2)
+        project.delete()
+        response = self.client.get(reverse("api:metrics"))
+        self.assertEqual(response.data["projects"], 1)
+
+    def test_metrics_counters_missing(self) -> None:
+        counters = get_counters()
+        # Large tables are not counted while serving the metrics
+        cache.delete(get_counter_key("checks"))
+        with (
+            patch("weblate.metrics.counters.schedule_reconcile_counters") as schedule,
+            self.assertNumQueries(0),
+        ):
+            self.assertEqual(get_counters()["checks"], counters["checks"])
+        schedule.assert_called_once()
+
+    def test_metrics_prometheus(self) -> None:
+        self.authenticate()
+        response = self.client.get(reverse("api:metrics"), {"format": "prometheus"})
+        self.assertEqual(response["Content-Type"], "text/plain; charset=utf-8")
+        content = response.content.decode()
+        self.assertIn("# TYPE weblate_projects gauge\nweblate_projects 1\n", content)
+        self.assertIn('weblate_vcs_blob_hash_cache{key="hits"}', content)
+        self.assertNotIn("weblate_name", content)
+
+        response = self.client.get(
+            reverse("api:metrics"), headers={"accept": "text/plain"}
+        )
+        self.assertEqual(response["Content-Type"], "text/plain; charset=utf-8")
 
     def test_forbidden(self) -> None:
         response = self.client.get(reverse("api:metrics"))
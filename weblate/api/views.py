@@ -4,7 +4,9 @@
 
 from __future__ import annotations
 
+import json
 import os.path
+from typing import TYPE_CHECKING
 from urllib.parse import unquote
 
 from celery.result import AsyncResult
@@ -12,9 +14,10 @@ from django.conf import settings
 from django.contrib.messages import get_messages
 from django.core.cache import cache
 from django.core.exceptions import PermissionDenied
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import transaction
-from django.db.models import Model, Q
-from django.http import Http404, HttpResponse
+from django.db.models import F, Model, Q
+from django.http import Http404, HttpResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from django.utils.html import format_html
 from django.utils.translation import gettext
@@ -42,11 +45,13 @@ from weblate.accounts.models import Subscription
 from weblate.accounts.utils import remove_user
 from weblate.addons.models import Addon
 from weblate.api.pagination import LargePagination
+from weblate.api.renderers import PrometheusRenderer
 from weblate.api.serializers import (
     AddonSerializer,
     BasicUserSerializer,
     BilingualSourceUnitSerializer,
     BilingualUnitSerializer,
+    BulkUnitsSerializer,
     CategorySerializer,
     ChangeSerializer,
     ComponentListSerializer,
@@ -76,10 +81,10 @@ from weblate.api.serializers import (
     get_reverse_kwargs,
 )
 from weblate.auth.models import AuthenticatedHttpRequest, Group, Role, User
-from weblate.checks.models import Check
 from weblate.formats.models import EXPORTERS
 from weblate.lang.models import Language
 from weblate.memory.models import Memory
+from weblate.metrics.counters import get_counters
 from weblate.screenshots.models import Screenshot
 from weblate.trans.exceptions import FileParseError
 from weblate.trans.forms import AutoForm
@@ -89,7 +94,6 @@ from weblate.trans.models import (
     Component,
     ComponentList,
     Project,
-    Suggestion,
     Translation,
     Unit,
 )
@@ -99,6 +103,7 @@ from weblate.trans.tasks import (
     component_removal,
     project_removal,
 )
+from weblate.trans.util import split_plural
 from weblate.trans.views.files import download_multi
 from weblate.utils.celery import get_queue_stats, get_task_progress, is_task_ready
 from weblate.utils.docs import get_doc_url
@@ -113,7 +118,10 @@ from weblate.utils.state import (
 )
 from weblate.utils.stats import GlobalStats
 from weblate.utils.views import download_translation_file, zip_download
-from weblate.wladmin.models import ConfigurationError
+from weblate.vcs.base import get_blob_hash_stats
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
 REPO_OPERATIONS = {
     "push": ("vcs.push", "do_push", (), True),
@@ -169,6 +177,61 @@ def get_view_description(view, html=False):
     return description
 
 
+# Number of units fetched from the database at once when exporting
+UNITS_EXPORT_CHUNK = 1000
+
+UNITS_EXPORT_FIELDS = (
+    "id",
+    "id_hash",
+    "content_hash",
+    "source_unit_id",
+    "context",
+    "source",
+    "previous_source",
+    "target",
+    "state",
+    "location",
+    "note",
+    "flags",
+    "extra_flags",
+    "explanation",
+    "position",
+    "num_words",
+    "priority",
+    "pending",
+    "timestamp",
+    "last_updated",
+)
+
+
+def iter_units_ndjson(units) -> Iterator[bytes]:
+    """Serialize units as newline-delimited JSON, one unit per line."""
+    rows = units.values(
+        *UNITS_EXPORT_FIELDS,
+        project=F("translation__component__project__slug"),
+        component=F("translation__component__slug"),
+        language=F("translation__language__code"),
+    ).order_by("id")
+    for row in rows.iterator(chunk_size=UNITS_EXPORT_CHUNK):
+        for field in ("source", "previous_source", "target"):
+            row[field] = split_plural(row[field])
+        yield json.dumps(row, cls=DjangoJSONEncoder).encode() + b"\n"
+
+
+def export_units(request, units, **kwargs) -> StreamingHttpResponse:
+    query_string = request.GET.get("q", "")
+    try:
+        parse_query(query_string)
+    except Exception as error:
+        report_error()
+        raise ValidationError({"q": f"Could not parse query string: {error}"})
+    if query_string:
+        units = units.search(query_string, **kwargs)
+    return StreamingHttpResponse(
+        iter_units_ndjson(units), content_type="application/x-ndjson"
+    )
+
+
 class DownloadViewSet(viewsets.ReadOnlyModelViewSet):
     raw_urls: tuple[str, ...] = ()
     raw_formats: tuple[str, ...] = tuple(EXPORTERS)
@@ -249,8 +312,8 @@ class WeblateViewSet(DownloadViewSet):
 
         data = {
             "needs_commit": obj.needs_commit(),
-            "needs_merge": obj.repo_needs_merge(),
-            "needs_push": obj.repo_needs_push(),
+            "needs_merge": obj.repo_needs_merge(cached=True),
+            "needs_push": obj.repo_needs_push(cached=True),
         }
 
         if isinstance(obj, Project):
@@ -820,6 +883,17 @@ class ProjectViewSet(
 
         return self.get_paginated_response(serializer.data)
 
+    @action(detail=True, methods=["get"], url_path="units/export")
+    def units_export(self, request, **kwargs):
+        obj = self.get_object()
+        return export_units(
+            request,
+            Unit.objects.filter_access(request.user).filter(
+                translation__component__project=obj
+            ),
+            project=obj,
+        )
+
     @action(detail=True, methods=["get", "post"])
     def labels(self, request, **kwargs):
         obj = self.get_object()
@@ -1062,6 +1136,15 @@ class ComponentViewSet(MultipleFieldViewSet, UpdateModelMixin, DestroyModelMixin
 
         return self.get_paginated_response(serializer.data)
 
+    @action(detail=True, methods=["get"], url_path="units/export")
+    def units_export(self, request, **kwargs):
+        obj = self.get_object()
+        return export_units(
+            request,
+            Unit.objects.filter(translation__component=obj),
+            project=obj.project,
+        )
+
     @action(detail=True, methods=["get"])
     def screenshots(self, request, **kwargs):
         obj = self.get_object()
@@ -1321,6 +1404,60 @@ class TranslationViewSet(MultipleFieldViewSet, DestroyModelMixin):
 
         return self.get_paginated_response(serializer.data)
 
+    @action(detail=True, methods=["get"], url_path="units/export")
+    def units_export(self, request, **kwargs):
+        obj = self.get_object()
+        return export_units(request, obj.unit_set.all())
+
+    @action(detail=True, methods=["post"], url_path="units/bulk")
+    def units_bulk(self, request, **kwargs):
+        """Update several strings at once."""
+        obj = self.get_object()
+        serializer = BulkUnitsSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        items = serializer.validated_data["units"]
+
+        units = obj.unit_set.filter(
+            Q(pk__in=[item["id"] for item in items if "id" in item])
+            | Q(id_hash__in=[item["id_hash"] for item in items if "id_hash" in item])
+        ).prefetch()
+        by_id = {}
+        by_hash = {}
+        for unit in units:
+            # Share the translation so that stats are invalidated once
+            unit.translation = obj
+            by_id[unit.pk] = by_hash[unit.id_hash] = unit
+
+        component = obj.component
+        results = []
+        updated = 0
+        with transaction.atomic():
+            component.start_batched_checks()
+            for item in items:
+                unit = (
+                    by_id.get(item["id"])
+                    if "id" in item
+                    else by_hash.get(item["id_hash"])
+                )
+                result = {key: item[key] for key in ("id", "id_hash") if key in item}
+                if unit is None:
+                    result["error"] = "String not found."
+                else:
+                    try:
+                        update_unit(request.user, unit, item)
+                    except PermissionDenied as error:
+                        result["error"] = str(error)
+                    except ValidationError as error:
+                        result["error"] = error.detail
+                    else:
+                        updated += 1
+                result["result"] = "error" not in result
+                results.append(result)
+            component.update_source_checks()
+            component.run_batched_checks()
+
+        return Response({"updated": updated, "results": results})
+
     @action(detail=True, methods=["post"])
     def autotranslate(self, request, **kwargs):
         translation = self.get_object()
@@ -1401,6 +1538,91 @@ class LanguageViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
+def check_unit_update(user: User, unit: Unit, data: dict) -> tuple[bool, bool]:
+    """
+    Validate update of a string.
+
+    Returns whether the translation and the source string properties are
+    changed, raises ValidationError or PermissionDenied.
+    """
+    do_translate = "target" in data or "state" in data
+    do_source = "extra_flags" in data or "explanation" in data or "labels" in data
+    translation = unit.translation
+
+    new_target = data.get("target", [])
+    new_state = data.get("state")
+
+    # Sanity and permission checks
+    if do_source and (
+        not unit.is_source or not user.has_perm("source.edit", translation)
+    ):
+        raise PermissionDenied(
+            "Source strings properties can be set only on source strings"
+        )
+
+    if do_translate:
+        new_target_copy = new_target[:]
+        if new_target_copy != unit.adjust_plurals(new_target):
+            raise ValidationError({"target": "Number of plurals does not match"})
+
+        if unit.readonly:
+            raise PermissionDenied("The string is read-only.")
+        if not new_target or new_state is None:
+            raise ValidationError(
+                "Please provide both state and target for a partial update"
+            )
+
+        if new_state not in {
+            STATE_APPROVED,
+            STATE_TRANSLATED,
+            STATE_FUZZY,
+            STATE_EMPTY,
+        }:
+            raise ValidationError({"state": "Invalid state"})
+
+        if new_state == STATE_EMPTY and any(new_target):
+            raise ValidationError(
+                {"state": "Can not use empty state with non empty target"}
+            )
+
+        if new_state != STATE_EMPTY and not any(new_target):
+            raise ValidationError(
+                {"state": "Can not use non empty state with empty target"}
+            )
+
+        can_edit = user.has_perm("unit.edit", unit)
+        if not can_edit:
+            raise PermissionDenied(can_edit.reason)
+
+        if new_state == STATE_APPROVED:
+            can_review = user.has_perm("unit.review", translation)
+            if not can_review:
+                raise ValidationError({"state": can_review.reason})
+
+    return do_translate, do_source
+
+
+def update_unit(user: User, unit: Unit, data: dict) -> None:
+    """Validate and perform update of a string."""
+    do_translate, do_source = check_unit_update(user, unit, data)
+
+    # Update attributes
+    if do_source:
+        fields = ["extra_flags", "explanation"]
+        for name in fields:
+            try:
+                setattr(unit, name, data[name])
+            except KeyError:
+                continue
+        if "labels" in data:
+            unit.labels.set(data["labels"])
+        unit.save(update_fields=fields)
+
+    # Handle translate
+    if do_translate:
+        unit.translate(user, data["target"], data["state"])
+
+
 class UnitViewSet(viewsets.ReadOnlyModelViewSet, UpdateModelMixin, DestroyModelMixin):
     """Units API."""
 
@@ -1434,80 +1656,12 @@ class UnitViewSet(viewsets.ReadOnlyModelViewSet, UpdateModelMixin, DestroyModelM
             result = result.search(query_string)
         return result
 
-    def perform_update(self, serializer) -> None:  # noqa: C901
-        data = serializer.validated_data
-        do_translate = "target" in data or "state" in data
-        do_source = "extra_flags" in data or "explanation" in data or "labels" in data
+    def perform_update(self, serializer) -> None:
         unit = serializer.instance
-        translation = unit.translation
-        request = self.request
-        user = request.user
-
-        new_target = data.get("target", [])
-        new_state = data.get("state", None)
-
-        # Sanity and permission checks
-        if do_source and (
-            not unit.is_source or not user.has_perm("source.edit", translation)
-        ):
-            self.permission_denied(
-                request, "Source strings properties can be set only on source strings"
-            )
-
-        if do_translate:
-            new_target_copy = new_target[:]
-            if new_target_copy != unit.adjust_plurals(new_target):
-                raise ValidationError({"target": "Number of plurals does not match"})
-
-            if unit.readonly:
-                self.permission_denied(request, "The string is read-only.")
-            if not new_target or new_state is None:
-                raise ValidationError(
-                    "Please provide both state and target for a partial update"
-                )
-
-            if new_state not in {
-                STATE_APPROVED,
-                STATE_TRANSLATED,
-                STATE_FUZZY,
-                STATE_EMPTY,
-            }:
-                raise ValidationError({"state": "Invalid state"})
-
-            if new_state == STATE_EMPTY and any(new_target):
-                raise ValidationError(
-                    {"state": "Can not use empty state with non empty target"}
-                )
-
-            if new_state != STATE_EMPTY and not any(new_target):
-                raise ValidationError(
-                    {"state": "Can not use non empty state with empty target"}
-                )
-
-            can_edit = user.has_perm("unit.edit", unit)
-            if not can_edit:
-                self.permission_denied(request, can_edit.reason)
-
-            if new_state == STATE_APPROVED:
-                can_review = user.has_perm("unit.review", translation)
-                if not can_review:
-                    raise ValidationError({"state": can_review.reason})
-
-        # Update attributes
-        if do_source:
-            fields = ["extra_flags", "explanation"]
-            for name in fields:
-                try:
-                    setattr(unit, name, data[name])
-                except KeyError:
-                    continue
-            if "labels" in data:
-                unit.labels.set(data["labels"])
-            unit.save(update_fields=fields)
-
-        # Handle translate
-        if do_translate:
-            unit.translate(user, new_target, new_state)
+        try:
+            update_unit(self.request.user, unit, serializer.validated_data)
+        except PermissionDenied as error:
+            self.permission_denied(self.request, str(error))
 
     def destroy(self, request, *args, **kwargs):
         obj = self.get_object()
@@ -1812,25 +1966,26 @@ class Metrics(APIView):
     """Metrics view for monitoring."""
 
     permission_classes = (IsAuthenticated,)
+    renderer_classes = (*api_settings.DEFAULT_RENDERER_CLASSES, PrometheusRenderer)
 
     def get(self, request, format=None):  # noqa: A002
         stats = GlobalStats()
+        counters = get_counters()
         return Response(
             {
                 "units": stats.all,
                 "units_translated": stats.translated,
-                "users": User.objects.count(),
+                "users": counters["users"],
                 "changes": stats.total_changes,
-                "projects": Project.objects.count(),
-                "components": Component.objects.count(),
-                "translations": Translation.objects.count(),
+                "projects": counters["projects"],
+                "components": counters["components"],
+                "translations": counters["translations"],
                 "languages": stats.languages,
-                "checks": Check.objects.count(),
-                "configuration_errors": ConfigurationError.objects.filter(
-                    ignored=False
-                ).count(),
-                "suggestions": Suggestion.objects.count(),
+                "checks": counters["checks"],
+                "configuration_errors": counters["configuration_errors"],
+                "suggestions": counters["suggestions"],
                 "celery_queues": get_queue_stats(),
+                "vcs_blob_hash_cache": get_blob_hash_stats(),
                 "name": settings.SITE_TITLE,
             }
         )
@@ -5,7 +5,10 @@
 from __future__ import annotations
 
 import re
-from typing import TYPE_CHECKING
+from contextlib import contextmanager
+from contextvars import ContextVar
+from itertools import starmap
+from typing import TYPE_CHECKING, Any
 
 import sentry_sdk
 from django.http import Http404
@@ -18,12 +21,35 @@ from weblate.utils.docs import get_doc_url
 from weblate.utils.xml import parse_xml
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Callable, Iterable, Iterator
 
     from django_stubs_ext import StrOrPromise
 
     from weblate.trans.models import Unit
 
+# Results of source strings processing shared while checking units in batch
+BATCH_SOURCE_CACHE: ContextVar[dict[tuple[str, str], Any] | None] = ContextVar(
+    "batch_source_cache", default=None
+)
+
+
+@contextmanager
+def batch_source_cache() -> Iterator[None]:
+    """
+    Share processing of source strings between checked units.
+
+    Source strings are same for all translations in a component, so this is
+    used while checking whole translations or components.
+    """
+    if BATCH_SOURCE_CACHE.get() is not None:
+        yield
+        return
+    token = BATCH_SOURCE_CACHE.set({})
+    try:
+        yield
+    finally:
+        BATCH_SOURCE_CACHE.reset(token)
+
 
 class Check:
     """Basic class for checks."""
@@ -115,6 +141,35 @@ class Check:
         """Check for single phrase, not dealing with plurals."""
         raise NotImplementedError
 
+    def check_target_batch(
+        self, items: list[tuple[list[str], list[str], Unit]]
+    ) -> list[bool | dict]:
+        """
+        Check target strings of multiple units.
+
+        Receives list of source plurals, target plurals and unit and returns
+        list of check results in the same order.
+        """
+        with batch_source_cache():
+            return list(starmap(self.check_target, items))
+
+    def check_source_batch(self, items: list[tuple[list[str], Unit]]) -> list[bool]:
+        """Check source strings of multiple units."""
+        with batch_source_cache():
+            return list(starmap(self.check_source, items))
+
+    def get_source_cached(self, name: str, source: str, func: Callable[[str], Any]):
+        """Process source string, the result is cached while checking in batch."""
+        cache = BATCH_SOURCE_CACHE.get()
+        if cache is None:
+            return func(source)
+        key = (name, source)
+        try:
+            return cache[key]
+        except KeyError:
+            result = cache[key] = func(source)
+            return result
+
     def check_source(self, source, unit):
         """Check source strings."""
         if self.should_skip(unit):
@@ -234,13 +289,19 @@ class BatchCheckMixin(Check):
         Check.objects.bulk_create(create, batch_size=500, ignore_conflicts=True)
 
         # Delete stale checks
-        stale_checks = Check.objects.exclude(unit_id__in=handled)
-        if self.batch_project_wide and component.allow_translation_propagation:
+        project_wide = (
+            self.batch_project_wide and component.allow_translation_propagation
+        )
+        stale_checks = Check.objects.filter(name=self.check_id)
+        if project_wide:
             stale_checks = stale_checks.filter(
                 unit__translation__component__project=component.project,
                 unit__translation__component__allow_translation_propagation=True,
-                name=self.check_id,
             )
+        else:
+            stale_checks = stale_checks.filter(unit__translation__component=component)
+        stale_checks = stale_checks.exclude(unit_id__in=handled)
+        if project_wide:
             for current in Component.objects.filter(
                 pk__in=stale_checks.values_list(
                     "unit__translation__component", flat=True
@@ -248,13 +309,8 @@ class BatchCheckMixin(Check):
             ):
                 components[current.pk] = current
             stale_checks.delete()
-        else:
-            stale_checks = stale_checks.filter(
-                unit__translation__component=component,
-                name=self.check_id,
-            )
-            if stale_checks.delete()[0]:
-                components[component.id] = component
+        elif stale_checks.delete()[0]:
+            components[component.id] = component
 
         # Invalidate stats in case there were changes
         for current in components.values():
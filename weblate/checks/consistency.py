@@ -6,7 +6,7 @@ from __future__ import annotations
 
 from functools import reduce
 
-from django.db.models import Count, Prefetch, Q, Value
+from django.db.models import Count, Exists, OuterRef, Prefetch, Q, Value
 from django.db.models.functions import MD5, Lower
 from django.utils.translation import gettext, gettext_lazy, ngettext
 
@@ -109,34 +109,19 @@ class ConsistencyCheck(TargetCheck, BatchCheckMixin):
             translation__component__allow_translation_propagation=True,
         )
 
-        # List strings with different targets
-        # Limit this to 100 strings, otherwise the resulting query is way too complex
-        matches = (
-            units.values("id_hash", "translation__language", "translation__plural")
-            .annotate(Count("target", distinct=True))
-            .filter(target__count__gt=1)
-            .order_by("id_hash")[:100]
-        )
+        # Strings with a different translation of the same string in another
+        # component, this is evaluated as a semi-join by the database
+        different = units.filter(
+            id_hash=OuterRef("id_hash"),
+            translation__language=OuterRef("translation__language"),
+            translation__plural=OuterRef("translation__plural"),
+        ).exclude(target=OuterRef("target"))
+        matches = units.filter(Exists(different))
 
-        if not matches:
+        if not matches.exists():
             return []
 
-        return (
-            units.filter(
-                reduce(
-                    lambda x, y: x
-                    | (
-                        Q(id_hash=y["id_hash"])
-                        & Q(translation__language=y["translation__language"])
-                        & Q(translation__plural=y["translation__plural"])
-                    ),
-                    matches,
-                    Q(),
-                )
-            )
-            .prefetch()
-            .prefetch_bulk()
-        )
+        return matches.prefetch().prefetch_bulk()
 
 
 class ReusedCheck(TargetCheck, BatchCheckMixin):
@@ -282,8 +282,8 @@ class BaseFormatCheck(TargetCheck):
         if (
             len(sources) > 1
             and self.regexp
-            and not self.extract_matches(sources[0])
-            and self.extract_matches(sources[1])
+            and not self.extract_source_matches(sources[0])
+            and self.extract_source_matches(sources[1])
         ):
             source = sources[1]
         else:
@@ -336,6 +336,11 @@ class BaseFormatCheck(TargetCheck):
     def extract_matches(self, string: str) -> list[str]:
         return [self.cleanup_string(x[0]) for x in self.regexp.findall(string)]
 
+    def extract_source_matches(self, string: str) -> list[str]:
+        return self.get_source_cached(
+            f"{self.check_id}:matches", string, self.extract_matches
+        )
+
     def check_format(self, source, target, ignore_missing, unit):
         """Check for format strings."""
         if not target or not source:
@@ -344,7 +349,7 @@ class BaseFormatCheck(TargetCheck):
         uses_position = True
 
         # Calculate value and ignore mismatch in percent position
-        src_matches = self.normalize(self.extract_matches(source))
+        src_matches = self.normalize(self.extract_source_matches(source))
         if src_matches:
             uses_position = any(self.is_position_based(x) for x in src_matches)
 
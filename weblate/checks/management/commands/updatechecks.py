@@ -2,18 +2,40 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+from weblate.checks.parallel import ChecksUpdater
+from weblate.checks.tasks import batch_update_checks
 from weblate.trans.management.commands import WeblateLangCommand
 
 
 class Command(WeblateLangCommand):
     help = "updates checks for units"
 
+    def add_arguments(self, parser) -> None:
+        super().add_arguments(parser)
+        parser.add_argument(
+            "--jobs",
+            type=int,
+            default=1,
+            help="Number of processes used to update checks",
+        )
+
+    def report_progress(self, done: int, total: int) -> None:
+        self.stdout.write(f"Processing {done * 100.0 / total:.1f}%")
+
     def handle(self, *args, **options) -> None:
-        translations = {}
-        for unit in self.iterate_units(*args, **options):
-            unit.run_checks()
-            if unit.translation.id not in translations:
-                translations[unit.translation.id] = unit.translation
+        translations = list(self.get_translations(**options))
+        updater = ChecksUpdater(jobs=options["jobs"], progress=self.report_progress)
+        batched_checks = updater.update(translations)
+
+        components = {
+            translation.component.id: translation.component
+            for translation in translations
+        }
+        for component_id, checks in batched_checks.items():
+            batch_update_checks(
+                component_id, sorted(checks), component=components[component_id]
+            )
 
-        for translation in translations.values():
+        for translation in translations:
             translation.invalidate_cache()
+        self.stdout.write("Operation completed")
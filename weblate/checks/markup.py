@@ -86,6 +86,9 @@ class BaseXMLCheck(TargetCheck):
             return False
         return True
 
+    def can_parse_source_xml(self, text: str) -> bool:
+        return self.get_source_cached("xml-parse", text, self.can_parse_xml)
+
     def parse_xml(self, text: str, wrap: bool) -> _Element:
         """Parse XML."""
         text = strip_entities(text)
@@ -114,7 +117,7 @@ class BaseXMLCheck(TargetCheck):
             return True
 
         # Actually verify XML parsing
-        return not all(self.can_parse_xml(source) for source in sources)
+        return not all(self.can_parse_source_xml(source) for source in sources)
 
     def check_single(self, source, target, unit) -> bool:
         """Check for single phrase, not dealing with plurals."""
@@ -153,14 +156,20 @@ class XMLTagsCheck(BaseXMLCheck):
     name = gettext_lazy("XML markup")
     description = gettext_lazy("XML tags in translation do not match source")
 
-    def check_single(self, source, target, unit):
-        # Check if source is XML
+    def get_source_tags(self, source: str) -> tuple[list, bool] | None:
         try:
             source_tree, wrap = self.detect_xml_wrapping(source)
-            source_tags = [(x.tag, x.keys()) for x in source_tree.iter()]
         except SyntaxError:
+            return None
+        return [(x.tag, x.keys()) for x in source_tree.iter()], wrap
+
+    def check_single(self, source, target, unit):
+        # Check if source is XML
+        parsed = self.get_source_cached("xml-tags", source, self.get_source_tags)
+        if parsed is None:
             # Source is not valid XML, we give up
             return False
+        source_tags, wrap = parsed
 
         # Check target
         try:
@@ -2,15 +2,23 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+from __future__ import annotations
+
 import json
+from collections import defaultdict
+from typing import TYPE_CHECKING
 
 from appconf import AppConf
 from django.db import models
 from django.db.models import Q
 from django.utils.functional import cached_property
 
+from weblate.checks.base import batch_source_cache
 from weblate.utils.classloader import ClassLoader
 
+if TYPE_CHECKING:
+    from weblate.trans.models import Unit
+
 
 class ChecksLoader(ClassLoader):
     @cached_property
@@ -102,6 +110,9 @@ class WeblateChecksConf(AppConf):
         "weblate.checks.fluent.inner_html.FluentTargetInnerHTMLCheck",
     )
 
+    # Number of processes used to update checks
+    CHECK_PROCESSES = 0
+
     class Meta:
         prefix = ""
 
@@ -178,7 +189,7 @@ class Check(models.Model):
         """Set ignore flag."""
         self.dismissed = state
         self.save(update_fields=["dismissed"])
-        self.unit.translation.invalidate_cache()
+        self.unit.translation.invalidate_cache(self.unit)
 
 
 def get_display_checks(unit):
@@ -189,3 +200,67 @@ def get_display_checks(unit):
                 yield check_objects[check]
             except KeyError:
                 yield Check(unit=unit, dismissed=False, name=check)
+
+
+def get_checks_diff(units: list[Unit]) -> tuple[list[tuple[int, str]], list[int]]:
+    """
+    Calculate checks for units of a translation in a batch.
+
+    The checks are evaluated for all units at once so that they can share
+    processing of the source strings. Returns list of unit IDs and check names
+    to create and list of check IDs to delete.
+    """
+    source_items = []
+    target_items = []
+    for unit in units:
+        if unit.translation.component.is_glossary:
+            # We might eventually run some checks on glossary
+            continue
+        if unit.is_source:
+            source_items.append((unit.get_source_plurals(), unit))
+        elif not unit.readonly:
+            target_items.append(
+                (unit.get_source_plurals(), unit.get_target_plurals(), unit)
+            )
+
+    # Evaluate checks column-wise to share source processing
+    failing: dict[int, set[str]] = defaultdict(set)
+    with batch_source_cache():
+        for checks, method, items in (
+            (CHECKS.source, "check_source_batch", source_items),
+            (CHECKS.target, "check_target_batch", target_items),
+        ):
+            if not items:
+                continue
+            for name, check_obj in checks.items():
+                results = getattr(check_obj, method)(items)
+                for item, result in zip(items, results, strict=True):
+                    if result:
+                        failing[item[-1].pk].add(name)
+
+    # Calculate difference against existing checks
+    create = []
+    delete = []
+    for unit in units:
+        existing = {check.name: check for check in unit.all_checks}
+        current = failing[unit.pk]
+        create.extend((unit.pk, name) for name in current - existing.keys())
+        delete.extend(
+            check.pk for name, check in existing.items() if name not in current
+        )
+    return create, delete
+
+
+def apply_checks_diff(create: list[tuple[int, str]], delete: list[int]) -> None:
+    """Store checks changes calculated by :func:`get_checks_diff`."""
+    if delete:
+        Check.objects.filter(pk__in=delete).delete()
+    if create:
+        Check.objects.bulk_create(
+            [
+                Check(unit_id=unit_id, dismissed=False, name=name)
+                for unit_id, name in create
+            ],
+            batch_size=500,
+            ignore_conflicts=True,
+        )
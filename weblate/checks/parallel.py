@@ -0,0 +1,183 @@
+# Copyright © Michal Čihař <michal@weblate.org>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Parallel update of quality checks.
+
+Translations are distributed to forked worker processes which evaluate the
+checks and return the difference against the stored checks. The changes are
+written to the database in batches by the main process.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING, NamedTuple
+
+from django.db import connection, connections
+
+from weblate.checks.base import batch_source_cache
+from weblate.checks.models import apply_checks_diff, get_checks_diff
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from weblate.trans.models import Translation
+
+# Number of check changes to accumulate before writing them
+WRITE_BATCH = 10000
+
+
+class ChecksDiff(NamedTuple):
+    translation_id: int
+    component_id: int
+    create: list[tuple[int, str]]
+    delete: list[int]
+    batched_checks: set[str]
+
+
+def check_translation(translation: Translation, update_state: bool) -> ChecksDiff:
+    """Calculate checks difference for a single translation."""
+    component = translation.component
+    batch_checks = component.batch_checks
+    batched_checks = component.batched_checks
+    component.start_batched_checks()
+    try:
+        units = list(translation.unit_set.prefetch().prefetch_all_checks())
+        if update_state:
+            for unit in units:
+                unit.update_state()
+        create, delete = get_checks_diff(units)
+        return ChecksDiff(
+            translation.pk, component.pk, create, delete, component.batched_checks
+        )
+    finally:
+        component.batch_checks = batch_checks
+        component.batched_checks = batched_checks | component.batched_checks
+
+
+def check_translation_worker(translation_id: int, update_state: bool) -> ChecksDiff:
+    from weblate.trans.models import Translation
+
+    try:
+        translation = Translation.objects.prefetch().get(pk=translation_id)
+    except Translation.DoesNotExist:
+        # Removed meanwhile
+        return ChecksDiff(translation_id, 0, [], [], set())
+    with batch_source_cache():
+        return check_translation(translation, update_state)
+
+
+def init_worker() -> None:
+    # Never reuse database connections inherited from the main process
+    connections.close_all()
+
+
+def iterate_parallel(
+    translation_ids: list[int], update_state: bool, jobs: int
+) -> Iterator[ChecksDiff]:
+    # Workers open own database connections, the inherited ones can not be
+    # shared across processes
+    connections.close_all()
+    context = multiprocessing.get_context("fork")
+    with ProcessPoolExecutor(
+        max_workers=min(jobs, len(translation_ids)),
+        mp_context=context,
+        initializer=init_worker,
+    ) as executor:
+        # All tasks are submitted upfront so that all workers are forked
+        # before the main process uses the database again
+        futures = [
+            executor.submit(check_translation_worker, translation_id, update_state)
+            for translation_id in translation_ids
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+class ChecksUpdater:
+    """
+    Update checks for translations.
+
+    Source translations are processed after the other ones as some source
+    checks depend on the checks of the translations.
+    """
+
+    def __init__(
+        self,
+        jobs: int = 1,
+        update_state: bool = False,
+        progress: Callable[[int, int], None] | None = None,
+    ) -> None:
+        self.jobs = jobs
+        self.update_state = update_state
+        self.progress = progress
+        self.create: list[tuple[int, str]] = []
+        self.delete: list[int] = []
+        self.done = 0
+        self.total = 0
+        # Batched checks to perform per component
+        self.batched_checks: dict[int, set[str]] = {}
+
+    def flush(self) -> None:
+        apply_checks_diff(self.create, self.delete)
+        self.create = []
+        self.delete = []
+
+    def handle(self, diff: ChecksDiff) -> None:
+        self.create.extend(diff.create)
+        self.delete.extend(diff.delete)
+        if diff.batched_checks:
+            self.batched_checks.setdefault(diff.component_id, set()).update(
+                diff.batched_checks
+            )
+        if len(self.create) + len(self.delete) >= WRITE_BATCH:
+            self.flush()
+        self.done += 1
+        if self.progress is not None:
+            self.progress(self.done, self.total)
+
+    def process(self, translations: list[Translation]) -> None:
+        pending = {translation.pk: translation for translation in translations}
+        # Transaction changes would not be visible in the workers
+        if self.jobs > 1 and len(pending) > 1 and not connection.in_atomic_block:
+            try:
+                for diff in iterate_parallel(
+                    list(pending), self.update_state, self.jobs
+                ):
+                    pending.pop(diff.translation_id)
+                    self.handle(diff)
+            except (BrokenProcessPool, OSError, ValueError, AssertionError):
+                # Pool could not be created (for example inside a daemonic
+                # process) or died, the remaining translations are processed
+                # serially
+                pass
+        # Source strings are shared within a component only, so the cache
+        # is kept for a single component to limit its size
+        components: dict[int, list[Translation]] = {}
+        for translation in pending.values():
+            components.setdefault(translation.component_id, []).append(translation)
+        for component_translations in components.values():
+            with batch_source_cache():
+                for translation in component_translations:
+                    self.handle(check_translation(translation, self.update_state))
+
+    def update(self, translations: list[Translation]) -> dict[int, set[str]]:
+        """
+        Update checks for given translations.
+
+        Returns batched checks to perform per component ID.
+        """
+        self.total += len(translations)
+        self.process(
+            [translation for translation in translations if not translation.is_source]
+        )
+        self.flush()
+        self.process(
+            [translation for translation in translations if translation.is_source]
+        )
+        self.flush()
+        return self.batched_checks
@@ -58,10 +58,17 @@ class PlaceholderCheck(TargetCheckParametrized):
             {found_fold[v] for v in found_set - expected_set},
         )
 
+    def get_source_matches(self, value, source: str) -> set[str]:
+        return self.get_source_cached(
+            f"{self.check_id}:{value.flags}:{value.pattern}",
+            source,
+            lambda text: set(self.get_matches(value, text)),
+        )
+
     def check_target_params(self, sources, targets, unit, value):
-        expected = set(self.get_matches(value, sources[0]))
+        expected = self.get_source_matches(value, sources[0])
         if not expected and len(sources) > 1:
-            expected = set(self.get_matches(value, sources[-1]))
+            expected = self.get_source_matches(value, sources[-1])
         plural_examples = SimpleLazyObject(lambda: unit.translation.plural.examples)
 
         if "case-insensitive" in unit.all_flags:
@@ -49,6 +49,10 @@ class MockProject:
     def get_glossary_tsv_cache_key(self, source_language, language) -> str:
         return f"project-glossary-tsv-test-{source_language.code}-{language.code}"
 
+    @property
+    def glossary_automaton_key(self) -> str:
+        return "project-glossary-automaton-test"
+
     @property
     def glossaries(self):
         return []
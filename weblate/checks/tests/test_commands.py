@@ -5,12 +5,18 @@
 """Test for management commands."""
 
 from io import StringIO
+from unittest.mock import patch
 
 from django.core.management import call_command
-from django.test import SimpleTestCase
+from django.test import SimpleTestCase, TransactionTestCase
 
+from weblate.checks import parallel
+from weblate.checks.models import Check
+from weblate.trans.models import Unit
 from weblate.trans.tests.test_commands import WeblateComponentCommandTestCase
 from weblate.trans.tests.test_models import RepoTestCase
+from weblate.trans.tests.utils import RepoTestMixin
+from weblate.utils.state import STATE_TRANSLATED
 
 
 class ListSameCommandTest(RepoTestCase):
@@ -28,6 +34,42 @@ class UpdateChecksTest(WeblateComponentCommandTestCase):
     command_name = "updatechecks"
     expected_string = "Processing"
 
+    def test_jobs(self) -> None:
+        self.edit_unit("Hello, world!\n", "Nazdar svete!")
+        Check.objects.all().delete()
+        self.do_test("test", "--jobs", "2")
+        self.assertEqual(self.get_unit().all_checks_names, {"end_newline"})
+
+
+class UpdateChecksParallelTest(TransactionTestCase, RepoTestMixin):
+    """Checks update using worker processes, these need committed data."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.clone_test_repos()
+        self.component = self.create_component()
+
+    def test_jobs(self) -> None:
+        Unit.objects.filter(
+            translation__language__code="cs", source="Hello, world!\n"
+        ).update(target="Nazdar svete!", state=STATE_TRANSLATED)
+        Check.objects.all().delete()
+        with patch.object(
+            parallel, "check_translation", wraps=parallel.check_translation
+        ) as mocked:
+            call_command("updatechecks", "test/test", "--jobs", "2", stdout=StringIO())
+        # Only the source translation is checked in the main process
+        self.assertEqual(mocked.call_count, 1)
+        self.assertEqual(
+            set(
+                Check.objects.filter(
+                    unit__translation__language__code="cs",
+                    unit__source="Hello, world!\n",
+                ).values_list("name", flat=True)
+            ),
+            {"end_newline"},
+        )
+
 
 class ListTestCase(SimpleTestCase):
     def test_list_checks(self) -> None:
@@ -14,6 +14,7 @@ from weblate.checks.consistency import (
     TranslatedCheck,
 )
 from weblate.checks.models import Check
+from weblate.checks.tasks import batch_update_checks
 from weblate.checks.tests.test_checks import MockUnit
 from weblate.trans.models import Change
 from weblate.trans.tests.test_views import ViewTestCase
@@ -202,3 +203,18 @@ class ConsistencyCheckTest(ViewTestCase):
         self.assertTrue(check.check_target_unit([], [], unit))
 
         self.assertNotEqual(check.check_component(self.component), [])
+
+    def test_consistency_many(self) -> None:
+        # More strings than used to be handled in a single batch
+        for i in range(120):
+            self.add_unit(self.translation_1, str(i), f"Source {i}", "Jeden")
+            self.add_unit(
+                self.translation_2, str(i), f"Source {i}", "Jedna", increment=False
+            )
+        batch_update_checks(self.component.id, ["inconsistent"])
+        self.assertEqual(Check.objects.filter(name="inconsistent").count(), 240)
+
+        # Make half of them consistent
+        self.translation_2.unit_set.filter(id_hash__gt=1060).update(target="Jeden")
+        batch_update_checks(self.component.id, ["inconsistent"])
+        self.assertEqual(Check.objects.filter(name="inconsistent").count(), 120)
@@ -55,6 +55,25 @@ class PythonFormatCheckTest(CheckTestCase):
     def test_format(self) -> None:
         self.assertFalse(self.check.check_format("%s string", "%s string", False, None))
 
+    def test_batch(self) -> None:
+        items = [
+            (
+                [source],
+                [target],
+                MockUnit(flags="python-format", source=source, target=target),
+            )
+            for source, target in (
+                ("%s string", "%s string"),
+                ("%s string", "string"),
+                ("%(name)s string", "%(other)s string"),
+                ("%s string", "%d string"),
+            )
+        ]
+        self.assertEqual(
+            [bool(result) for result in self.check.check_target_batch(items)],
+            [False, True, True, True],
+        )
+
     def test_space_format(self) -> None:
         self.assertTrue(
             self.check.check_format("%d % string", "%d % other", False, None)
@@ -7,7 +7,7 @@
 from django.urls import reverse
 from django.utils.html import format_html
 
-from weblate.checks.models import Check
+from weblate.checks.models import Check, apply_checks_diff, get_checks_diff
 from weblate.checks.tasks import batch_update_checks
 from weblate.trans.models import Unit
 from weblate.trans.tasks import auto_translate
@@ -129,3 +129,32 @@ class BatchUpdateTest(ViewTestCase):
             batch_update_checks(other.id, ["inconsistent"])
             unit = self.get_unit()
             self.assertEqual(unit.all_checks_names, expected)
+
+
+class UpdateChecksBatchTest(ViewTestCase):
+    def test_update(self) -> None:
+        self.edit_unit("Hello, world!\n", "Nazdar svete!")
+        self.edit_unit("Thank you for using Weblate.", "Děkujeme, že používáte Weblate")
+        translation = self.get_translation()
+        expected = {
+            unit.pk: unit.all_checks_names for unit in translation.unit_set.all()
+        }
+        self.assertIn("end_newline", expected[self.get_unit().pk])
+
+        # Drop some and add bogus checks
+        Check.objects.filter(name="end_newline").delete()
+        Check.objects.create(unit=self.get_unit(), name="same")
+
+        units = list(translation.unit_set.prefetch().prefetch_all_checks())
+        create, delete = get_checks_diff(units)
+        self.assertEqual(create, [(self.get_unit().pk, "end_newline")])
+        self.assertEqual(len(delete), 1)
+        apply_checks_diff(create, delete)
+        self.assertEqual(
+            {unit.pk: unit.all_checks_names for unit in translation.unit_set.all()},
+            expected,
+        )
+
+        # Nothing should be changed now
+        units = list(translation.unit_set.prefetch().prefetch_all_checks())
+        self.assertEqual(get_checks_diff(units), ([], []))
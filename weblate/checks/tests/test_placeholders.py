@@ -4,6 +4,7 @@
 
 """Tests for placeholder quality checks."""
 
+from weblate.checks.base import batch_source_cache
 from weblate.checks.flags import Flags
 from weblate.checks.models import Check
 from weblate.checks.placeholders import PlaceholderCheck, RegexCheck
@@ -157,6 +158,25 @@ class PlaceholdersTest(CheckTestCase):
             )
         )
 
+    def test_batch(self) -> None:
+        source = "Hello %WORLD% $URL$"
+        with batch_source_cache():
+            # Same source with different placeholders
+            self.assertFalse(
+                self.check.check_target(
+                    [source],
+                    ["Ahoj %WORLD%"],
+                    MockUnit(None, "placeholders:%WORLD%", self.default_lang, source),
+                )
+            )
+            self.assertTrue(
+                self.check.check_target(
+                    [source],
+                    ["Ahoj %WORLD%"],
+                    MockUnit(None, "placeholders:$URL$", self.default_lang, source),
+                )
+            )
+
 
 class PluralPlaceholdersTest(FixtureTestCase):
     def test_plural(self) -> None:
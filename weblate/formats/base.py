@@ -304,6 +304,8 @@ class TranslationFormat:
     can_edit_base: bool = True
     strict_format_plurals: bool = False
     plural_preference: tuple[int, ...] | None = None
+    # Whether the file can be parsed in a separate process
+    parallel_parse: bool = True
     store: InnerStore
 
     @classmethod
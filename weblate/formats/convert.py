@@ -121,6 +121,8 @@ class ConvertFormat(TranslationFormat):
     unit_class: type[TranslationUnit] = ConvertPoUnit
     autoaddon = {"weblate.flags.same_edit": {}}
     create_style = "copy"
+    # Parsing depends on existing units from the database
+    parallel_parse = False
     units: list[TranslateToolkitUnit]
     store: TranslationStore
 
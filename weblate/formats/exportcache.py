@@ -0,0 +1,198 @@
+# Copyright © Michal Čihař <michal@weblate.org>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+On-disk cache of converted translation exports.
+
+The exports are keyed by the translation, exporter, search query and the
+state of the translation, so any change to the translation makes the cached
+export unused. The state includes version which is changed whenever the
+translation stats are invalidated, what covers changes in comments,
+suggestions or checks not reflected in the revision or last change. The
+cache is limited in size and the least recently used exports are removed
+first. The directory is scanned only when the estimated size exceeds the
+limit and periodically.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from contextlib import suppress
+from hashlib import sha256
+from tempfile import NamedTemporaryFile, TemporaryFile
+from typing import TYPE_CHECKING, BinaryIO
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import cache
+
+from weblate.utils.data import data_dir
+
+if TYPE_CHECKING:
+    from weblate.formats.exporters import BaseExporter
+    from weblate.trans.models import Component, Translation
+
+EXPORT_CACHE_SIZE_KEY = "export-cache-size"
+
+# Temporary files older than this were left by interrupted exports
+STALE_EXPORT_AGE = 3600
+
+
+def get_export_cache_dir() -> str:
+    return data_dir("cache", "exports")
+
+
+def get_export_version_key(obj: Translation | Component) -> str:
+    return f"export-version-{obj.cache_key}"
+
+
+def get_export_version(obj: Translation | Component) -> str:
+    key = get_export_version_key(obj)
+    version = cache.get(key)
+    if version is None:
+        version = uuid4().hex
+        if not cache.add(key, version, None):
+            # Other process has stored the version meanwhile
+            version = cache.get(key, version)
+    return version
+
+
+def invalidate_export_cache(obj: Translation | Component) -> None:
+    """Make cached exports of the translation or component unused."""
+    cache.delete(get_export_version_key(obj))
+
+
+def get_export_cache_key(
+    translation: Translation,
+    exporter_cls: type[BaseExporter],
+    query_string: str | None,
+) -> str:
+    # Explanations and comments on source strings are included in the export
+    component = translation.component
+    source_translation = component.source_translation
+    state = [
+        translation.pk,
+        exporter_cls.name,
+        query_string or "",
+        translation.revision,
+        translation.stats.last_changed,
+        source_translation.stats.last_changed,
+        get_export_version(translation),
+        get_export_version(source_translation),
+        get_export_version(component),
+    ]
+    return sha256(json.dumps(state, default=str).encode()).hexdigest()
+
+
+def cleanup_export_cache(limit: int) -> None:
+    """Remove least recently used exports to fit the size limit."""
+    entries = []
+    total = 0
+    stale = time.time() - STALE_EXPORT_AGE
+    try:
+        iterator = os.scandir(get_export_cache_dir())
+    except FileNotFoundError:
+        return
+    with iterator:
+        for entry in iterator:
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            if entry.name.startswith("."):
+                # Skip exports being written, but remove interrupted ones
+                if stat.st_mtime < stale:
+                    with suppress(FileNotFoundError):
+                        os.unlink(entry.path)
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total += stat.st_size
+    entries.sort()
+    for _mtime, size, path in entries:
+        if total <= limit:
+            break
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            continue
+        total -= size
+    cache.set(EXPORT_CACHE_SIZE_KEY, total, None)
+
+
+def account_export_cache(size: int, limit: int) -> None:
+    """Update estimated size of the cache and clean it up when over the limit."""
+    try:
+        total = cache.incr(EXPORT_CACHE_SIZE_KEY, size)
+    except ValueError:
+        # The size is not known, it is stored by the cleanup
+        total = limit + 1
+    if total > limit:
+        cleanup_export_cache(limit)
+
+
+def export_translation(
+    translation: Translation,
+    exporter_cls: type[BaseExporter],
+    query_string: str | None = None,
+) -> BinaryIO:
+    """
+    Return file with serialized export of the translation.
+
+    The cached export is used when possible. The export is always written to
+    a file, so that it is never kept in memory, and the caller is responsible
+    for closing the returned file.
+    """
+    limit = settings.WEBLATE_EXPORT_CACHE_SIZE
+    if limit:
+        filename = os.path.join(
+            get_export_cache_dir(),
+            get_export_cache_key(translation, exporter_cls, query_string),
+        )
+        try:
+            handle = open(filename, "rb")  # noqa: SIM115
+        except FileNotFoundError:
+            pass
+        else:
+            # Mark as recently used
+            with suppress(FileNotFoundError):
+                os.utime(filename)
+            return handle
+
+    exporter = exporter_cls(translation=translation)
+    units = translation.unit_set.prefetch_full().order_by("position")
+    if query_string:
+        units = units.search(query_string)
+
+    if not limit:
+        handle = TemporaryFile()
+        try:
+            exporter.write_units(units, handle)
+        except BaseException:
+            handle.close()
+            raise
+        handle.seek(0)
+        return handle
+
+    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    handle = NamedTemporaryFile(
+        dir=os.path.dirname(filename), prefix=".export-", delete=False
+    )
+    try:
+        exporter.write_units(units, handle)
+        handle.flush()
+    except BaseException:
+        handle.close()
+        os.unlink(handle.name)
+        raise
+    # The open file stays readable after it is moved or removed
+    size = os.stat(handle.name).st_size
+    if size <= limit:
+        os.replace(handle.name, filename)
+        account_export_cache(size, limit)
+    else:
+        os.unlink(handle.name)
+    handle.seek(0)
+    return handle
@@ -7,10 +7,11 @@
 from __future__ import annotations
 
 import re
-from itertools import chain
-from typing import TYPE_CHECKING
+from itertools import chain, islice
+from typing import TYPE_CHECKING, BinaryIO
 
-from django.http import HttpResponse
+from django.db.models import QuerySet
+from django.http import FileResponse, HttpResponse
 from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy
 from lxml.etree import XMLSyntaxError
@@ -49,6 +50,9 @@ XML_REPLACE_CHARMAP = dict.fromkeys(
 
 DASHES = re.compile("--+")
 
+# Number of units fetched from the database at once
+EXPORT_CHUNK_SIZE = 1000
+
 
 class BaseExporter:
     content_type = "text/plain"
@@ -56,6 +60,8 @@ class BaseExporter:
     name = ""
     verbose: StrOrPromise = ""
     set_id = False
+    # Whether the units can be serialized in chunks
+    incremental = False
     storage_class: TranslationStore
 
     def __init__(
@@ -114,10 +120,40 @@ class BaseExporter:
     def create_unit(self, source):
         return self.storage.UnitClass(source)
 
+    @staticmethod
+    def iterate_units(units):
+        """Iterate over units, fetching them from the database in chunks."""
+        if isinstance(units, QuerySet):
+            # Prefetches are performed for each chunk
+            return units.iterator(chunk_size=EXPORT_CHUNK_SIZE)
+        return units
+
     def add_units(self, units) -> None:
-        for unit in units:
+        for unit in self.iterate_units(units):
             self.add_unit(unit)
 
+    def write_units(self, units, handle: BinaryIO) -> None:
+        """
+        Write serialized units to a file.
+
+        The incremental formats serialize the units in chunks, so that the
+        complete storage is never kept in memory.
+        """
+        if not self.incremental:
+            self.add_units(units)
+            handle.write(self.serialize())
+            return
+        # Units present in an empty storage, such as the header
+        keep = len(self.storage.units)
+        header = self.serialize()
+        handle.write(header)
+        iterator = iter(self.iterate_units(units))
+        while chunk := list(islice(iterator, EXPORT_CHUNK_SIZE)):
+            for unit in chunk:
+                self.add_unit(unit)
+            handle.write(self.serialize()[len(header) :])
+            del self.storage.units[keep:]
+
     def build_unit(self, unit):
         output = self.create_unit(self.handle_plurals(unit.get_source_plurals()))
         # Propagate source language
@@ -200,15 +236,23 @@ class BaseExporter:
             ),
         )
 
-    def get_response(self, filetemplate: str = "{path}.{extension}"):
+    def get_response(
+        self,
+        filetemplate: str = "{path}.{extension}",
+        content: bytes | BinaryIO | None = None,
+    ):
         filename = self.get_filename(filetemplate)
+        content_type = f"{self.content_type}; charset=utf-8"
 
-        response = HttpResponse(content_type=f"{self.content_type}; charset=utf-8")
+        if content is None or isinstance(content, bytes):
+            response = HttpResponse(content_type=content_type)
+            # Save to response
+            response.write(self.serialize() if content is None else content)
+        else:
+            # Stream the file, it is closed once the response is sent
+            response = FileResponse(content, content_type=content_type)
         response["Content-Disposition"] = f"attachment; filename={filename}"
 
-        # Save to response
-        response.write(self.serialize())
-
         return response
 
     def serialize(self):
@@ -225,6 +269,7 @@ class PoExporter(BaseExporter):
     extension = "po"
     verbose = gettext_lazy("gettext PO")
     storage_class = pofile
+    incremental = True
 
     def store_flags(self, output, flags) -> None:
         for flag in flags.items():
@@ -326,6 +371,7 @@ class MoExporter(PoExporter):
     extension = "mo"
     verbose = gettext_lazy("gettext MO")
     storage_class = mofile
+    incremental = False
 
     def __init__(
         self,
@@ -401,6 +447,7 @@ class CSVExporter(CVSBaseExporter):
     content_type = "text/csv"
     extension = "csv"
     verbose = gettext_lazy("CSV")
+    incremental = True
 
     def string_filter(self, text):
         """
@@ -136,5 +136,8 @@ class FormatsConf(AppConf):
         "weblate.formats.multi.MultiCSVUtf8Format",
     )
 
+    # Size limit of the converted exports cache in bytes
+    EXPORT_CACHE_SIZE = 100 * 1024 * 1024
+
     class Meta:
         prefix = "WEBLATE"
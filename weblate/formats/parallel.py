@@ -0,0 +1,182 @@
+# Copyright © Michal Čihař <michal@weblate.org>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Parallel parsing of translation files.
+
+The files are parsed in forked worker processes and only picklable snapshots
+of the parsed units are passed back to the main process, which then applies
+them to the database the same way as a regular translate-toolkit store.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING, Any
+
+from django.db import connections
+
+if TYPE_CHECKING:
+    from weblate.formats.base import TranslationFormat, TranslationUnit
+    from weblate.lang.models import Language
+
+# Attributes of the translation unit used when syncing the database
+UNIT_ATTRIBUTES = (
+    "locations",
+    "flags",
+    "notes",
+    "source",
+    "target",
+    "explanation",
+    "source_explanation",
+    "context",
+    "previous_source",
+    "id_hash",
+)
+
+
+class ParsedUnit:
+    """
+    Picklable snapshot of a translation unit.
+
+    Errors raised while reading an attribute are stored and raised again
+    when the attribute is accessed so that they are handled the same way as
+    with the translate-toolkit unit.
+    """
+
+    def __init__(self, unit: TranslationUnit) -> None:
+        self.values: dict[str, Any] = {}
+        for name in UNIT_ATTRIBUTES:
+            try:
+                self.values[name] = getattr(unit, name)
+            except Exception as error:
+                self.values[name] = error
+        self.template = None if unit.template is None else True
+        self.readonly = unit.is_readonly()
+        self.translated = unit.is_translated()
+        self.fuzzy = (unit.is_fuzzy(False), unit.is_fuzzy(True))
+        self.approved = (unit.is_approved(False), unit.is_approved(True))
+
+    def __getattr__(self, name: str):
+        try:
+            value = self.__dict__.get("values", {})[name]
+        except KeyError:
+            raise AttributeError(name) from None
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+    def is_readonly(self) -> bool:
+        return self.readonly
+
+    def is_translated(self) -> bool:
+        return self.translated
+
+    def is_fuzzy(self, fallback=False) -> bool:
+        return self.fuzzy[bool(fallback)]
+
+    def is_approved(self, fallback=False) -> bool:
+        return self.approved[bool(fallback)]
+
+
+class ParsedStore:
+    """Picklable snapshot of a parsed translation file."""
+
+    def __init__(self, store: TranslationFormat) -> None:
+        self.file_format_cls = type(store)
+        self.filenames = store.get_filenames()
+        self.content_units = [ParsedUnit(unit) for unit in store.content_units]
+        self.header = (
+            store.store.parseheader() if hasattr(store.store, "parseheader") else {}
+        )
+
+    @property
+    def store(self):
+        # Mimics translate-toolkit store for the header parsing
+        return self
+
+    def parseheader(self) -> dict[str, str]:
+        return self.header
+
+    def get_filenames(self) -> list[str]:
+        return self.filenames
+
+    def get_plural(self, language: Language, store=None):
+        return self.file_format_cls.get_plural(language, self)
+
+
+# Per-process state, inherited from the parent on fork
+WORKER_STATE: dict[str, Any] = {}
+
+
+def init_worker(
+    file_format_cls: type[TranslationFormat],
+    template_store: TranslationFormat | None,
+    source_language: str,
+) -> None:
+    # Never reuse database connections inherited from the main process
+    connections.close_all()
+    WORKER_STATE["file_format_cls"] = file_format_cls
+    WORKER_STATE["template_store"] = template_store
+    WORKER_STATE["source_language"] = source_language
+
+
+def parse_store(filename: str, language_code: str, is_template: bool) -> ParsedStore:
+    store = WORKER_STATE["file_format_cls"](
+        filename,
+        WORKER_STATE["template_store"],
+        language_code=language_code,
+        source_language=WORKER_STATE["source_language"],
+        is_template=is_template,
+    )
+    return ParsedStore(store)
+
+
+def parse_stores(
+    file_format_cls: type[TranslationFormat],
+    template_store: TranslationFormat | None,
+    source_language: str,
+    files: dict[str, tuple[str, str, bool]],
+    workers: int,
+) -> dict[str, ParsedStore]:
+    """
+    Parse translation files in a process pool.
+
+    The files are passed as a dictionary mapping key to the filename, language
+    code and template flag. Files which fail to parse are omitted from the
+    result, these are parsed again in the main process where the error is
+    reported using Component.handle_parse_error.
+    """
+    result: dict[str, ParsedStore] = {}
+    # Workers open own database connections, the inherited ones can not be
+    # shared across processes
+    connections.close_all()
+    try:
+        # Fork is used to share loaded template with the workers without
+        # serializing it
+        context = multiprocessing.get_context("fork")
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(files)),
+            mp_context=context,
+            initializer=init_worker,
+            initargs=(file_format_cls, template_store, source_language),
+        ) as executor:
+            futures = {
+                executor.submit(parse_store, *params): key
+                for key, params in files.items()
+            }
+            for future in as_completed(futures):
+                error = future.exception()
+                if isinstance(error, BrokenProcessPool):
+                    raise error
+                # Parse errors are left to the serial parsing
+                if error is None:
+                    result[futures[future]] = future.result()
+    except (BrokenProcessPool, OSError, ValueError, AssertionError):
+        # Pool could not be created (for example inside a daemonic process) or
+        # died, the remaining files will be parsed serially
+        pass
+    return result
@@ -2,6 +2,9 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+from io import BytesIO
+from unittest.mock import patch
+
 from weblate.formats.base import EmptyFormat
 from weblate.formats.exporters import (
     AndroidResourceExporter,
@@ -143,6 +146,47 @@ class PoExporterTest(BaseTestCase):
         elif self._has_context is not None:
             self.assertNotIn(self._encode("context"), result)
 
+    def test_write_units(self) -> None:
+        lang = Language.objects.create(code="zz")
+        plural = Plural.objects.create(language=lang)
+        component = Component(
+            slug="comp",
+            project=Project(slug="test"),
+            file_format="xliff",
+            source_language=Language.objects.get(code="en"),
+        )
+        translation = Translation(language=lang, component=component, plural=plural)
+        translation.store = EmptyFormat(NamedBytesIO("", b""))
+        units = []
+        for i in range(1, 6):
+            unit = Unit(
+                translation=translation,
+                id_hash=-i,
+                pk=-i,
+                source=f"source {i}",
+                target=f"target {i}",
+                context=f"context{i}",
+                state=STATE_TRANSLATED,
+            )
+            unit.__dict__["unresolved_comments"] = []
+            unit.__dict__["suggestions"] = []
+            unit.source_unit = unit
+            units.append(unit)
+
+        exporter = self.get_exporter(lang, translation=translation)
+        exporter.add_units(units)
+        expected = exporter.serialize()
+
+        output = BytesIO()
+        exporter = self.get_exporter(lang, translation=translation)
+        with patch("weblate.formats.exporters.EXPORT_CHUNK_SIZE", 2):
+            exporter.write_units(units, output)
+        if self._class.incremental:
+            # Chunked output matches the complete storage
+            self.assertEqual(output.getvalue(), expected)
+        else:
+            self.assertTrue(output.getvalue())
+
     def test_extra_info(self) -> None:
         result = self.check_unit(
             source="foo",
@@ -6,9 +6,11 @@ from __future__ import annotations
 
 import re
 import sys
+import threading
 import unicodedata
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from itertools import chain
+from uuid import uuid4
 
 import ahocorasick_rs
 import sentry_sdk
@@ -32,6 +34,13 @@ CONTROLCHARS = [
 ]
 CONTROLCHARS_TRANS = str.maketrans(dict.fromkeys(CONTROLCHARS))
 
+# Number of glossary automatons kept in each process
+GLOSSARY_AUTOMATON_CACHE_SIZE = 20
+GLOSSARY_AUTOMATON_CACHE: OrderedDict[tuple[str, str], ahocorasick_rs.AhoCorasick] = (
+    OrderedDict()
+)
+GLOSSARY_AUTOMATON_LOCK = threading.Lock()
+
 
 def get_glossary_sources(component):
     # Fetch list of terms defined in a translation
@@ -42,7 +51,48 @@ def get_glossary_sources(component):
     )
 
 
+def get_glossary_revision(project) -> str:
+    """
+    Return current revision of the project glossary terms.
+
+    The revision is shared through the cache and changed by removing it on
+    the glossary cache invalidation.
+    """
+    key = project.glossary_automaton_key
+    revision = cache.get(key)
+    if revision is None:
+        revision = uuid4().hex
+        if not cache.add(key, revision, None):
+            # Other process has stored the revision meanwhile
+            revision = cache.get(key, revision)
+    return revision
+
+
 def get_glossary_automaton(project):
+    """
+    Return glossary automaton for the project.
+
+    The automaton can not be serialized, so the built automatons are kept in
+    the process for the current glossary revision to avoid building them for
+    every project instance.
+    """
+    key = (project.glossary_automaton_key, get_glossary_revision(project))
+    with GLOSSARY_AUTOMATON_LOCK:
+        automaton = GLOSSARY_AUTOMATON_CACHE.get(key)
+        if automaton is not None:
+            GLOSSARY_AUTOMATON_CACHE.move_to_end(key)
+            return automaton
+
+    automaton = build_glossary_automaton(project)
+
+    with GLOSSARY_AUTOMATON_LOCK:
+        GLOSSARY_AUTOMATON_CACHE[key] = automaton
+        while len(GLOSSARY_AUTOMATON_CACHE) > GLOSSARY_AUTOMATON_CACHE_SIZE:
+            GLOSSARY_AUTOMATON_CACHE.popitem(last=False)
+    return automaton
+
+
+def build_glossary_automaton(project):
     from weblate.trans.models.component import prefetch_glossary_terms
 
     with sentry_sdk.start_span(op="glossary.automaton", description=project.slug):
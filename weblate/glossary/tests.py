@@ -12,7 +12,7 @@ from django.urls import reverse
 
 from weblate.glossary.models import get_glossary_terms, get_glossary_tsv
 from weblate.glossary.tasks import sync_terminology
-from weblate.trans.models import Unit
+from weblate.trans.models import Change, Project, Unit
 from weblate.trans.tests.test_views import ViewTestCase
 from weblate.trans.tests.utils import get_test_file
 from weblate.utils.db import TransactionsTestMixin
@@ -201,6 +201,27 @@ class GlossaryTest(TransactionsTestMixin, ViewTestCase):
         # Check number of imported objects
         self.assertEqual(self.glossary.unit_set.count(), 164)
 
+    def test_automaton_cache(self) -> None:
+        def get_matches(automaton):
+            return [
+                (start, end)
+                for _term, start, end in automaton.find_matches_as_indexes(
+                    "hello world"
+                )
+            ]
+
+        self.add_term("hello", "ahoj")
+        automaton = Project.objects.get(pk=self.project.pk).glossary_automaton
+        self.assertEqual(get_matches(automaton), [(0, 5)])
+        # Shared between project instances
+        self.assertIs(
+            Project.objects.get(pk=self.project.pk).glossary_automaton, automaton
+        )
+        # Rebuilt on glossary change
+        self.add_term("world", "svět")
+        automaton = Project.objects.get(pk=self.project.pk).glossary_automaton
+        self.assertEqual(get_matches(automaton), [(0, 5), (6, 11)])
+
     def test_get_terms(self) -> None:
         self.add_term("hello", "ahoj")
         self.add_term("thank", "děkujeme")
@@ -398,6 +419,42 @@ class GlossaryTest(TransactionsTestMixin, ViewTestCase):
         self.assertEqual(Unit.objects.count(), start + 4)
         self.assertEqual(unit.unit_set.count(), 4)
 
+    def test_terminology_sync_bulk(self) -> None:
+        start = Unit.objects.count()
+        self.do_add_unit()
+        self.do_add_unit(context="other", language="de")
+        component = self.glossary_component
+        # Flag the strings without triggering the sync
+        sources = component.source_translation.unit_set.all()
+        sources.update(extra_flags="terminology")
+        self.assertEqual(Unit.objects.count(), start + 4)
+
+        component.unload_sources()
+        sync_terminology(component.id, component)
+        count = component.translation_set.count()
+        self.assertEqual(Unit.objects.count(), start + 2 * count)
+        for source in sources:
+            self.assertEqual(source.unit_set.count(), count)
+            self.assertEqual(
+                source.unit_set.filter(
+                    pending=True, change__action=Change.ACTION_NEW_UNIT
+                ).count(),
+                count - 2,
+            )
+
+    def test_terminology_sync_conflict(self) -> None:
+        self.do_add_unit()
+        self.do_add_unit(context="other")
+        component = self.glossary_component
+        sources = list(component.source_translation.unit_set.order_by("pk"))
+        translation = component.translation_set.get(language__code="de")
+        # Simulate concurrent sync adding the first string meanwhile
+        translation.create_terminology_units(sources[:1])
+        created = translation.create_terminology_units(sources)
+        self.assertEqual([unit.id_hash for unit in created], [sources[1].id_hash])
+        self.assertEqual(translation.unit_set.count(), 2)
+        self.assertIsNone(translation.sync_batch)
+
     def test_terminology_explanation_sync(self) -> None:
         unit = self.get_unit("Thank you for using Weblate.")
         # Add terms
@@ -0,0 +1,439 @@
+# Copyright © Michal Čihař <michal@weblate.org>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Local n-gram index of the translation memory.
+
+The index is built for each source and target language pair and stored as
+NumPy arrays in the cache directory, so that it can be memory-mapped by all
+processes. It maps character trigrams of the source strings to the memory
+entries and is used to find candidate entries without a full-text search in
+the database. Entries added or deleted later are appended to small log files
+until the index is rebuilt.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import time
+import zlib
+from typing import TYPE_CHECKING
+
+from weblate.utils.data import data_dir
+from weblate.utils.lock import WeblateLock
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from weblate.auth.models import User
+    from weblate.trans.models import Project
+
+# Flags stored for each entry
+FLAG_SHARED = 1
+FLAG_FROM_FILE = 2
+
+# Number of added or deleted entries which triggers index rebuild
+DELTA_LIMIT = 10000
+
+# Arrays forming the index
+INDEX_ARRAYS = (
+    "ids",
+    "counts",
+    "keys",
+    "offsets",
+    "postings",
+    "project",
+    "user",
+    "flags",
+)
+
+# Index entry: ID, source, project ID, user ID, shared, from file
+IndexEntry = tuple[int, str, int | None, int | None, bool, bool]
+
+
+def get_ngrams(text: str) -> set[int]:
+    """Return hashes of character trigrams of the string."""
+    text = f"  {text.lower()} "
+    return {zlib.crc32(text[i : i + 3].encode()) for i in range(len(text) - 2)}
+
+
+def get_flags(shared: bool, from_file: bool) -> int:
+    return (FLAG_SHARED if shared else 0) | (FLAG_FROM_FILE if from_file else 0)
+
+
+class AppendLog:
+    """File with JSON encoded items appended one per line."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.inode: int | None = None
+        self.offset = 0
+
+    def reset(self) -> None:
+        self.inode = None
+        self.offset = 0
+
+    def read(self) -> tuple[bool, list]:
+        """
+        Read items appended since the last read.
+
+        Returns whether the file was replaced since the last read, in that
+        case all items are returned.
+        """
+        try:
+            handle = open(self.path, "rb")  # noqa: SIM115
+        except FileNotFoundError:
+            replaced = self.inode is not None
+            self.reset()
+            return replaced, []
+        with handle:
+            stat = os.fstat(handle.fileno())
+            replaced = self.inode is not None and (
+                stat.st_ino != self.inode or stat.st_size < self.offset
+            )
+            if replaced or self.inode is None:
+                self.inode = stat.st_ino
+                self.offset = 0
+            handle.seek(self.offset)
+            data = handle.read()
+        # Skip possibly incomplete last line being written
+        end = data.rfind(b"\n") + 1
+        self.offset += end
+        return replaced, [json.loads(line) for line in data[:end].splitlines()]
+
+    def read_all(self) -> list:
+        try:
+            with open(self.path, "rb") as handle:
+                return [json.loads(line) for line in handle]
+        except FileNotFoundError:
+            return []
+
+    def append(self, items: Iterable) -> None:
+        with open(self.path, "a") as handle:
+            handle.writelines(f"{json.dumps(item)}\n" for item in items)
+
+    def write(self, items: Iterable) -> None:
+        filename = f"{self.path}.{os.getpid()}"
+        with open(filename, "w") as handle:
+            handle.writelines(f"{json.dumps(item)}\n" for item in items)
+        os.replace(filename, self.path)
+
+
+class MemoryIndex:
+    """Translation memory index for a language pair."""
+
+    def __init__(self, source_language_id: int, target_language_id: int) -> None:
+        self.path = data_dir(
+            "cache", "memory-index", f"{source_language_id}-{target_language_id}"
+        )
+        self.source_language_id = source_language_id
+        self.target_language_id = target_language_id
+        self.version: str | None = None
+        self.arrays: dict = {}
+        self.delta_log = AppendLog(os.path.join(self.path, "delta.jsonl"))
+        self.deleted_log = AppendLog(os.path.join(self.path, "deleted.jsonl"))
+        self.reset_delta()
+        self.deleted = np.empty(0, dtype=np.int64)
+
+    @property
+    def current_path(self) -> str:
+        return os.path.join(self.path, "current")
+
+    @property
+    def lock(self) -> WeblateLock:
+        return WeblateLock(
+            data_dir("home"),
+            "memory-index",
+            self.source_language_id * 100000 + self.target_language_id,
+            f"memory-index-{self.source_language_id}-{self.target_language_id}",
+            timeout=120,
+        )
+
+    def read_version(self) -> str | None:
+        try:
+            with open(self.current_path) as handle:
+                return handle.read().strip()
+        except FileNotFoundError:
+            return None
+
+    def load(self) -> bool:
+        """Load or reload the index, returns whether the index is available."""
+        version = self.read_version()
+        if version is None:
+            return False
+        if version != self.version:
+            base = os.path.join(self.path, version)
+            try:
+                self.arrays = {
+                    name: np.load(os.path.join(base, f"{name}.npy"), mmap_mode="r")
+                    for name in INDEX_ARRAYS
+                }
+            except FileNotFoundError:
+                # Removed by concurrent rebuild
+                return False
+            self.version = version
+            # The logs are rewritten on rebuild
+            self.delta_log.reset()
+            self.deleted_log.reset()
+            self.reset_delta()
+            self.deleted = np.empty(0, dtype=np.int64)
+        self.load_delta()
+        self.load_deleted()
+        return True
+
+    def reset_delta(self) -> None:
+        # ID, project ID, user ID and flags of the added entries
+        self.delta = np.empty((0, 4), dtype=np.int64)
+        # Number of trigrams of the added entries
+        self.delta_counts = np.empty(0, dtype=np.int64)
+        # Trigram to positions of the added entries
+        self.delta_postings: dict[int, list[int]] = {}
+
+    def load_delta(self) -> None:
+        """Load entries added since the last load."""
+        replaced, entries = self.delta_log.read()
+        if replaced:
+            self.reset_delta()
+        if not entries:
+            return
+        rows = []
+        counts = []
+        for position, (pk, source, project_id, user_id, shared, from_file) in enumerate(
+            entries, len(self.delta)
+        ):
+            grams = get_ngrams(source)
+            rows.append(
+                (
+                    pk,
+                    -1 if project_id is None else project_id,
+                    -1 if user_id is None else user_id,
+                    get_flags(shared, from_file),
+                )
+            )
+            counts.append(len(grams))
+            for gram in grams:
+                self.delta_postings.setdefault(gram, []).append(position)
+        self.delta = np.concatenate([self.delta, np.array(rows, dtype=np.int64)])
+        self.delta_counts = np.concatenate(
+            [self.delta_counts, np.array(counts, dtype=np.int64)]
+        )
+
+    def load_deleted(self) -> None:
+        """Load IDs of entries deleted since the last load."""
+        replaced, deleted = self.deleted_log.read()
+        if replaced:
+            self.deleted = np.empty(0, dtype=np.int64)
+        if deleted:
+            self.deleted = np.union1d(self.deleted, np.array(deleted, dtype=np.int64))
+
+    def build(self, entries: Iterable[IndexEntry]) -> None:
+        """Build the index from all memory entries for the language pair."""
+        ids = []
+        project = []
+        user = []
+        flags = []
+        counts = []
+        gram_hashes: list[int] = []
+        gram_entries: list[int] = []
+        for position, (pk, source, project_id, user_id, shared, from_file) in enumerate(
+            entries
+        ):
+            grams = get_ngrams(source)
+            ids.append(pk)
+            project.append(-1 if project_id is None else project_id)
+            user.append(-1 if user_id is None else user_id)
+            flags.append(get_flags(shared, from_file))
+            counts.append(len(grams))
+            gram_hashes.extend(grams)
+            gram_entries.extend([position] * len(grams))
+
+        # Build inverted index in the compressed sparse row layout
+        hashes = np.array(gram_hashes, dtype=np.uint32)
+        order = np.argsort(hashes, kind="stable")
+        keys, starts = np.unique(hashes[order], return_index=True)
+        arrays = {
+            "ids": np.array(ids, dtype=np.int64),
+            "counts": np.array(counts, dtype=np.int32),
+            "keys": keys,
+            "offsets": np.append(starts, len(hashes)).astype(np.int64),
+            "postings": np.array(gram_entries, dtype=np.int32)[order],
+            "project": np.array(project, dtype=np.int64),
+            "user": np.array(user, dtype=np.int64),
+            "flags": np.array(flags, dtype=np.uint8),
+        }
+
+        version = f"{time.time_ns()}-{os.getpid()}"
+        base = os.path.join(self.path, version)
+        os.makedirs(base)
+        for name, value in arrays.items():
+            np.save(os.path.join(base, f"{name}.npy"), value)
+
+        with self.lock:
+            # Keep entries added while building
+            last_id = max(ids, default=0)
+            delta = [entry for entry in self.delta_log.read_all() if entry[0] > last_id]
+            self.delta_log.write(delta)
+
+            # Keep deletions of entries which are still indexed
+            deleted = np.array(self.deleted_log.read_all(), dtype=np.int64)
+            indexed = np.union1d(arrays["ids"], [entry[0] for entry in delta])
+            self.deleted_log.write(deleted[np.isin(deleted, indexed)].tolist())
+
+            # Switch the current version, processes with the previous version
+            # loaded keep it open until they reload
+            previous = self.read_version()
+            filename = f"{self.current_path}.{os.getpid()}"
+            with open(filename, "w") as handle:
+                handle.write(version)
+            os.replace(filename, self.current_path)
+        if previous:
+            shutil.rmtree(os.path.join(self.path, previous), ignore_errors=True)
+
+    def add(self, entries: list[IndexEntry]) -> int:
+        """Add entries to the index, returns number of added entries."""
+        with self.lock:
+            self.delta_log.append(entries)
+        self.load_delta()
+        return len(self.delta)
+
+    def remove(self, ids: list[int]) -> int:
+        """Remove entries from the index, returns number of removed entries."""
+        with self.lock:
+            self.deleted_log.append(ids)
+        self.load_deleted()
+        return len(self.deleted)
+
+    def get_scope_mask(
+        self,
+        project: np.ndarray,
+        user: np.ndarray,
+        flags: np.ndarray,
+        user_id: int | None,
+        project_id: int | None,
+        use_shared: bool,
+    ) -> np.ndarray:
+        mask = (flags & FLAG_FROM_FILE) != 0
+        if use_shared:
+            mask |= (flags & FLAG_SHARED) != 0
+        if project_id is not None:
+            mask |= project == project_id
+        if user_id is not None:
+            mask |= user == user_id
+        return mask
+
+    def lookup(
+        self,
+        text: str,
+        similarity: float,
+        user: User | None,
+        project: Project | None,
+        use_shared: bool,
+        limit: int = 50,
+    ) -> list[int]:
+        """
+        Find IDs of memory entries with similar source.
+
+        The similarity is calculated as Jaccard index of the trigram sets.
+        """
+        grams = get_ngrams(text)
+        if not grams:
+            return []
+        user_id = None if user is None else user.id
+        project_id = None if project is None else project.id
+
+        ids: list[np.ndarray] = []
+        scores: list[np.ndarray] = []
+
+        # Score entries in the index
+        keys = self.arrays["keys"]
+        if len(keys):
+            query = np.fromiter(grams, dtype=np.uint32, count=len(grams))
+            positions = np.searchsorted(keys, query)
+            positions = positions[positions < len(keys)]
+            positions = positions[np.isin(keys[positions], query)]
+            if len(positions):
+                offsets = self.arrays["offsets"]
+                postings = self.arrays["postings"]
+                hits = np.concatenate(
+                    [postings[offsets[pos] : offsets[pos + 1]] for pos in positions]
+                )
+                candidates, common = np.unique(hits, return_counts=True)
+                mask = self.get_scope_mask(
+                    self.arrays["project"][candidates],
+                    self.arrays["user"][candidates],
+                    self.arrays["flags"][candidates],
+                    user_id,
+                    project_id,
+                    use_shared,
+                )
+                candidates = candidates[mask]
+                common = common[mask]
+                ids.append(self.arrays["ids"][candidates])
+                scores.append(
+                    common / (len(grams) + self.arrays["counts"][candidates] - common)
+                )
+
+        # Score recently added entries
+        if len(self.delta):
+            hits = [
+                position
+                for gram in grams
+                for position in self.delta_postings.get(gram, ())
+            ]
+            if hits:
+                candidates, common = np.unique(hits, return_counts=True)
+                delta = self.delta[candidates]
+                mask = self.get_scope_mask(
+                    delta[:, 1],
+                    delta[:, 2],
+                    delta[:, 3],
+                    user_id,
+                    project_id,
+                    use_shared,
+                )
+                common = common[mask]
+                ids.append(delta[mask, 0])
+                scores.append(
+                    common / (len(grams) + self.delta_counts[candidates[mask]] - common)
+                )
+
+        if not ids:
+            return []
+        all_ids = np.concatenate(ids)
+        all_scores = np.concatenate(scores)
+        selected = all_scores >= similarity
+        if len(self.deleted):
+            selected &= ~np.isin(all_ids, self.deleted)
+        all_ids = all_ids[selected]
+        all_scores = all_scores[selected]
+        best = np.argsort(-all_scores, kind="stable")[:limit]
+        return [int(pk) for pk in all_ids[best]]
+
+
+# Loaded indexes in the current process
+INDEXES: dict[tuple[int, int], MemoryIndex] = {}
+
+
+def get_memory_index(
+    source_language_id: int, target_language_id: int
+) -> MemoryIndex | None:
+    """Return loaded index for language pair or None if not available."""
+    if not HAS_NUMPY:
+        return None
+    key = (source_language_id, target_language_id)
+    if key not in INDEXES:
+        INDEXES[key] = MemoryIndex(source_language_id, target_language_id)
+    index = INDEXES[key]
+    if not index.load():
+        return None
+    return index
@@ -2,14 +2,21 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+from __future__ import annotations
+
 import json
 import math
 import os
+from itertools import islice
+from typing import TYPE_CHECKING
 
+from appconf import AppConf
 from django.conf import settings
-from django.db import models
+from django.db import models, transaction
 from django.db.models import Q, Value
 from django.db.models.functions import MD5
+from django.db.models.signals import pre_delete
+from django.dispatch import receiver
 from django.utils.encoding import force_str
 from django.utils.translation import gettext, pgettext
 from jsonschema import validate
@@ -19,6 +26,7 @@ from translate.storage.tmx import tmxfile
 from weblate_schemas import load_schema
 
 from weblate.lang.models import Language
+from weblate.memory.index import DELTA_LIMIT, get_memory_index
 from weblate.memory.utils import (
     CATEGORY_FILE,
     CATEGORY_PRIVATE_OFFSET,
@@ -27,8 +35,25 @@ from weblate.memory.utils import (
     is_valid_memory_entry,
 )
 from weblate.utils.db import adjust_similarity_threshold, using_postgresql
+from weblate.utils.decorators import disable_for_loaddata
 from weblate.utils.errors import report_error
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+# Fields identifying memory entry
+MEMORY_KEY_FIELDS = (
+    "source_language_id",
+    "target_language_id",
+    "source",
+    "target",
+    "origin",
+    "user_id",
+    "project_id",
+    "from_file",
+    "shared",
+)
+
 
 class MemoryImportError(Exception):
     pass
@@ -48,6 +73,14 @@ def get_node_data(unit, node):
     )
 
 
+class WeblateMemoryConf(AppConf):
+    # Use local index to lookup translation memory
+    MEMORY_INDEX = False
+
+    class Meta:
+        prefix = ""
+
+
 class MemoryQuerySet(models.QuerySet):
     def filter_type(self, user=None, project=None, use_shared=False, from_file=False):
         base = self
@@ -112,27 +145,70 @@ class MemoryQuerySet(models.QuerySet):
     ):
         # Adjust similarity based on string length to get more relevant matches
         # for long strings
-        adjust_similarity_threshold(self.threshold_to_similarity(text, threshold))
+        similarity = self.threshold_to_similarity(text, threshold)
+
+        base = self.prefetch_project().filter_type(
+            # Type filtering
+            user=user,
+            project=project,
+            use_shared=use_shared,
+            from_file=True,
+        )
+
+        # Lookup candidates in the local index
+        if settings.MEMORY_INDEX:
+            index = get_memory_index(source_language.id, target_language.id)
+            if index is not None:
+                return base.filter(
+                    pk__in=index.lookup(text, similarity, user, project, use_shared)
+                )
+            from weblate.memory.tasks import schedule_memory_index
+
+            schedule_memory_index(source_language.id, target_language.id)
+
+        adjust_similarity_threshold(similarity)
 
         # Actual database query
-        return (
-            self.prefetch_project()
-            .filter_type(
-                # Type filtering
-                user=user,
-                project=project,
-                use_shared=use_shared,
-                from_file=True,
-            )
-            .filter(
-                # Full-text search on source
-                source__search=text,
-                # Language filtering
-                source_language=source_language,
-                target_language=target_language,
-            )[:50]
+        return base.filter(
+            # Full-text search on source
+            source__search=text,
+            # Language filtering
+            source_language=source_language,
+            target_language=target_language,
+        )[:50]
+
+    def get_language_pairs(self) -> list[tuple[int, int]]:
+        return list(
+            self.order_by()
+            .values_list("source_language_id", "target_language_id")
+            .distinct()
         )
 
+    def delete(self):
+        if not settings.MEMORY_INDEX:
+            return super().delete()
+        from weblate.memory.tasks import remove_memory_index, schedule_memory_index
+
+        deleted = list(
+            self.values_list("pk", "source_language_id", "target_language_id")[
+                : DELTA_LIMIT + 1
+            ]
+        )
+        if len(deleted) > DELTA_LIMIT:
+            # Rebuilding the index is cheaper than tracking many deleted entries
+            pairs = self.get_language_pairs()
+            result = super().delete()
+            for source_language_id, target_language_id in pairs:
+                schedule_memory_index(source_language_id, target_language_id)
+            return result
+        result = super().delete()
+        if deleted:
+            transaction.on_commit(lambda: remove_memory_index(deleted), using=self.db)
+        return result
+
+    delete.alters_data = True
+    delete.queryset_only = True
+
     def prefetch_lang(self):
         return self.prefetch_related("source_language", "target_language")
 
@@ -175,23 +251,27 @@ class MemoryManager(models.Manager):
             ) from error
         found = 0
         lang_cache = {}
+        entries = []
         for entry in data:
             try:
-                self.update_entry(
-                    source_language=Language.objects.get_by_code(
-                        entry["source_language"], lang_cache
-                    ),
-                    target_language=Language.objects.get_by_code(
-                        entry["target_language"], lang_cache
-                    ),
-                    source=entry["source"],
-                    target=entry["target"],
-                    origin=origin,
-                    **kwargs,
+                entries.append(
+                    Memory(
+                        source_language=Language.objects.get_by_code(
+                            entry["source_language"], lang_cache
+                        ),
+                        target_language=Language.objects.get_by_code(
+                            entry["target_language"], lang_cache
+                        ),
+                        source=entry["source"],
+                        target=entry["target"],
+                        origin=origin,
+                        **kwargs,
+                    )
                 )
                 found += 1
             except Language.DoesNotExist:
                 continue
+        self.bulk_add(entries)
         return found
 
     def import_tmx(self, request, fileobj, origin=None, langmap=None, **kwargs):
@@ -219,6 +299,7 @@ class MemoryManager(models.Manager):
             raise MemoryImportError(gettext("Could not find language %s!") % srclang)
 
         found = 0
+        entries = []
         for unit in storage.units:
             # Parse translations (translate-toolkit does not care about
             # languages here, it just picks first and second XML elements)
@@ -244,24 +325,63 @@ class MemoryManager(models.Manager):
                 continue
 
             for lang, text in translations.items():
-                self.update_entry(
-                    source_language=source_language,
-                    target_language=Language.objects.get_by_code(
-                        lang, lang_cache, langmap
-                    ),
-                    source=source,
-                    target=text,
-                    origin=origin,
-                    **kwargs,
+                entries.append(
+                    Memory(
+                        source_language=source_language,
+                        target_language=Language.objects.get_by_code(
+                            lang, lang_cache, langmap
+                        ),
+                        source=source,
+                        target=text,
+                        origin=origin,
+                        **kwargs,
+                    )
                 )
                 found += 1
+        self.bulk_add(entries)
         return found
 
-    def update_entry(self, **kwargs) -> None:
-        if not is_valid_memory_entry(**kwargs):  # pylint: disable=missing-kwoa
-            return
-        if not self.filter(**kwargs).exists():
-            self.create(**kwargs)
+    def bulk_add(
+        self, entries: Iterable[Memory], chunk_size: int = 1000
+    ) -> list[Memory]:
+        """
+        Add memory entries in bulk, skipping existing ones.
+
+        The entries are compared against the database in chunks and only the
+        missing ones are created. Returns list of created entries.
+        """
+        created = []
+        seen = set()
+        for chunk in iterate_chunks(entries, chunk_size):
+            pending = {}
+            for entry in chunk:
+                if not is_valid_memory_entry(source=entry.source, target=entry.target):
+                    continue
+                key = entry.get_key()
+                if key not in seen:
+                    seen.add(key)
+                    pending[key] = entry
+            if not pending:
+                continue
+            existing = self.filter(
+                source__in={entry.source for entry in pending.values()},
+                origin__in={entry.origin for entry in pending.values()},
+            ).values_list(*MEMORY_KEY_FIELDS)
+            for key in existing:
+                pending.pop(key, None)
+            if pending:
+                created.extend(self.bulk_create(pending.values()))
+        if created and settings.MEMORY_INDEX:
+            from weblate.memory.tasks import add_memory_index
+
+            add_memory_index(created)
+        return created
+
+
+def iterate_chunks(items: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
 
 
 class Memory(models.Model):
@@ -323,6 +443,9 @@ class Memory(models.Model):
     def __str__(self) -> str:
         return f"Memory: {self.source_language}:{self.target_language}"
 
+    def get_key(self) -> tuple:
+        return tuple(getattr(self, field) for field in MEMORY_KEY_FIELDS)
+
     def get_origin_display(self):
         if self.project:
             text = pgettext("Translation memory category", "Project: {}")
@@ -357,3 +480,20 @@ class Memory(models.Model):
             "origin": self.origin,
             "category": self.get_category(),
         }
+
+
+@receiver(pre_delete, sender="trans.Project")
+@receiver(pre_delete, sender=settings.AUTH_USER_MODEL)
+@disable_for_loaddata
+def schedule_memory_cascade(sender, instance, **kwargs) -> None:
+    """Rebuild index for entries removed by cascade delete."""
+    if not settings.MEMORY_INDEX:
+        return
+    from weblate.memory.tasks import schedule_memory_index
+
+    if sender._meta.model_name == "project":
+        memory = Memory.objects.filter_type(project=instance)
+    else:
+        memory = Memory.objects.filter_type(user=instance)
+    for source_language_id, target_language_id in memory.get_language_pairs():
+        schedule_memory_index(source_language_id, target_language_id)
@@ -4,14 +4,22 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.core.cache import cache
 from django.db import transaction
 
 from weblate.machinery.base import get_machinery_language
+from weblate.memory.index import DELTA_LIMIT, MemoryIndex, get_memory_index
 from weblate.memory.models import Memory
 from weblate.memory.utils import is_valid_memory_entry
 from weblate.utils.celery import app
 from weblate.utils.state import STATE_TRANSLATED
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
 
 @app.task(trail=False)
 def import_memory(project_id: int, component_id: int | None = None) -> None:
@@ -33,25 +41,35 @@ def import_memory(project_id: int, component_id: int | None = None) -> None:
                 units = units.exclude(
                     translation__language_id=component.source_language_id
                 )
-            for unit in units.prefetch_related("translation", "translation__language"):
-                update_memory(None, unit, component, project)
+            Memory.objects.bulk_add(
+                entry
+                for unit in units.prefetch_related(
+                    "translation", "translation__language"
+                )
+                for entry in get_memory_entries(None, unit, component, project)
+            )
 
 
 @app.task(trail=False)
 def handle_unit_translation_change(unit_id, user_id=None) -> None:
+    handle_units_translation_change([unit_id], user_id)
+
+
+@app.task(trail=False)
+def handle_units_translation_change(unit_ids: list[int], user_id=None) -> None:
     from weblate.auth.models import User
     from weblate.trans.models import Unit
 
     user = None if user_id is None else User.objects.get(pk=user_id)
-    try:
-        unit = Unit.objects.prefetch().get(pk=unit_id)
-    except Unit.DoesNotExist:
-        # Unit was removed meanwhile
-        return
-    update_memory(user, unit)
+    # Units removed meanwhile are skipped
+    units = Unit.objects.prefetch().filter(pk__in=unit_ids)
+    Memory.objects.bulk_add(
+        entry for unit in units for entry in get_memory_entries(user, unit)
+    )
 
 
-def update_memory(user, unit, component=None, project=None) -> None:
+def get_memory_entries(user, unit, component=None, project=None) -> list[Memory]:
+    """Return memory entries for all scopes the unit should be stored in."""
     component = component or unit.translation.component
     project = project or component.project
     params = {
@@ -63,48 +81,92 @@ def update_memory(user, unit, component=None, project=None) -> None:
     }
 
     if not is_valid_memory_entry(**params):
-        return
-
-    add_project = True
-    add_shared = project.contribute_shared_tm
-    add_user = user is not None and not user.is_bot
-
-    # Check matching entries in memory
-    for matching in Memory.objects.filter(from_file=False, **params):
-        if (
-            matching.user_id is None
-            and matching.project_id == project.id
-            and not matching.shared
-        ):
-            add_project = False
-        elif (
-            add_shared
-            and matching.user_id is None
-            and matching.project_id is None
-            and matching.shared
-        ):
-            add_shared = False
-        elif (
-            add_user
-            and matching.user_id == user.id
-            and matching.project_id is None
-            and not matching.shared
-        ):
-            add_user = False
-
-    to_create = []
-
-    if add_project:
-        to_create.append(
-            Memory(user=None, project=project, from_file=False, shared=False, **params)
-        )
-    if add_shared:
-        to_create.append(
+        return []
+
+    result = [
+        Memory(user=None, project=project, from_file=False, shared=False, **params)
+    ]
+    if project.contribute_shared_tm:
+        result.append(
             Memory(user=None, project=None, from_file=False, shared=True, **params)
         )
-    if add_user:
-        to_create.append(
+    if user is not None and not user.is_bot:
+        result.append(
             Memory(user=user, project=None, from_file=False, shared=False, **params)
         )
-    if to_create:
-        Memory.objects.bulk_create(to_create)
+    return result
+
+
+def update_memory(user, unit, component=None, project=None) -> None:
+    Memory.objects.bulk_add(get_memory_entries(user, unit, component, project))
+
+
+def schedule_memory_index(source_language_id: int, target_language_id: int) -> None:
+    """Schedule index build unless it is already scheduled."""
+    if cache.add(
+        f"memory-index-build-{source_language_id}-{target_language_id}", True, 3600
+    ):
+        build_memory_index.delay_on_commit(source_language_id, target_language_id)
+
+
+def add_memory_index(entries: list[Memory]) -> None:
+    """Add new memory entries to the local index."""
+    grouped: dict[tuple[int, int], list] = {}
+    for entry in entries:
+        if entry.pk is None:
+            # Database does not return IDs from bulk_create, rebuild the index
+            schedule_memory_index(entry.source_language_id, entry.target_language_id)
+            continue
+        grouped.setdefault(
+            (entry.source_language_id, entry.target_language_id), []
+        ).append(
+            (
+                entry.pk,
+                entry.source,
+                entry.project_id,
+                entry.user_id,
+                entry.shared,
+                entry.from_file,
+            )
+        )
+    for (source_language_id, target_language_id), items in grouped.items():
+        index = get_memory_index(source_language_id, target_language_id)
+        if index is None:
+            # Not yet built, all entries are included when building
+            continue
+        if index.add(items) > DELTA_LIMIT:
+            schedule_memory_index(source_language_id, target_language_id)
+
+
+def remove_memory_index(entries: Iterable[tuple[int, int, int]]) -> None:
+    """Remove deleted memory entries from the local index."""
+    grouped: dict[tuple[int, int], list[int]] = {}
+    for pk, source_language_id, target_language_id in entries:
+        grouped.setdefault((source_language_id, target_language_id), []).append(pk)
+    for (source_language_id, target_language_id), ids in grouped.items():
+        index = get_memory_index(source_language_id, target_language_id)
+        if index is None:
+            # Not yet built, deleted entries are not included when building
+            continue
+        if index.remove(ids) > DELTA_LIMIT:
+            schedule_memory_index(source_language_id, target_language_id)
+
+
+@app.task(trail=False)
+def build_memory_index(source_language_id: int, target_language_id: int) -> None:
+    index = MemoryIndex(source_language_id, target_language_id)
+    memory = Memory.objects.all()
+    if "memory_db" in settings.DATABASES:
+        memory = memory.using("memory_db")
+    try:
+        index.build(
+            memory.filter(
+                source_language_id=source_language_id,
+                target_language_id=target_language_id,
+            )
+            .order_by("pk")
+            .values_list("pk", "source", "project_id", "user_id", "shared", "from_file")
+            .iterator(chunk_size=10000)
+        )
+    finally:
+        cache.delete(f"memory-index-build-{source_language_id}-{target_language_id}")
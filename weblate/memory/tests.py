@@ -3,19 +3,28 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import json
+import shutil
 from io import StringIO
+from unittest import SkipTest
+from unittest.mock import patch
 
 from django.core.management import call_command
 from django.core.management.base import CommandError
 from django.test import SimpleTestCase
+from django.test.utils import override_settings
 from django.urls import reverse
 from jsonschema import validate
 from weblate_schemas import load_schema
 
 from weblate.lang.models import Language
+from weblate.memory.index import HAS_NUMPY, get_memory_index
 from weblate.memory.machine import WeblateMemory
 from weblate.memory.models import Memory
-from weblate.memory.tasks import handle_unit_translation_change, import_memory
+from weblate.memory.tasks import (
+    build_memory_index,
+    handle_unit_translation_change,
+    import_memory,
+)
 from weblate.memory.utils import CATEGORY_FILE
 from weblate.trans.tests.test_views import FixtureTestCase
 from weblate.trans.tests.utils import get_test_file
@@ -84,9 +93,106 @@ class MemoryModelTest(TransactionsTestMixin, FixtureTestCase):
         del machinery["origin"]
         self.assertEqual(machinery, {"quality": [100], "translation": ["Ahoj"]})
 
+    @override_settings(MEMORY_INDEX=True)
+    def test_machine_index(self) -> None:
+        if not HAS_NUMPY:
+            raise SkipTest("NumPy not available")
+        add_document()
+        source = Language.objects.get(code="en")
+        target = Language.objects.get(code="cs")
+        build_memory_index(source.id, target.id)
+        index = get_memory_index(source.id, target.id)
+        self.assertIsNotNone(index)
+        self.addCleanup(shutil.rmtree, index.path)
+
+        memory = Memory.objects.get()
+        self.assertEqual(index.lookup("Hello", 0.6, None, None, False), [memory.pk])
+        self.assertEqual(index.lookup("Something else", 0.6, None, None, False), [])
+
+        unit = self.get_unit()
+        machine_translation = WeblateMemory({})
+        self.assertEqual(
+            [item["text"] for item in machine_translation.search(unit, "Hello", None)],
+            ["Ahoj"],
+        )
+
+        # New entries are added incrementally
+        unit.translate(self.user, "Nazdar", STATE_TRANSLATED)
+        index = get_memory_index(source.id, target.id)
+        self.assertEqual(
+            len(index.lookup(unit.source, 0.6, self.user, self.project, True)), 3
+        )
+        self.assertEqual(len(index.lookup(unit.source, 0.6, None, None, False)), 0)
+
+        # Deleted entries are excluded
+        with self.captureOnCommitCallbacks(execute=True):
+            Memory.objects.filter(user=self.user).delete()
+        index = get_memory_index(source.id, target.id)
+        self.assertEqual(
+            len(index.lookup(unit.source, 0.6, self.user, self.project, True)), 2
+        )
+
+    @override_settings(MEMORY_INDEX=True)
+    def test_delete_schedule(self) -> None:
+        add_document()
+        source = Language.objects.get(code="en")
+        target = Language.objects.get(code="cs")
+        # Large delete rebuilds the index instead of tracking entries
+        with (
+            patch("weblate.memory.models.DELTA_LIMIT", 0),
+            patch("weblate.memory.tasks.schedule_memory_index") as schedule,
+        ):
+            Memory.objects.all().delete()
+        schedule.assert_called_once_with(source.id, target.id)
+
+        # Cascade delete rebuilds the index
+        Memory.objects.create(
+            source_language=source,
+            target_language=target,
+            source="Hello",
+            target="Ahoj",
+            origin="test",
+            project=self.project,
+        )
+        with patch("weblate.memory.tasks.schedule_memory_index") as schedule:
+            self.project.delete()
+        schedule.assert_called_once_with(source.id, target.id)
+        self.assertFalse(Memory.objects.exists())
+
+    def test_bulk_add(self) -> None:
+        source = Language.objects.get(code="en")
+        target = Language.objects.get(code="cs")
+        entries = [
+            Memory(
+                source_language=source,
+                target_language=target,
+                source=f"Source {i}",
+                target=f"Zdroj {i}",
+                origin="test",
+                from_file=True,
+            )
+            for i in range(2500)
+        ]
+        # Duplicates and invalid entries are skipped
+        invalid = Memory(
+            source_language=source,
+            target_language=target,
+            source="Source",
+            target="",
+            origin="test",
+            from_file=True,
+        )
+        created = Memory.objects.bulk_add([*entries, *entries[:10], invalid])
+        self.assertEqual(len(created), 2500)
+        self.assertEqual(Memory.objects.count(), 2500)
+        self.assertEqual(Memory.objects.bulk_add(entries), [])
+        self.assertEqual(Memory.objects.count(), 2500)
+
     def test_import_tmx_command(self) -> None:
         call_command("import_memory", get_test_file("memory.tmx"))
         self.assertEqual(Memory.objects.count(), 2)
+        call_command("import_memory", get_test_file("memory.tmx"))
+        self.assertEqual(Memory.objects.count(), 2)
 
     def test_import_tmx2_command(self) -> None:
         call_command("import_memory", get_test_file("memory2.tmx"))
@@ -0,0 +1,112 @@
+# Copyright © Michal Čihař <michal@weblate.org>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Site-wide object counters used by the metrics API.
+
+Counting rows of large tables is slow, so the counters are kept in the cache.
+Counters of objects created one by one are updated by signals, the remaining
+ones and any drift are corrected by the periodic reconciliation.
+
+Large tables are never counted while serving the metrics, the last known value
+is used and the reconciliation is scheduled when the counter is missing.
+"""
+
+from __future__ import annotations
+
+from contextlib import suppress
+
+from django.core.cache import cache
+from django.db import transaction
+
+from weblate.auth.models import User
+from weblate.checks.models import Check
+from weblate.trans.models import Component, Project, Suggestion, Translation
+from weblate.wladmin.models import ConfigurationError
+
+# Counters maintained by signals
+COUNTER_MODELS = {
+    User: "users",
+    Project: "projects",
+    Component: "components",
+    Translation: "translations",
+}
+
+# Counters of large tables, updated by the reconciliation only
+RECONCILED_MODELS = {
+    Check: "checks",
+    Suggestion: "suggestions",
+}
+
+COUNTERS = (
+    *COUNTER_MODELS.values(),
+    *RECONCILED_MODELS.values(),
+    "configuration_errors",
+)
+
+# Last known values of the reconciled counters in this process
+LAST_COUNTERS: dict[str, int] = {}
+
+
+def get_counter_key(name: str) -> str:
+    return f"metrics-counter-{name}"
+
+
+def count_objects(name: str) -> int:
+    if name == "configuration_errors":
+        return ConfigurationError.objects.filter(ignored=False).count()
+    for model, counter in (*COUNTER_MODELS.items(), *RECONCILED_MODELS.items()):
+        if counter == name:
+            return model.objects.count()
+    raise ValueError(f"Unknown counter: {name}")
+
+
+def reconcile_counters(names: tuple[str, ...] = COUNTERS) -> dict[str, int]:
+    """Count objects in the database and store the counters."""
+    result = {name: count_objects(name) for name in names}
+    cache.set_many(
+        {get_counter_key(name): value for name, value in result.items()}, None
+    )
+    return result
+
+
+def schedule_reconcile_counters() -> None:
+    """Schedule the reconciliation unless it is already scheduled."""
+    from weblate.metrics.tasks import reconcile_metrics_counters
+
+    if cache.add("metrics-counter-reconcile", True, 3600):
+        reconcile_metrics_counters.delay_on_commit()
+
+
+def get_counters() -> dict[str, int]:
+    """Return object counters, counting only the missing cheap ones."""
+    cached = cache.get_many([get_counter_key(name) for name in COUNTERS])
+    result = {}
+    missing = []
+    for name in COUNTERS:
+        value = cached.get(get_counter_key(name))
+        if value is not None:
+            result[name] = value
+        elif name in RECONCILED_MODELS.values():
+            result[name] = LAST_COUNTERS.get(name, 0)
+            schedule_reconcile_counters()
+        else:
+            missing.append(name)
+    if missing:
+        result.update(reconcile_counters(tuple(missing)))
+    LAST_COUNTERS.update((name, result[name]) for name in RECONCILED_MODELS.values())
+    return result
+
+
+def adjust_counter(name: str, delta: int) -> None:
+    def update() -> None:
+        # Missing counter is counted on next use
+        with suppress(ValueError):
+            cache.incr(get_counter_key(name), delta)
+
+    transaction.on_commit(update)
+
+
+def invalidate_counter(name: str) -> None:
+    transaction.on_commit(lambda: cache.delete(get_counter_key(name)))
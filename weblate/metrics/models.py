@@ -18,6 +18,11 @@ from django.utils.functional import cached_property
 from weblate.auth.models import User
 from weblate.lang.models import Language
 from weblate.memory.models import Memory
+from weblate.metrics.counters import (
+    COUNTER_MODELS,
+    adjust_counter,
+    invalidate_counter,
+)
 from weblate.screenshots.models import Screenshot
 from weblate.trans.models import (
     Category,
@@ -35,6 +40,7 @@ from weblate.utils.stats import (
     ProjectLanguage,
     prefetch_stats,
 )
+from weblate.wladmin.models import ConfigurationError
 
 BASIC_KEYS = {
     "all",
@@ -180,17 +186,11 @@ class MetricManager(models.Manager["Metric"]):
             ignore_conflicts=True,
         )
 
-    def calculate_changes(
-        self, date, obj, scope: int, relation: int, secondary: int = 0
-    ):
-        """
-        Calculate changes for given scope and date.
-
-        This is used to fill in blanks in a history.
-        """
+    @staticmethod
+    def get_changes(obj):
         if obj is None:
-            changes = Change.objects.all()
-        elif isinstance(
+            return Change.objects.all()
+        if isinstance(
             obj,
             Translation
             | Component
@@ -200,21 +200,43 @@ class MetricManager(models.Manager["Metric"]):
             | ProjectLanguage
             | CategoryLanguage,
         ):
-            changes = obj.change_set.all()
-        elif isinstance(obj, ComponentList):
-            changes = Change.objects.filter(component__in=obj.components.all())
-        elif isinstance(obj, Category):
-            changes = Change.objects.for_category(obj)
-        else:
-            raise TypeError(f"Unsupported type for metrics: {obj!r}")
-
-        count = changes.filter(
-            timestamp__date=date - datetime.timedelta(days=1)
-        ).count()
-        self.create_metrics(
-            {"changes": count}, None, set(), scope, relation, secondary, date=date
+            return obj.change_set.all()
+        if isinstance(obj, ComponentList):
+            return Change.objects.filter(component__in=obj.components.all())
+        if isinstance(obj, Category):
+            return Change.objects.for_category(obj)
+        raise TypeError(f"Unsupported type for metrics: {obj!r}")
+
+    def calculate_changes_bulk(
+        self, dates: list, obj, scope: int, relation: int, secondary: int = 0
+    ) -> dict[datetime.date, int]:
+        """
+        Calculate changes for given scope and dates.
+
+        The changes are counted using a single query and the missing metrics
+        are stored at once.
+        """
+        if not dates:
+            return {}
+        offset = datetime.timedelta(days=1)
+        counts = self.get_changes(obj).count_daily(
+            min(dates) - offset, max(dates) - offset
         )
-        return count
+        result = {date: counts.get(date - offset, 0) for date in dates}
+        self.bulk_create(
+            [
+                Metric(
+                    scope=scope,
+                    relation=relation,
+                    secondary=secondary,
+                    date=date,
+                    changes=changes,
+                )
+                for date, changes in result.items()
+            ],
+            ignore_conflicts=True,
+        )
+        return result
 
     def collect_auto(self, obj):
         if obj is None:
@@ -629,3 +651,30 @@ def delete_metrics_user(sender, instance, **kwargs) -> None:
 @disable_for_loaddata
 def delete_metrics_language(sender, instance, **kwargs) -> None:
     Metric.objects.filter(scope=Metric.SCOPE_LANGUAGE, relation=instance.pk).delete()
+
+
+@receiver(post_save, sender=User)
+@receiver(post_save, sender=Project)
+@receiver(post_save, sender=Component)
+@receiver(post_save, sender=Translation)
+@disable_for_loaddata
+def count_created(sender, instance, created=False, **kwargs) -> None:
+    if created:
+        adjust_counter(COUNTER_MODELS[sender], 1)
+
+
+@receiver(post_delete, sender=User)
+@receiver(post_delete, sender=Project)
+@receiver(post_delete, sender=Component)
+@receiver(post_delete, sender=Translation)
+@disable_for_loaddata
+def count_deleted(sender, instance, **kwargs) -> None:
+    adjust_counter(COUNTER_MODELS[sender], -1)
+
+
+@receiver(post_save, sender=ConfigurationError)
+@receiver(post_delete, sender=ConfigurationError)
+@disable_for_loaddata
+def count_configuration_errors(sender, instance, **kwargs) -> None:
+    # Cheap to count, but the ignored flag can change on save
+    invalidate_counter("configuration_errors")
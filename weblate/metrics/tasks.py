@@ -5,10 +5,12 @@
 from datetime import timedelta
 
 from celery.schedules import crontab
+from django.core.cache import cache
 from django.utils import timezone
 
 from weblate.auth.models import User
 from weblate.lang.models import Language
+from weblate.metrics.counters import reconcile_counters
 from weblate.metrics.models import Metric
 from weblate.trans.models import Component, ComponentList, Project, Translation
 from weblate.utils.celery import app
@@ -47,6 +49,15 @@ def cleanup_metrics() -> None:
     ).update(data=None)
 
 
+@app.task(trail=False)
+def reconcile_metrics_counters() -> None:
+    """Correct object counters used by the metrics API."""
+    try:
+        reconcile_counters()
+    finally:
+        cache.delete("metrics-counter-reconcile")
+
+
 @app.on_after_finalize.connect
 def setup_periodic_tasks(sender, **kwargs) -> None:
     sender.add_periodic_task(
@@ -55,3 +66,6 @@ def setup_periodic_tasks(sender, **kwargs) -> None:
     sender.add_periodic_task(
         crontab(hour=23, minute=1), cleanup_metrics.s(), name="cleanup-metrics"
     )
+    sender.add_periodic_task(
+        3600, reconcile_metrics_counters.s(), name="reconcile-metrics-counters"
+    )
@@ -4,6 +4,7 @@
 
 from weblate.metrics.models import Metric
 from weblate.metrics.tasks import cleanup_metrics, collect_metrics
+from weblate.metrics.wrapper import MetricsWrapper
 from weblate.trans.models import Project
 from weblate.trans.tests.test_views import FixtureTestCase
 
@@ -27,3 +28,17 @@ class MetricTestCase(FixtureTestCase):
         new_count = Metric.objects.count()
         self.assertNotEqual(count, new_count)
         self.assertNotEqual(0, new_count)
+
+    def test_daily_activity(self) -> None:
+        project = Project.objects.all()[0]
+        Metric.objects.filter(scope=Metric.SCOPE_PROJECT, relation=project.pk).delete()
+        wrapper = MetricsWrapper(project, Metric.SCOPE_PROJECT, project.pk)
+        with self.assertNumQueries(3):
+            activity = wrapper.daily_activity
+        self.assertEqual(len(activity), 52)
+        self.assertEqual(
+            Metric.objects.filter(
+                scope=Metric.SCOPE_PROJECT, relation=project.pk
+            ).count(),
+            52,
+        )
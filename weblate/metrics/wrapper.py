@@ -216,14 +216,18 @@ class MetricsWrapper:
                 **kwargs,
             ).values_list("date", "changes")
         )
-        for offset in range(days):
-            current = start - timedelta(days=offset)
-            if current not in result:
-                result[current] = Metric.objects.calculate_changes(
-                    date=current,
-                    obj=self.obj,
-                    **kwargs,
-                )
+        missing = [
+            current
+            for current in (start - timedelta(days=offset) for offset in range(days))
+            if current not in result
+        ]
+        result.update(
+            Metric.objects.calculate_changes_bulk(
+                dates=missing,
+                obj=self.obj,
+                **kwargs,
+            )
+        )
         return result
 
     @cached_property
@@ -1251,6 +1251,7 @@ class ReportsForm(forms.Form):
             ("rst", gettext_lazy("reStructuredText")),
             ("json", gettext_lazy("JSON")),
             ("html", gettext_lazy("HTML")),
+            ("csv", gettext_lazy("CSV")),
         ),
     )
     period = forms.ChoiceField(
@@ -0,0 +1,53 @@
+# Copyright © Michal Čihař <michal@weblate.org>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from django.db import migrations
+from rapidfuzz.distance import DamerauLevenshtein
+
+from weblate.trans.util import count_words
+
+# Change.ACTIONS_CONTENT
+ACTIONS_CONTENT = {2, 5, 6, 7, 8, 9, 27, 30, 31, 32, 36, 37, 66}
+
+BATCH_SIZE = 1000
+
+
+def store_work_counts(apps, schema_editor) -> None:
+    """Store work counts for changes created before these were tracked."""
+    Change = apps.get_model("trans", "Change")
+    pending = []
+    for change in (
+        Change.objects.filter(
+            action__in=ACTIONS_CONTENT, unit__isnull=False, language__isnull=False
+        )
+        .exclude(details__has_key="words")
+        .select_related("language")
+        .only("target", "old", "details", "language__code")
+        .iterator(chunk_size=BATCH_SIZE)
+    ):
+        base_code = change.language.code.replace("_", "-").split("-")[0]
+        change.details["words"] = count_words(change.target, base_code)
+        change.details["distance"] = DamerauLevenshtein.distance(
+            change.old, change.target
+        )
+        pending.append(change)
+        if len(pending) >= BATCH_SIZE:
+            Change.objects.bulk_update(pending, ["details"])
+            pending = []
+    if pending:
+        Change.objects.bulk_update(pending, ["details"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("trans", "0018_merge_20240529_1359"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            code=store_work_counts,
+            reverse_code=migrations.RunPython.noop,
+            elidable=True,
+        ),
+    ]
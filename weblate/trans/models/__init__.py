@@ -90,6 +90,7 @@ def component_post_delete(sender, instance, **kwargs) -> None:
     # Update stats
     transaction.on_commit(instance.stats.update_parents)
     instance.stats.delete()
+    instance.drop_file_manifest()
 
     # Do not delete linked components
     if not instance.is_repo_link:
@@ -172,6 +172,9 @@ Current translation status:
     UNUSED_ALERT_DAYS = 365
     BACKGROUND_TASKS = "monthly"
 
+    # Number of processes used to parse translation files
+    PARSE_PROCESSES = 0
+
     SINGLE_PROJECT = False
     LICENSE_EXTRA = []
     LICENSE_FILTER = None
@@ -10,8 +10,9 @@ import sentry_sdk
 from django.conf import settings
 from django.core.cache import cache
 from django.db import models, transaction
-from django.db.models import Count, Q
+from django.db.models import Case, Count, IntegerField, Q, Value, When
 from django.db.models.base import post_save
+from django.db.models.functions import TruncDate
 from django.dispatch import receiver
 from django.utils import timezone
 from django.utils.html import escape, format_html
@@ -22,12 +23,13 @@ from weblate.lang.models import Language
 from weblate.trans.mixins import UserDisplayMixin
 from weblate.trans.models.alert import ALERTS
 from weblate.trans.models.project import Project
+from weblate.trans.util import count_words
 from weblate.utils.decorators import disable_for_loaddata
 from weblate.utils.pii import mask_email
 from weblate.utils.state import StringState
 
 if TYPE_CHECKING:
-    from datetime import datetime
+    from datetime import date, datetime
 
     from weblate.trans.models import Translation
 
@@ -53,24 +55,42 @@ class ChangeQuerySet(models.QuerySet["Change"]):
 
     def count_stats(self, days: int, step: int, dtstart: datetime):
         """Count the number of changes in a given period grouped by step days."""
-        # Count number of changes
-        result = []
-        for _unused in range(0, days, step):
-            # Calculate interval
-            int_start = dtstart
-            int_end = int_start + timezone.timedelta(days=step)
-
-            # Count changes
-            int_base = self.filter(timestamp__range=(int_start, int_end))
-            count = int_base.aggregate(Count("id"))
-
-            # Append to result
-            result.append((int_start, count["id__count"]))
+        interval = timezone.timedelta(days=step)
+        starts = [
+            dtstart + timezone.timedelta(days=offset) for offset in range(0, days, step)
+        ]
+        if not starts:
+            return []
+
+        # Assign bucket to each change and count them in a single query
+        bucket = Case(
+            *(
+                When(timestamp__lt=start + interval, then=Value(position))
+                for position, start in enumerate(starts)
+            ),
+            output_field=IntegerField(),
+        )
+        counts = dict(
+            self.filter(timestamp__gte=dtstart, timestamp__lt=starts[-1] + interval)
+            .annotate(bucket=bucket)
+            .order_by()
+            .values_list("bucket")
+            .annotate(Count("id"))
+        )
 
-            # Advance to next interval
-            dtstart = int_end
+        return [
+            (start, counts.get(position, 0)) for position, start in enumerate(starts)
+        ]
 
-        return result
+    def count_daily(self, start: date, end: date) -> dict[date, int]:
+        """Count the number of changes for each day in a given range."""
+        return dict(
+            self.filter(timestamp__date__range=(start, end))
+            .annotate(day=TruncDate("timestamp"))
+            .order_by()
+            .values_list("day")
+            .annotate(Count("id"))
+        )
 
     def base_stats(
         self,
@@ -243,6 +263,11 @@ class ChangeManager(models.Manager["Change"]):
             user = None
         return super().create(user=user, **kwargs)
 
+    def bulk_create(self, objs, *args, **kwargs):
+        for change in objs:
+            change.store_work_counts()
+        return super().bulk_create(objs, *args, **kwargs)
+
     def last_changes(
         self,
         user,
@@ -675,6 +700,8 @@ class Change(models.Model, UserDisplayMixin):
 
     def save(self, *args, **kwargs) -> None:
         self.fixup_refereces()
+        if self.pk is None:
+            self.store_work_counts()
 
         super().save(*args, **kwargs)
 
@@ -688,7 +715,7 @@ class Change(models.Model, UserDisplayMixin):
             # Update stats at the end of transaction
             transaction.on_commit(self.update_cache_last_change)
             # Make sure stats is updated at the end of transaction
-            self.translation.invalidate_cache()
+            self.translation.invalidate_cache(self.unit)
 
         if self.action == Change.ACTION_RENAME_PROJECT:
             Change.objects.generate_project_rename_lookup()
@@ -757,6 +784,22 @@ class Change(models.Model, UserDisplayMixin):
         if self.component:
             self.project = self.component.project
 
+    def store_work_counts(self) -> None:
+        """
+        Store target word count and edit distance of content change.
+
+        These are used in the work counts report, which aggregates them in
+        the database.
+        """
+        if (
+            self.unit_id is None
+            or self.action not in self.ACTIONS_CONTENT
+            or "words" in self.details
+        ):
+            return
+        self.details["words"] = count_words(self.target, self.language.base_code)
+        self.details["distance"] = self.get_distance()
+
     @property
     def plural_count(self):
         return self.details.get("count", 1)
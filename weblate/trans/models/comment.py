@@ -88,3 +88,4 @@ class Comment(models.Model, UserDisplayMixin):
             details={"comment": self.comment},
         )
         super().delete(using=using, keep_parents=keep_parents)
+        self.unit.invalidate_related_cache()
@@ -22,7 +22,7 @@ from django.conf import settings
 from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
 from django.core.validators import MaxValueValidator
-from django.db import IntegrityError, models, transaction
+from django.db import IntegrityError, connection, models, transaction
 from django.db.models import Count, Q
 from django.db.models.signals import m2m_changed
 from django.dispatch import receiver
@@ -30,9 +30,12 @@ from django.utils.functional import cached_property
 from django.utils.translation import gettext, gettext_lazy, ngettext, pgettext
 from weblate_language_data.ambiguous import AMBIGUOUS
 
+from weblate.addons.events import AddonEvent
 from weblate.checks.flags import Flags
 from weblate.checks.models import CHECKS
+from weblate.formats.exportcache import invalidate_export_cache
 from weblate.formats.models import FILE_FORMATS
+from weblate.formats.parallel import parse_stores
 from weblate.glossary.models import get_glossary_sources
 from weblate.lang.models import Language, get_default_lang
 from weblate.trans.defines import (
@@ -101,6 +104,7 @@ from weblate.utils.validators import (
     validate_re_nonempty,
     validate_slug,
 )
+from weblate.utils.version import VERSION
 from weblate.vcs.base import RepositoryError
 from weblate.vcs.git import LocalRepository
 from weblate.vcs.models import VCS_REGISTRY
@@ -110,6 +114,7 @@ if TYPE_CHECKING:
     from datetime import datetime
 
     from weblate.addons.models import Addon
+    from weblate.formats.parallel import ParsedStore
 
 NEW_LANG_CHOICES = (
     # Translators: Action when adding new translation
@@ -220,6 +225,15 @@ def prefetch_tasks(components):
     return components
 
 
+def prefetch_repo_status(components):
+    """Prefetch repository status snapshots."""
+    lookup = {component.repo_status_cache_key: component for component in components}
+    if lookup:
+        for key, status in cache.get_many(lookup.keys()).items():
+            lookup[key]._repo_status = status
+    return components
+
+
 def translation_prefetch_tasks(translations):
     prefetch_tasks([translation.component for translation in translations])
     return translations
@@ -1571,6 +1585,7 @@ class Component(models.Model, PathMixin, CacheKeyMixin, ComponentCategoryMixin):
                 Component.objects.filter(pk=self.pk).update(
                     remote_revision=remote_revision
                 )
+            self.invalidate_repo_status()
         return True
 
     def configure_repo(self, validate=False, pull=True) -> None:
@@ -1728,6 +1743,7 @@ class Component(models.Model, PathMixin, CacheKeyMixin, ComponentCategoryMixin):
         """Push repository changes upstream."""
         with self.repository.lock:
             self.log_info("pushing to remote repo")
+            self.invalidate_repo_status()
             try:
                 self.repository.push(self.push_branch)
             except RepositoryError as error:
@@ -1768,6 +1784,7 @@ class Component(models.Model, PathMixin, CacheKeyMixin, ComponentCategoryMixin):
                 )
                 self.add_alert("PushFailure", error=error_text)
                 return False
+            self.invalidate_repo_status()
             self.delete_alert("RepositoryChanges")
             self.delete_alert("PushFailure")
             return True
@@ -1838,6 +1855,7 @@ class Component(models.Model, PathMixin, CacheKeyMixin, ComponentCategoryMixin):
             self.update_remote_branch()
 
             # Do actual reset
+            self.invalidate_repo_status()
             try:
                 self.log_info("resetting to remote repo")
                 self.repository.reset()
@@ -1857,6 +1875,7 @@ class Component(models.Model, PathMixin, CacheKeyMixin, ComponentCategoryMixin):
                     "previous_head": previous_head,
                 },
             )
+            self.invalidate_repo_status()
             self.delete_alert("MergeFailure")
             self.delete_alert("RepositoryOutdated")
             self.delete_alert("PushFailure")
@@ -2049,6 +2068,7 @@ class Component(models.Model, PathMixin, CacheKeyMixin, ComponentCategoryMixin):
             # Actual commit
             if not self.repository.commit(message, author, timestamp, files):
                 return False
+            self.invalidate_repo_status()
 
             # Send post commit signal
             if signals:
@@ -2130,6 +2150,7 @@ class Component(models.Model, PathMixin, CacheKeyMixin, ComponentCategoryMixin):
                 kwargs["no_ff"] = True
 
         with self.repository.lock:
+            self.invalidate_repo_status()
             try:
                 previous_head = self.repository.last_revision
                 # Try to merge it
@@ -2164,6 +2185,8 @@ class Component(models.Model, PathMixin, CacheKeyMixin, ComponentCategoryMixin):
 
                 raise
 
+            self.invalidate_repo_status()
+
             if self.local_revision == new_head:
                 return False
 
@@ -2367,6 +2390,79 @@ class Component(models.Model, PathMixin, CacheKeyMixin, ComponentCategoryMixin):
                 raise InvalidTemplateError(exc)
         self._template_check_done = True
 
+    def parse_translation_files(
+        self,
+        matches: list[str],
+        source_file: str,
+        force: bool = False,
+        langs: list[str] | None = None,
+    ) -> dict[str, ParsedStore]:
+        """
+        Parse changed translation files in parallel.
+
+        Returns parsed stores for the files which can be used instead of
+        parsing them in Translation.check_sync. Files not included in the
+        result are parsed serially.
+        """
+        workers = settings.PARSE_PROCESSES
+        if (
+            workers <= 1
+            # Database connection used in a transaction can not be closed
+            # before forking the workers
+            or connection.in_atomic_block
+            or self.intermediate
+            or not self.file_format_cls.parallel_parse
+            or self.addons_cache[AddonEvent.EVENT_STORE_POST_LOAD]
+        ):
+            return {}
+
+        revisions = dict(self.translation_set.values_list("filename", "revision"))
+        files = {}
+        for path in matches:
+            if path == source_file:
+                code = self.source_language.code
+            else:
+                code = self.get_lang_code(path)
+            if langs is not None and code not in langs:
+                continue
+            translation = Translation(component=self, filename=path)
+            if not force and revisions.get(path):
+                try:
+                    revision = translation.get_git_blob_hash()
+                except Exception:
+                    # The error will be handled when syncing the translation
+                    revision = None
+                if revision is None or revisions[path] == revision:
+                    continue
+            files[path] = (
+                translation.get_filename(),
+                code,
+                bool(self.template) and path == self.template,
+            )
+        if len(files) < 2:
+            return {}
+
+        template_store = None
+        if self.has_template():
+            try:
+                template_store = self.load_template_store()
+                template_store.check_valid()
+            except Exception:
+                # The error is reported when syncing the translations
+                return {}
+            self.template_store = template_store
+        self.log_info(
+            "parsing %d files using %d processes", len(files), min(workers, len(files))
+        )
+        with self.start_sentry_span("parse_translation_files"):
+            return parse_stores(
+                self.file_format_cls,
+                template_store,
+                self.source_language.code,
+                files,
+                workers,
+            )
+
     def _create_translations(  # noqa: C901
         self,
         force: bool = False,
@@ -2384,12 +2480,23 @@ class Component(models.Model, PathMixin, CacheKeyMixin, ComponentCategoryMixin):
         self.needs_cleanup = False
         self.updated_sources = {}
         self.alerts_trigger = {}
-        self.start_batched_checks()
         was_change = False
         translations = {}
         languages = {}
         matches = self.get_mask_matches()
 
+        # Skip parsing if no files have changed since last scan
+        manifest = self.get_file_manifest(matches)
+        if (
+            not force
+            and not changed_template
+            and langs is None
+            and manifest == cache.get(self.file_manifest_cache_key)
+        ):
+            self.log_info("skipping update, no files changed")
+            return self.create_linked_translations(force, langs, request)
+
+        self.start_batched_checks()
         source_file = self.template
 
         if not self.has_template():
@@ -2418,6 +2525,7 @@ class Component(models.Model, PathMixin, CacheKeyMixin, ComponentCategoryMixin):
             self.translations_count = len(matches) + sum(
                 c.translation_set.count() for c in self.linked_childs
             )
+        parsed_stores = self.parse_translation_files(matches, source_file, force, langs)
         for pos, path in enumerate(matches):
             if not self._sources_prefetched and path != source_file:
                 self.preload_sources()
@@ -2457,6 +2565,7 @@ class Component(models.Model, PathMixin, CacheKeyMixin, ComponentCategoryMixin):
                         force,
                         request=request,
                         change=change,
+                        store=parsed_stores.pop(path, None),
                     )
                 except InvalidTemplateError as error:
                     self.log_warning(
@@ -2495,21 +2604,7 @@ class Component(models.Model, PathMixin, CacheKeyMixin, ComponentCategoryMixin):
         self.update_import_alerts()
 
         # Process linked repos
-        for pos, component in enumerate(self.linked_childs):
-            self.log_info(
-                "updating linked project %s [%d/%d]",
-                component,
-                pos + 1,
-                len(self.linked_childs),
-            )
-            component.translations_count = -1
-            try:
-                was_change |= component.create_translations(
-                    force, langs, request=request, from_link=True
-                )
-            except FileParseError:
-                report_error("Failed linked component update", project=self.project)
-                continue
+        was_change |= self.create_linked_translations(force, langs, request)
 
         # Run source checks on updated source strings
         if self.updated_sources:
@@ -2534,9 +2629,78 @@ class Component(models.Model, PathMixin, CacheKeyMixin, ComponentCategoryMixin):
         self.unload_sources()
         self.run_batched_checks()
 
+        if langs is None:
+            self.store_file_manifest(manifest)
+
         self.log_info("updating completed")
         return was_change
 
+    def create_linked_translations(
+        self, force: bool = False, langs: list[str] | None = None, request=None
+    ) -> bool:
+        """Load translations for linked components."""
+        was_change = False
+        for pos, component in enumerate(self.linked_childs):
+            self.log_info(
+                "updating linked project %s [%d/%d]",
+                component,
+                pos + 1,
+                len(self.linked_childs),
+            )
+            component.translations_count = -1
+            try:
+                was_change |= component.create_translations(
+                    force, langs, request=request, from_link=True
+                )
+            except FileParseError:
+                report_error("Failed linked component update", project=self.project)
+                continue
+        return was_change
+
+    @property
+    def file_manifest_cache_key(self) -> str:
+        return f"component-file-manifest-{self.pk}"
+
+    def get_file_manifest(self, matches: list[str]) -> dict[str, Any]:
+        """
+        Return manifest of files and settings used when loading translations.
+
+        The manifest is used to skip loading translations for components
+        where nothing has changed. It contains hashes of the files without
+        parsing them.
+        """
+        filenames = set(matches)
+        for filename in (self.template, self.intermediate, self.new_base):
+            if filename and os.path.exists(os.path.join(self.full_path, filename)):
+                filenames.add(filename)
+        return {
+            "settings": [
+                VERSION,
+                self.file_format,
+                self.filemask,
+                self.language_regex,
+                self.template,
+                self.intermediate,
+                self.new_base,
+                self.edit_template,
+                self.source_language_id,
+                self.project.language_aliases,
+            ],
+            "files": self.repository.get_object_hashes(sorted(filenames)),
+            "translations": self.get_translation_filenames(),
+        }
+
+    def get_translation_filenames(self) -> list[str]:
+        return sorted(self.translation_set.values_list("filename", flat=True))
+
+    def store_file_manifest(self, manifest: dict[str, Any]) -> None:
+        # Translations might have been added or removed while loading
+        manifest["translations"] = self.get_translation_filenames()
+        cache.set(self.file_manifest_cache_key, manifest, 30 * 86400)
+
+    def drop_file_manifest(self) -> None:
+        cache.delete(self.file_manifest_cache_key)
+
     def start_batched_checks(self) -> None:
         self.batch_checks = True
         self.batched_checks = set()
@@ -2558,6 +2722,7 @@ class Component(models.Model, PathMixin, CacheKeyMixin, ComponentCategoryMixin):
         self._invalidate_scheduled = False
         self.log_info("updating stats caches")
         self.stats.update_language_stats()
+        invalidate_export_cache(self)
         self.invalidate_glossary_cache()
 
     def invalidate_cache(self) -> None:
@@ -3238,16 +3403,60 @@ class Component(models.Model, PathMixin, CacheKeyMixin, ComponentCategoryMixin):
             # We silently ignore this error as push branch might not be existing if not needed
             return 0
 
+    @property
+    def repo_status_cache_key(self) -> str:
+        return f"component-repo-status-{self.pk}"
+
+    @perform_on_link
+    def update_repo_status(self) -> dict[str, int]:
+        """Calculate repository status and store it in the cache."""
+        status = {
+            "missing": self.count_repo_missing,
+            "outgoing": self.count_repo_outgoing,
+            "push_branch_outgoing": self.count_push_branch_outgoing,
+        }
+        if self.id:
+            cache.set(self.repo_status_cache_key, status, 24 * 3600)
+        self._repo_status = status
+        return status
+
+    @perform_on_link
+    def invalidate_repo_status(self) -> None:
+        cache.delete(self.repo_status_cache_key)
+        self._repo_status = None
+
+    @property
+    def repo_status(self) -> dict[str, int]:
+        """
+        Repository status snapshot.
+
+        It is invalidated by operations on the repository and calculated
+        again on first use, so it can be used for displaying the status
+        without executing VCS commands on every request.
+        """
+        component = self.linked_component or self
+        status = getattr(component, "_repo_status", None)
+        if status is None:
+            status = cache.get(component.repo_status_cache_key)
+            if status is None:
+                return component.update_repo_status()
+            component._repo_status = status
+        return status
+
     def needs_commit(self):
         """Check whether there are some not committed changes."""
         return self.count_pending_units > 0
 
-    def repo_needs_merge(self):
+    def repo_needs_merge(self, cached: bool = False):
         """Check for unmerged commits from remote repository."""
+        if cached:
+            return self.repo_status["missing"] > 0
         return self.count_repo_missing > 0
 
-    def repo_needs_push(self, retry: bool = True):
+    def repo_needs_push(self, retry: bool = True, cached: bool = False):
         """Check for something to push to remote repository."""
+        if cached:
+            return self.repo_status["outgoing"] > 0
         return self.count_repo_outgoing > 0
 
     @property
@@ -388,11 +388,11 @@ class Project(models.Model, PathMixin, CacheKeyMixin):
         """Commit any pending changes."""
         return self.on_repo_components(True, "commit_pending", reason, user)
 
-    def repo_needs_merge(self):
-        return self.on_repo_components(False, "repo_needs_merge")
+    def repo_needs_merge(self, cached: bool = False):
+        return self.on_repo_components(False, "repo_needs_merge", cached=cached)
 
-    def repo_needs_push(self):
-        return self.on_repo_components(False, "repo_needs_push")
+    def repo_needs_push(self, cached: bool = False):
+        return self.on_repo_components(False, "repo_needs_push", cached=cached)
 
     def do_update(self, request=None, method=None):
         """Update all Git repos."""
@@ -596,7 +596,11 @@ class Project(models.Model, PathMixin, CacheKeyMixin):
             ).distinct()
             for language in self.languages
         ]
-        cache.delete_many(tsv_cache_keys)
+        cache.delete_many([*tsv_cache_keys, self.glossary_automaton_key])
+
+    @cached_property
+    def glossary_automaton_key(self) -> str:
+        return f"project-glossary-automaton-{self.pk}"
 
     @cached_property
     def glossary_automaton(self):
@@ -13,17 +13,19 @@ from typing import TYPE_CHECKING, BinaryIO
 import sentry_sdk
 from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
-from django.db import IntegrityError, models, transaction
-from django.db.models import F, Q
+from django.db import IntegrityError, connection, models, transaction
+from django.db.models import Count, F, Q
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.functional import cached_property
 from django.utils.translation import gettext
 
+from weblate.addons.events import AddonEvent
 from weblate.checks.flags import Flags
 from weblate.checks.models import CHECKS
 from weblate.formats.auto import try_load
 from weblate.formats.base import TranslationFormat, UnitNotFoundError
+from weblate.formats.exportcache import invalidate_export_cache
 from weblate.formats.helpers import CONTROLCHARS, NamedBytesIO
 from weblate.lang.models import Language, Plural
 from weblate.trans.checklists import TranslationChecklist
@@ -36,12 +38,13 @@ from weblate.trans.exceptions import (
 from weblate.trans.mixins import CacheKeyMixin, LoggerMixin, URLMixin
 from weblate.trans.models.change import Change
 from weblate.trans.models.suggestion import Suggestion
-from weblate.trans.models.unit import Unit
+from weblate.trans.models.unit import Unit, UnitSyncBatch
 from weblate.trans.models.variant import Variant
 from weblate.trans.signals import component_post_update, store_post_load, vcs_pre_commit
 from weblate.trans.util import is_plural, join_plural, split_plural
 from weblate.trans.validators import validate_check_flags
 from weblate.utils.errors import report_error
+from weblate.utils.lock import WeblateLockTimeoutError
 from weblate.utils.render import render_template
 from weblate.utils.site import get_site_url
 from weblate.utils.state import (
@@ -63,7 +66,15 @@ if TYPE_CHECKING:
 
 class TranslationManager(models.Manager):
     def check_sync(
-        self, component, lang, code, path, force=False, request=None, change=None
+        self,
+        component,
+        lang,
+        code,
+        path,
+        force=False,
+        request=None,
+        change=None,
+        store=None,
     ):
         """Parse translation meta info and updates translation object."""
         translation, _created = component.translation_set.get_or_create(
@@ -84,6 +95,9 @@ class TranslationManager(models.Manager):
             force = True
             translation.check_flags = flags
             translation.save(update_fields=["check_flags"])
+        if store is not None:
+            # Use store parsed in advance
+            translation.store = store
         translation.check_sync(force, request=request, change=change)
         return translation
 
@@ -169,7 +183,9 @@ class Translation(models.Model, URLMixin, LoggerMixin, CacheKeyMixin):
         self.addon_commit_files = []
         self.reason = ""
         self._invalidate_scheduled = False
+        self._invalidate_units: set[int] | None = set()
         self.update_changes = []
+        self.sync_batch: UnitSyncBatch | None = None
         # Project backup integration
         self.original_id = -1
 
@@ -365,6 +381,7 @@ class Translation(models.Model, URLMixin, LoggerMixin, CacheKeyMixin):
 
             # List of updated units (used for cleanup and duplicates detection)
             updated = {}
+            duplicates = []
 
             try:
                 store = self.store
@@ -393,6 +410,7 @@ class Translation(models.Model, URLMixin, LoggerMixin, CacheKeyMixin):
                     unit.id_hash: unit
                     for unit in self.unit_set.prefetch_bulk().select_for_update()
                 }
+                self.start_sync_batch()
 
                 # Process based on intermediate store if available
                 if self.component.intermediate:
@@ -425,29 +443,37 @@ class Translation(models.Model, URLMixin, LoggerMixin, CacheKeyMixin):
 
                     # Check for possible duplicate units
                     if id_hash in updated:
-                        newunit = updated[id_hash]
-                        self.log_warning(
-                            "duplicate string to translate: %s (%s)",
-                            newunit,
-                            repr(newunit.source),
-                        )
-                        self.component.trigger_alert(
-                            "DuplicateString",
-                            language_code=self.language.code,
-                            source=newunit.source,
-                            unit_pk=newunit.pk,
-                        )
+                        duplicates.append(updated[id_hash])
                         continue
 
                     self.sync_unit(dbunits, updated, id_hash, unit, pos + 1)
 
+                self.flush_sync_batch()
+
             except FileParseError as error:
                 report_error(
                     "Could not parse file on update", project=self.component.project
                 )
                 self.log_warning("skipping update due to parse error: %s", error)
+                self.flush_sync_batch()
                 self.store_update_changes()
                 return
+            finally:
+                # Discard batch not flushed due to an error
+                self.sync_batch = None
+
+            for newunit in duplicates:
+                self.log_warning(
+                    "duplicate string to translate: %s (%s)",
+                    newunit,
+                    repr(newunit.source),
+                )
+                self.component.trigger_alert(
+                    "DuplicateString",
+                    language_code=self.language.code,
+                    source=newunit.source,
+                    unit_pk=newunit.pk,
+                )
 
             # Delete stale units
             stale = set(dbunits) - set(updated)
@@ -482,6 +508,24 @@ class Translation(models.Model, URLMixin, LoggerMixin, CacheKeyMixin):
         if self.is_source:
             self.component.preload_sources(updated)
 
+    def start_sync_batch(self) -> None:
+        """
+        Batch database updates of units synced from the file.
+
+        The batch needs primary keys returned by bulk inserts and it bypasses
+        unit post-save signals, so it is not used when add-ons depend on them.
+        """
+        if (
+            connection.features.can_return_rows_from_bulk_insert
+            and not (self.component.addons_cache[AddonEvent.EVENT_UNIT_POST_SAVE])
+        ):
+            self.sync_batch = UnitSyncBatch(self)
+
+    def flush_sync_batch(self) -> None:
+        batch, self.sync_batch = self.sync_batch, None
+        if batch is not None:
+            batch.flush()
+
     def store_update_changes(self) -> None:
         # Save change
         Change.objects.bulk_create(self.update_changes, batch_size=500)
@@ -629,11 +673,11 @@ class Translation(models.Model, URLMixin, LoggerMixin, CacheKeyMixin):
         """Check whether there are some not committed changes."""
         return self.count_pending_units > 0
 
-    def repo_needs_merge(self):
-        return self.component.repo_needs_merge()
+    def repo_needs_merge(self, cached: bool = False):
+        return self.component.repo_needs_merge(cached=cached)
 
-    def repo_needs_push(self):
-        return self.component.repo_needs_push()
+    def repo_needs_push(self, cached: bool = False):
+        return self.component.repo_needs_push(cached=cached)
 
     @cached_property
     def filenames(self):
@@ -1281,11 +1325,34 @@ class Translation(models.Model, URLMixin, LoggerMixin, CacheKeyMixin):
 
     def _invalidate_triger(self) -> None:
         self._invalidate_scheduled = False
-        self.stats.update_stats()
+        unit_ids = self._invalidate_units
+        self._invalidate_units = set()
+        try:
+            if unit_ids is None or not self.stats.update_units(unit_ids):
+                self.stats.update_stats()
+        except WeblateLockTimeoutError:
+            # Stats are being updated concurrently, never fail the change
+            # because of that and recalculate them in the background
+            from weblate.utils.tasks import update_translation_stats
+
+            self.log_info("stats are locked, scheduling update")
+            update_translation_stats.delay(self.pk)
+        invalidate_export_cache(self)
         self.component.invalidate_glossary_cache()
 
-    def invalidate_cache(self) -> None:
-        """Invalidate any cached stats."""
+    def invalidate_cache(self, unit: Unit | None = None) -> None:
+        """
+        Invalidate any cached stats.
+
+        When the change is limited to a single string, it can be passed to
+        allow incremental update of the stats.
+        """
+        # Track changed strings, None means full update is needed
+        if unit is None:
+            self._invalidate_units = None
+        elif self._invalidate_units is not None:
+            self._invalidate_units.add(unit.pk)
+
         # Invalidate summary stats
         if self._invalidate_scheduled:
             return
@@ -1597,24 +1664,121 @@ class Translation(models.Model, URLMixin, LoggerMixin, CacheKeyMixin):
 
     @transaction.atomic
     def sync_terminology(self) -> None:
+        """Add terminology strings missing in the glossary translations."""
         if not self.is_source or not self.component.manage_units:
             return
-        expected_count = self.component.translation_set.count()
-        for source in self.component.get_all_sources():
-            # Is the string a terminology
-            if "terminology" not in source.all_flags:
-                continue
-            if source.unit_set.count() == expected_count:
-                continue
-            # Add unit
-            self.add_unit(
-                None,
-                source.context,
-                source.get_source_plurals(),
-                "",
-                is_batch_update=True,
-                skip_existing=True,
+        component = self.component
+        translations = list(
+            component.translation_set.exclude(pk=self.pk).select_related("language")
+        )
+        sources = {
+            source.id_hash: source
+            for source in component.get_all_sources()
+            if "terminology" in source.all_flags
+        }
+        if not translations or not sources:
+            return
+
+        # Find terminology strings not present in all translations
+        expected_count = len(translations) + 1
+        incomplete = {
+            id_hash
+            for id_hash, count in Unit.objects.filter(translation__component=component)
+            .values_list("id_hash")
+            .annotate(Count("id"))
+            .order_by()
+            if count < expected_count and id_hash in sources
+        }
+        if not incomplete:
+            return
+        existing = set(
+            Unit.objects.filter(
+                translation__in=translations, id_hash__in=incomplete
+            ).values_list("translation_id", "id_hash")
+        )
+
+        changes = []
+        for translation in translations:
+            missing = [
+                source
+                for id_hash, source in sources.items()
+                if id_hash in incomplete and (translation.pk, id_hash) not in existing
+            ]
+            if missing:
+                units = translation.create_terminology_units(missing)
+                changes.extend(
+                    unit.generate_change(
+                        user=None,
+                        author=None,
+                        change_action=Change.ACTION_NEW_UNIT,
+                        check_new=False,
+                        save=False,
+                    )
+                    for unit in units
+                )
+
+        Change.objects.bulk_create(changes, batch_size=500)
+        component.invalidate_cache()
+
+    def create_terminology_units(self, sources: list[Unit]) -> list[Unit]:
+        """
+        Create empty translations of the terminology source strings.
+
+        The units are stored in bulk and written to the file on the next commit
+        of pending changes.
+        """
+        pending = not self.component.has_template()
+        state = STATE_READONLY if "read-only" in self.all_flags else STATE_EMPTY
+        units = [
+            Unit(
+                translation=self,
+                context=source.context,
+                source=source.source,
+                target="",
+                state=state,
+                source_unit=source,
+                id_hash=source.id_hash,
+                position=position,
+                pending=pending,
+                details={"add_unit": True} if pending else {},
             )
+            for position, source in enumerate(sources, start=self.stats.all + 1)
+        ]
+        for unit in units:
+            unit.is_batch_update = True
+            unit.trigger_update_variants = False
+        try:
+            with transaction.atomic():
+                self.start_sync_batch()
+                try:
+                    for unit in units:
+                        if self.sync_batch is None:
+                            unit.save(force_insert=True, sync_terminology=False)
+                        else:
+                            self.sync_batch.add(
+                                unit, created=True, same_content=False, run_checks=True
+                            )
+                    self.flush_sync_batch()
+                finally:
+                    self.sync_batch = None
+        except IntegrityError:
+            # Concurrent sync has added some of the units, add remaining ones
+            return self.create_terminology_units_fallback(units)
+        return units
+
+    def create_terminology_units_fallback(self, units: list[Unit]) -> list[Unit]:
+        """Create units one by one, skipping already existing ones."""
+        created = []
+        for unit in units:
+            unit.pk = None
+            unit._state.adding = True
+            try:
+                with transaction.atomic():
+                    unit.save(force_insert=True, sync_terminology=False)
+            except IntegrityError:
+                continue
+            created.append(unit)
+        return created
 
     def validate_new_unit_data(
         self,
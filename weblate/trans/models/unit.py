@@ -5,6 +5,8 @@
 from __future__ import annotations
 
 import re
+from collections import defaultdict
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
 import sentry_sdk
@@ -12,7 +14,7 @@ from django.conf import settings
 from django.core.cache import cache
 from django.db import Error as DjangoDatabaseError
 from django.db import models, transaction
-from django.db.models import Count, Max, Q, Sum, Value
+from django.db.models import Count, F, Max, Q, Sum, Value
 from django.db.models.functions import MD5, Length, Lower
 from django.utils import timezone
 from django.utils.functional import cached_property
@@ -22,7 +24,10 @@ from pyparsing import ParseException
 from weblate.checks.flags import Flags
 from weblate.checks.models import CHECKS, Check
 from weblate.formats.helpers import CONTROLCHARS
-from weblate.memory.tasks import handle_unit_translation_change
+from weblate.memory.tasks import (
+    handle_unit_translation_change,
+    handle_units_translation_change,
+)
 from weblate.memory.utils import is_valid_memory_entry
 from weblate.trans.autofixes import fix_target
 from weblate.trans.mixins import LoggerMixin
@@ -55,9 +60,10 @@ from weblate.utils.state import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Callable, Generator
 
     from weblate.auth import User
+    from weblate.trans.models import Translation
 
 SIMPLE_FILTERS = {
     "fuzzy": {"state": STATE_FUZZY},
@@ -462,12 +468,12 @@ class Unit(models.Model, LoggerMixin):
         Wrapper around save to run checks or update fulltext.
         """
         # Store number of words
-        if not same_content or not self.num_words:
-            self.num_words = count_words(
-                self.source, self.translation.component.source_language.base_code
-            )
-            if update_fields and "num_words" not in update_fields:
-                update_fields.append("num_words")
+        if (
+            self.update_num_words(same_content)
+            and update_fields
+            and "num_words" not in update_fields
+        ):
+            update_fields.append("num_words")
 
         # Update last_updated timestamp
         if update_fields and "last_updated" not in update_fields:
@@ -483,6 +489,35 @@ class Unit(models.Model, LoggerMixin):
         if only_save:
             return
 
+        self.update_related(
+            created=force_insert,
+            run_checks=run_checks,
+            propagate_checks=propagate_checks,
+            sync_terminology=sync_terminology,
+        )
+
+    def get_absolute_url(self) -> str:
+        return f"{self.translation.get_translate_url()}?checksum={self.checksum}"
+
+    def update_num_words(self, same_content: bool = False) -> bool:
+        """Update number of words, returns whether it was updated."""
+        if same_content and self.num_words:
+            return False
+        self.num_words = count_words(
+            self.source, self.translation.component.source_language.base_code
+        )
+        return True
+
+    def update_related(
+        self,
+        *,
+        created: bool = False,
+        run_checks: bool = True,
+        propagate_checks: bool | None = None,
+        sync_terminology: bool = True,
+        batch: UnitSyncBatch | None = None,
+    ) -> None:
+        """Update checks, variants and terminology after saving the unit."""
         # Set source_unit for source units, this needs to be done after
         # having a primary key
         if self.is_source and not self.source_unit:
@@ -492,24 +527,22 @@ class Unit(models.Model, LoggerMixin):
 
         # Update checks if content or fuzzy flag has changed
         if run_checks:
-            self.run_checks(propagate_checks)
-        if self.is_source:
+            self.run_checks(propagate_checks, batch=batch)
+        # Newly created source units are not yet referenced from translations
+        if self.is_source and (batch is None or not created):
             self.source_unit_save()
 
         # Update manual variants
         if (
             self.old_unit["extra_flags"] != self.extra_flags
             or self.context != self.old_unit["context"]
-            or force_insert
+            or created
         ):
-            self.update_variants()
+            self.update_variants(batch=batch, created=created)
 
         # Update terminology
         if sync_terminology:
-            self.sync_terminology()
-
-    def get_absolute_url(self) -> str:
-        return f"{self.translation.get_translate_url()}?checksum={self.checksum}"
+            self.sync_terminology(batch=batch)
 
     def get_url_path(self):
         return (*self.translation.get_url_path(), str(self.pk))
@@ -600,7 +633,7 @@ class Unit(models.Model, LoggerMixin):
             if not self.is_batch_update:
                 self.translation.component.invalidate_cache()
 
-    def sync_terminology(self) -> None:
+    def sync_terminology(self, batch: UnitSyncBatch | None = None) -> None:
         try:
             unit_flags = Flags(self.flags)
         except ParseException:
@@ -608,10 +641,16 @@ class Unit(models.Model, LoggerMixin):
         new_flags = Flags(self.extra_flags, unit_flags)
 
         if "terminology" in new_flags:
-            self.translation.component.schedule_sync_terminology()
+            if batch is None:
+                self.translation.component.schedule_sync_terminology()
+            else:
+                batch.sync_terminology = True
 
-    def update_variants(self) -> None:
-        variants = self.defined_variants.all()
+    def update_variants(
+        self, batch: UnitSyncBatch | None = None, created: bool = False
+    ) -> None:
+        # Newly created unit can not define any variants yet
+        variants = [] if created else self.defined_variants.all()
         component = self.translation.component
         flags = self.all_flags
         new_variant = None
@@ -635,10 +674,13 @@ class Unit(models.Model, LoggerMixin):
 
         # Add new variant
         if new_variant:
-            variant = Variant.objects.get_or_create(
-                key=new_variant, component=component
-            )[0]
-            variant.defining_units.add(self)
+            if batch is None:
+                variant = Variant.objects.get_or_create(
+                    key=new_variant, component=component
+                )[0]
+                variant.defining_units.add(self)
+            else:
+                batch.variants[new_variant].append(self)
 
         # Update variant links
         if (
@@ -871,11 +913,14 @@ class Unit(models.Model, LoggerMixin):
         # Metadata update only, these do not trigger any actions in Weblate and
         # are display only
         if same_data and not same_metadata:
-            self.save(
-                same_content=True,
-                only_save=True,
-                update_fields=["location", "explanation", "note", "position"],
-            )
+            if translation.sync_batch is not None:
+                translation.sync_batch.add_metadata(self)
+            else:
+                self.save(
+                    same_content=True,
+                    only_save=True,
+                    update_fields=["location", "explanation", "note", "position"],
+                )
             return
 
         # Sanitize number of plurals
@@ -885,12 +930,46 @@ class Unit(models.Model, LoggerMixin):
         if created:
             unit_pre_create.send(sender=self.__class__, unit=self)
 
+        finish = partial(
+            self.finish_update_from_unit,
+            created=created,
+            same_source=same_source,
+            same_target=same_target,
+            same_data=same_data,
+            source_change=source_change,
+        )
+        if translation.sync_batch is not None:
+            # Save into database when flushing the batch
+            translation.sync_batch.add(
+                self,
+                created=created,
+                same_content=same_source and same_target,
+                run_checks=not same_source or not same_target or not same_state,
+                finish=finish,
+            )
+            return
+
         # Save into database
         self.save(
             force_insert=created,
             same_content=same_source and same_target,
             run_checks=not same_source or not same_target or not same_state,
         )
+        finish()
+
+    def finish_update_from_unit(
+        self,
+        *,
+        created: bool,
+        same_source: bool,
+        same_target: bool,
+        same_data: bool,
+        source_change: str,
+        batch: UnitSyncBatch | None = None,
+    ) -> None:
+        """Track changes of unit updated from the file, needs saved unit."""
+        translation = self.translation
+        component = translation.component
         # Track updated sources for source checks
         if translation.is_template:
             component.updated_sources[self.id] = self
@@ -923,7 +1002,7 @@ class Unit(models.Model, LoggerMixin):
 
         # Update translation memory if needed
         if created or not same_source or not same_target:
-            self.update_translation_memory()
+            self.update_translation_memory(batch=batch)
 
     def update_state(self) -> None:
         """
@@ -1143,7 +1222,7 @@ class Unit(models.Model, LoggerMixin):
             old_translated = self.translation.stats.translated
 
             # Update translation stats
-            self.translation.invalidate_cache()
+            self.translation.invalidate_cache(self)
 
             # Postpone completed translation detection
             detect_completed_translation.delay_on_commit(change.pk, old_translated)
@@ -1206,7 +1285,7 @@ class Unit(models.Model, LoggerMixin):
                 target=self.target,
             )
             # Invalidate stats
-            unit.translation.invalidate_cache()
+            unit.translation.invalidate_cache(unit)
 
     def generate_change(
         self,
@@ -1315,8 +1394,15 @@ class Unit(models.Model, LoggerMixin):
             if not comment.resolved and comment.unit_id == self.id
         ]
 
-    def run_checks(self, propagate: bool | None = None) -> None:  # noqa: C901
-        """Update checks for this unit."""
+    def run_checks(  # noqa: C901
+        self, propagate: bool | None = None, batch: UnitSyncBatch | None = None
+    ) -> None:
+        """
+        Update checks for this unit.
+
+        With batch, the check changes are stored in the database when the
+        batch is flushed.
+        """
         src = self.get_source_plurals()
         tgt = self.get_target_plurals()
 
@@ -1354,7 +1440,10 @@ class Unit(models.Model, LoggerMixin):
                         propagated_units |= check_obj.get_propagated_units(self)
 
         if create:
-            Check.objects.bulk_create(create, batch_size=500, ignore_conflicts=True)
+            if batch is None:
+                Check.objects.bulk_create(create, batch_size=500, ignore_conflicts=True)
+            else:
+                batch.create_checks.extend(create)
 
         # Propagate checks which need it (for example consistency)
         if propagate is not False and propagated_units:
@@ -1375,7 +1464,12 @@ class Unit(models.Model, LoggerMixin):
         # Delete no longer failing checks
         if old_checks:
             propagated_units = Unit.objects.none()
-            Check.objects.filter(unit=self, name__in=old_checks).delete()
+            if batch is None:
+                Check.objects.filter(unit=self, name__in=old_checks).delete()
+            else:
+                batch.delete_checks.extend(
+                    check.pk for check in self.all_checks if check.name in old_checks
+                )
             for check_name in old_checks:
                 try:
                     check_obj = CHECKS[check_name]
@@ -1394,7 +1488,7 @@ class Unit(models.Model, LoggerMixin):
                         for other in propagated_units:
                             other.check_set.filter(name=check_name).delete()
                             if other.translation != self.translation:
-                                other.translation.invalidate_cache()
+                                other.translation.invalidate_cache(other)
                             other.clear_checks_cache()
 
         # Trigger source checks on target check update (multiple failing checks)
@@ -1410,7 +1504,7 @@ class Unit(models.Model, LoggerMixin):
         self.clear_checks_cache()
 
         if not self.is_batch_update and (create or old_checks):
-            self.translation.invalidate_cache()
+            self.translation.invalidate_cache(self)
 
     def nearby(self, count):
         """Return list of nearby messages based on location."""
@@ -1768,7 +1862,7 @@ class Unit(models.Model, LoggerMixin):
 
     def invalidate_related_cache(self) -> None:
         # Invalidate stats counts
-        self.translation.invalidate_cache()
+        self.translation.invalidate_cache(self)
         # Invalidate unit cached properties
         for key in ["all_comments", "suggestions"]:
             if key in self.__dict__:
@@ -1806,7 +1900,9 @@ class Unit(models.Model, LoggerMixin):
     def glossary_sort_key(self):
         return (self.translation.component.priority, self.source.lower())
 
-    def update_translation_memory(self, user_id: int | None = None) -> None:
+    def update_translation_memory(
+        self, user_id: int | None = None, batch: UnitSyncBatch | None = None
+    ) -> None:
         translation = self.translation
         component = translation.component
         if (
@@ -1815,4 +1911,130 @@ class Unit(models.Model, LoggerMixin):
             and not component.is_glossary
             and is_valid_memory_entry(source=self.source, target=self.target)
         ):
-            handle_unit_translation_change.delay_on_commit(self.id, user_id)
+            if batch is None:
+                handle_unit_translation_change.delay_on_commit(self.id, user_id)
+            else:
+                batch.memory_units.append(self.id)
+
+
+class UnitSyncBatch:
+    """
+    Batched database updates of units synced from the translation file.
+
+    Units are saved using bulk queries, checks are created and deleted at
+    once and variants and terminology are updated in a single step.
+    """
+
+    # Fields modified by Unit.update_from_unit
+    fields = [
+        "original_state",
+        "position",
+        "location",
+        "explanation",
+        "flags",
+        "source",
+        "target",
+        "state",
+        "context",
+        "note",
+        "previous_source",
+        "pending",
+        "priority",
+        "num_words",
+        "source_unit",
+        "last_updated",
+    ]
+    metadata_fields = [
+        "location",
+        "explanation",
+        "note",
+        "position",
+        "num_words",
+        "last_updated",
+    ]
+
+    def __init__(self, translation: Translation) -> None:
+        self.translation = translation
+        self.created: list[Unit] = []
+        self.updated: list[Unit] = []
+        self.metadata: list[Unit] = []
+        self.related: list[tuple[Unit, bool, bool, Callable | None]] = []
+        self.create_checks: list[Check] = []
+        self.delete_checks: list[int] = []
+        self.variants: dict[str, list[Unit]] = defaultdict(list)
+        self.sync_terminology = False
+        self.memory_units: list[int] = []
+
+    def add(
+        self,
+        unit: Unit,
+        *,
+        created: bool,
+        same_content: bool,
+        run_checks: bool,
+        finish: Callable | None = None,
+    ) -> None:
+        unit.update_num_words(same_content)
+        if created:
+            self.created.append(unit)
+        else:
+            self.updated.append(unit)
+        self.related.append((unit, created, run_checks, finish))
+
+    def add_metadata(self, unit: Unit) -> None:
+        unit.update_num_words(same_content=True)
+        self.metadata.append(unit)
+
+    def flush_created(self) -> None:
+        Unit.objects.bulk_create(self.created, batch_size=500)
+        # Link source units to itself
+        sources = [unit for unit in self.created if unit.source_unit_id is None]
+        if sources:
+            Unit.objects.filter(pk__in=[unit.pk for unit in sources]).update(
+                source_unit=F("pk")
+            )
+            for unit in sources:
+                unit.source_unit = unit
+        # Newly created units have no checks, avoid fetching them
+        for unit in self.created:
+            unit.__dict__["all_checks"] = []
+
+    def flush(self) -> None:
+        """Store all changes in the database."""
+        component = self.translation.component
+        if self.created:
+            self.flush_created()
+
+        now = timezone.now()
+        for unit in self.updated:
+            unit.last_updated = now
+        for unit in self.metadata:
+            unit.last_updated = now
+        if self.updated:
+            Unit.objects.bulk_update(self.updated, self.fields, batch_size=500)
+        if self.metadata:
+            Unit.objects.bulk_update(
+                self.metadata, self.metadata_fields, batch_size=500
+            )
+
+        # Calculate checks, variants and terminology
+        for unit, created, run_checks, _finish in self.related:
+            unit.update_related(created=created, run_checks=run_checks, batch=self)
+        if self.delete_checks:
+            Check.objects.filter(pk__in=self.delete_checks).delete()
+        if self.create_checks:
+            Check.objects.bulk_create(
+                self.create_checks, batch_size=500, ignore_conflicts=True
+            )
+        for key, units in self.variants.items():
+            variant = Variant.objects.get_or_create(key=key, component=component)[0]
+            variant.defining_units.add(*units)
+        if self.sync_terminology:
+            component.schedule_sync_terminology()
+
+        # Track changes
+        for _unit, _created, _run_checks, finish in self.related:
+            if finish is not None:
+                finish(batch=self)
+        if self.memory_units:
+            handle_units_translation_change.delay_on_commit(self.memory_units)
@@ -0,0 +1,152 @@
+# Copyright © Michal Čihař <michal@weblate.org>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Storage of unit search results.
+
+Results are stored in the cache as arrays of unit IDs split into fixed-size
+chunks, so that looking up a single position fetches only a single chunk.
+The key is derived from the content, so users getting the same results share
+the stored data while keeping their positions stable when the results change
+for others.
+"""
+
+from __future__ import annotations
+
+import time
+from array import array
+from hashlib import sha256
+from typing import overload
+
+from django.core.cache import cache
+
+SEARCH_RESULTS_TTL = 1800
+SEARCH_RESULTS_CHUNK = 1000
+
+
+class SearchResults:
+    """Ordered unit IDs matching a search."""
+
+    def __init__(
+        self, key: str, count: int, chunks: dict[int, array] | None = None
+    ) -> None:
+        self.key = key
+        self.count = count
+        self.chunks: dict[int, array] = chunks or {}
+
+    @staticmethod
+    def get_meta_key(key: str) -> str:
+        return f"search-results-{key}"
+
+    def get_chunk_key(self, chunk: int) -> str:
+        return f"search-results-{self.key}-{chunk}"
+
+    @classmethod
+    def create(cls, ids: list[int], store: bool = True) -> SearchResults:
+        data = array("q", ids)
+        chunks = {
+            chunk: data[start : start + SEARCH_RESULTS_CHUNK]
+            for chunk, start in enumerate(range(0, len(data), SEARCH_RESULTS_CHUNK))
+        }
+        result = cls(sha256(data.tobytes()).hexdigest(), len(data), chunks)
+        if store:
+            result.store()
+        return result
+
+    @classmethod
+    def load(cls, key: str) -> SearchResults | None:
+        """Load stored results, returns None if these have expired."""
+        meta = cache.get(cls.get_meta_key(key))
+        if meta is None:
+            return None
+        result = cls(key, meta["count"])
+        if meta["stored"] < time.time() - SEARCH_RESULTS_TTL / 2:
+            # Extend expiry of used results
+            result.touch()
+        return result
+
+    def store(self) -> None:
+        data = {
+            self.get_chunk_key(chunk): value.tobytes()
+            for chunk, value in self.chunks.items()
+        }
+        # Store meta last so that it does not outlive the chunks
+        data[self.get_meta_key(self.key)] = {
+            "count": self.count,
+            "stored": time.time(),
+        }
+        cache.set_many(data, SEARCH_RESULTS_TTL)
+
+    def touch(self) -> None:
+        for chunk in range(self.num_chunks):
+            cache.touch(self.get_chunk_key(chunk), SEARCH_RESULTS_TTL)
+        cache.set(
+            self.get_meta_key(self.key),
+            {"count": self.count, "stored": time.time()},
+            SEARCH_RESULTS_TTL,
+        )
+
+    @property
+    def num_chunks(self) -> int:
+        return -(-self.count // SEARCH_RESULTS_CHUNK)
+
+    def load_chunks(self, start: int, stop: int) -> bool:
+        """
+        Fetch chunks covering given positions.
+
+        Returns False if some of them are not available.
+        """
+        start = max(0, start)
+        stop = min(self.count, stop)
+        if start >= stop:
+            return True
+        wanted = [
+            chunk
+            for chunk in range(
+                start // SEARCH_RESULTS_CHUNK,
+                (stop - 1) // SEARCH_RESULTS_CHUNK + 1,
+            )
+            if chunk not in self.chunks
+        ]
+        if not wanted:
+            return True
+        keys = {self.get_chunk_key(chunk): chunk for chunk in wanted}
+        for key, value in cache.get_many(keys).items():
+            chunk = array("q")
+            chunk.frombytes(value)
+            self.chunks[keys[key]] = chunk
+        return all(chunk in self.chunks for chunk in wanted)
+
+    def __len__(self) -> int:
+        return self.count
+
+    @overload
+    def __getitem__(self, item: int) -> int: ...
+
+    @overload
+    def __getitem__(self, item: slice) -> list[int]: ...
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            start, stop, step = item.indices(self.count)
+            if not self.load_chunks(start, stop):
+                raise IndexError("Search results have expired")
+            return [self[position] for position in range(start, stop, step)]
+        if item < 0:
+            item += self.count
+        if not 0 <= item < self.count or not self.load_chunks(item, item + 1):
+            raise IndexError("Search result out of range")
+        chunk, position = divmod(item, SEARCH_RESULTS_CHUNK)
+        return self.chunks[chunk][position]
+
+    def index(self, value: int) -> int:
+        """Return position of the unit ID, raises ValueError if not found."""
+        if not self.load_chunks(0, self.count):
+            raise ValueError("Search results have expired")
+        for chunk in range(self.num_chunks):
+            try:
+                return chunk * SEARCH_RESULTS_CHUNK + self.chunks[chunk].index(value)
+            except ValueError:
+                continue
+        raise ValueError(f"{value} is not in search results")
@@ -25,6 +25,8 @@ from django.utils.translation import gettext, ngettext, override
 
 from weblate.addons.models import Addon
 from weblate.auth.models import User, get_anonymous
+from weblate.checks.parallel import ChecksUpdater
+from weblate.formats.exportcache import cleanup_export_cache
 from weblate.lang.models import Language
 from weblate.logger import LOGGER
 from weblate.machinery.base import MachineTranslationError
@@ -580,19 +582,21 @@ def update_checks(pk: int, update_token: str, update_state: bool = False) -> Non
     if latest_token and update_token != latest_token:
         return
 
-    component.batch_checks = True
-    # Source translation as last
-    translations = (
-        *component.translation_set.exclude(
-            pk=component.source_translation.pk
-        ).prefetch(),
-        component.source_translation,
+    def report_progress(done: int, total: int) -> None:
+        if current_task and current_task.request.id:
+            current_task.update_state(
+                state="PROGRESS",
+                meta={"progress": 100 * done // total, "component": component.pk},
+            )
+
+    component.start_batched_checks()
+    updater = ChecksUpdater(
+        jobs=settings.CHECK_PROCESSES,
+        update_state=update_state,
+        progress=report_progress,
     )
-    for translation in translations:
-        for unit in translation.unit_set.prefetch().prefetch_all_checks():
-            if update_state:
-                unit.update_state()
-            unit.run_checks()
+    batched_checks = updater.update(list(component.translation_set.prefetch()))
+    component.batched_checks.update(batched_checks.get(component.pk, ()))
     component.run_batched_checks()
     component.invalidate_cache()
 
@@ -683,6 +687,11 @@ def cleanup_project_backup_download() -> None:
             staticfiles_storage.delete(full_name)
 
 
+@app.task(trail=False)
+def cleanup_exports() -> None:
+    cleanup_export_cache(settings.WEBLATE_EXPORT_CACHE_SIZE)
+
+
 @app.task(trail=False)
 def detect_completed_translation(change_id: int, old_translated: int) -> None:
     change = Change.objects.get(pk=change_id)
@@ -737,3 +746,4 @@ def setup_periodic_tasks(sender, **kwargs) -> None:
         cleanup_project_backup_download.s(),
         name="cleanup-project-backup-download",
     )
+    sender.add_periodic_task(3600, cleanup_exports.s(), name="cleanup-exports")
@@ -4,9 +4,12 @@
 
 """Tests for changes browsing."""
 
+from datetime import timedelta
+
 from django.urls import reverse
+from django.utils import timezone
 
-from weblate.trans.models import Unit
+from weblate.trans.models import Change, Unit
 from weblate.trans.tests.test_views import ViewTestCase
 
 
@@ -57,3 +60,21 @@ class ChangesTest(ViewTestCase):
         response = self.client.get(reverse("changes"), {"user": self.user.username})
         self.assertContains(response, "Translation added")
         self.assertNotContains(response, "Invalid search string!")
+
+    def test_count_stats(self) -> None:
+        now = timezone.now()
+        changes = Change.objects.filter(project=self.project)
+        total = changes.count()
+        # Move some changes to the past
+        Change.objects.filter(pk=changes[0].pk).update(
+            timestamp=now - timedelta(days=5)
+        )
+        with self.assertNumQueries(1):
+            result = changes.count_stats(10, 2, now - timedelta(days=9))
+        self.assertEqual(len(result), 5)
+        self.assertEqual([count for _start, count in result], [0, 0, 1, 0, total - 1])
+        today = timezone.localtime(now).date()
+        self.assertEqual(
+            changes.count_daily(today - timedelta(days=5), today),
+            {today - timedelta(days=5): 1, today: total - 1},
+        )
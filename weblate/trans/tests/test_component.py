@@ -5,16 +5,20 @@
 """Test for translation models."""
 
 import os
+from unittest.mock import patch
 
 from django.core.exceptions import ValidationError
+from django.test import TransactionTestCase
 from django.test.utils import override_settings
 
 from weblate.checks.models import Check
+from weblate.formats.parallel import parse_stores
 from weblate.lang.models import Language
 from weblate.trans.exceptions import FileParseError
-from weblate.trans.models import Change, Component, Project, Unit
+from weblate.trans.models import Change, Component, Project, Translation, Unit
 from weblate.trans.tests.test_models import RepoTestCase
 from weblate.trans.tests.test_views import ViewTestCase
+from weblate.trans.tests.utils import RepoTestMixin
 from weblate.utils.files import remove_tree
 from weblate.utils.state import STATE_EMPTY, STATE_READONLY, STATE_TRANSLATED
 
@@ -184,6 +188,37 @@ class ComponentTest(RepoTestCase):
         component = self.create_po_mono()
         self.verify_component(component, 4, "cs", 4)
 
+    def test_create_unchanged(self) -> None:
+        component = self.create_component()
+        # Nothing is parsed when files did not change
+        with patch.object(Translation, "check_sync") as check_sync:
+            self.assertFalse(component.create_translations())
+            check_sync.assert_not_called()
+        # Consistency checks are not left deferred
+        self.assertFalse(component.batch_checks)
+        # File change triggers update
+        translation = component.translation_set.get(language_code="cs")
+        with open(translation.get_filename(), "a") as handle:
+            handle.write("\n")
+        with patch.object(Translation, "check_sync") as check_sync:
+            component.create_translations()
+            check_sync.assert_called()
+        # Forced update always parses files
+        with patch.object(Translation, "check_sync") as check_sync:
+            component.create_translations(force=True)
+            check_sync.assert_called()
+
+    def test_create_unchanged_linked(self) -> None:
+        component = self.create_link()
+        parent = component.linked_component
+        # Forced update reaches linked components
+        with patch.object(Translation, "check_sync", autospec=True) as check_sync:
+            parent.create_translations(force=True)
+        self.assertIn(
+            component.pk,
+            {call.args[0].component_id for call in check_sync.call_args_list},
+        )
+
     def test_create_android(self) -> None:
         component = self.create_android()
         self.verify_component(component, 2, "cs", 4)
@@ -459,6 +494,37 @@ class ComponentTest(RepoTestCase):
         self.assertEqual(Check.objects.count(), 0)
 
 
+@override_settings(PARSE_PROCESSES=2)
+class ComponentParallelTest(TransactionTestCase, RepoTestMixin):
+    """Parsing using worker processes, these can not run in a transaction."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.clone_test_repos()
+
+    def test_create_parallel(self) -> None:
+        with patch(
+            "weblate.trans.models.component.parse_stores", wraps=parse_stores
+        ) as mocked:
+            component = self.create_component()
+        mocked.assert_called()
+        ComponentTest.verify_component(self, component, 4, "cs", 4)
+        unit = Unit.objects.get(
+            source="Hello, world!\n", translation__language__code="cs"
+        )
+        self.assertEqual(unit.state, STATE_EMPTY)
+        # Forced rescan should not change anything
+        units = set(Unit.objects.values_list("id", "id_hash", "state", "target"))
+        component.create_translations(force=True)
+        self.assertEqual(
+            set(Unit.objects.values_list("id", "id_hash", "state", "target")), units
+        )
+
+    def test_create_po_mono_parallel(self) -> None:
+        component = self.create_po_mono()
+        ComponentTest.verify_component(self, component, 4, "cs", 4)
+
+
 class AutoAddonTest(RepoTestCase):
     CREATE_GLOSSARIES = True
 
@@ -7,7 +7,9 @@
 import time
 from typing import NoReturn
 from unittest import SkipTest
+from unittest.mock import patch
 
+from django.core.cache import cache
 from django.urls import reverse
 
 from weblate.addons.resx import ResxUpdateAddon
@@ -911,6 +913,29 @@ class EditComplexTest(ViewTestCase):
         self.assertFalse(self.component.repo_needs_push())
         self.assertFalse(self.component.project.repo_needs_push())
 
+    def test_repo_status(self) -> None:
+        self.edit_unit("Hello, world!\n", "Nazdar svete!\n")
+        self.translation.commit_pending("test", self.user)
+
+        # Commit only invalidates the snapshot, it is calculated on first use
+        self.assertIsNone(cache.get(self.component.repo_status_cache_key))
+        component = Component.objects.get(pk=self.component.pk)
+        self.assertEqual(component.repo_status["outgoing"], 1)
+
+        # The snapshot is used without executing VCS commands
+        component = Component.objects.get(pk=self.component.pk)
+        with patch.object(
+            component.repository_class, "count_outgoing", side_effect=RuntimeError
+        ):
+            self.assertEqual(component.repo_status["outgoing"], 1)
+            self.assertTrue(component.repo_needs_push(cached=True))
+            self.assertFalse(component.repo_needs_merge(cached=True))
+
+        self.component.do_push(self.get_request())
+        component = Component.objects.get(pk=self.component.pk)
+        self.assertEqual(component.repo_status["outgoing"], 0)
+        self.assertFalse(component.project.repo_needs_push(cached=True))
+
     def test_edit_locked(self) -> None:
         self.component.locked = True
         self.component.save()
@@ -4,16 +4,21 @@
 
 """Test for import and export."""
 
+import os
 from io import BytesIO
+from unittest.mock import patch
 
 from django.contrib.messages import ERROR
 from django.test import SimpleTestCase
+from django.test.utils import override_settings
 from django.urls import reverse
 from openpyxl import load_workbook
 
+from weblate.formats.exportcache import cleanup_export_cache, get_export_cache_dir
+from weblate.formats.exporters import CSVExporter, PoExporter
 from weblate.formats.helpers import NamedBytesIO
 from weblate.trans.forms import SimpleUploadForm
-from weblate.trans.models import Change, ComponentList
+from weblate.trans.models import Change, Comment, ComponentList
 from weblate.trans.tests.test_views import ViewTestCase
 from weblate.trans.tests.utils import get_test_file
 
@@ -520,6 +525,54 @@ class ExportTest(ViewTestCase):
         response = self.export_format("invalid")
         self.assertEqual(response.status_code, 302)
 
+    def test_export_cached(self) -> None:
+        response = self.export_format("po")
+        self.assert_response_contains(response, self.target)
+
+        # The unchanged translation is not exported again
+        with patch.object(PoExporter, "add_units", side_effect=RuntimeError):
+            response = self.export_format("po")
+        self.assert_response_contains(response, self.target)
+
+        self.edit_unit(self.source, "Ahoj svete!\n")
+        response = self.export_format("po")
+        self.assert_response_contains(response, "Ahoj svete!")
+
+        # Comments are included in the export
+        unit = self.get_unit(self.source)
+        Comment.objects.create(unit=unit, user=self.user, comment="Check this")
+        response = self.export_format("po")
+        self.assert_response_contains(response, "Check this")
+
+    def test_export_cache_cleanup(self) -> None:
+        self.export_format("po")
+        cache_dir = get_export_cache_dir()
+        stale = os.path.join(cache_dir, ".export-stale")
+        pending = os.path.join(cache_dir, ".export-pending")
+        for filename in (stale, pending):
+            with open(filename, "wb") as handle:
+                handle.write(b"x")
+        os.utime(stale, (0, 0))
+
+        # Interrupted exports are removed, exports being written are kept
+        cleanup_export_cache(0)
+        self.assertFalse(os.path.exists(stale))
+        self.assertTrue(os.path.exists(pending))
+        # Exports over the limit are removed
+        self.assertEqual(
+            [name for name in os.listdir(cache_dir) if not name.startswith(".")], []
+        )
+        os.unlink(pending)
+
+    @override_settings(WEBLATE_EXPORT_CACHE_SIZE=0)
+    def test_export_not_cached(self) -> None:
+        self.export_format("po")
+        with (
+            patch.object(PoExporter, "add_units", side_effect=RuntimeError),
+            self.assertRaises(RuntimeError),
+        ):
+            self.export_format("po")
+
 
 class ExportMultifileTest(ExportTest):
     source = "Weblate - continuous localization"
@@ -687,6 +740,15 @@ class DownloadMultiTest(ViewTestCase):
         content = self.assert_zip(response, "test-test-cs.xlsx")
         load_workbook(BytesIO(content))
 
+    @override_settings(WEBLATE_EXPORT_CACHE_SIZE=0)
+    def test_component_csv_failed(self) -> None:
+        with patch.object(CSVExporter, "add_units", side_effect=RuntimeError("Boom")):
+            response = self.client.get(
+                reverse("download", kwargs=self.kw_component), {"format": "zip:csv"}
+            )
+            content = self.assert_zip(response, "test-test-cs.csv.failed")
+        self.assertEqual(content, b"File conversion failed: Boom")
+
 
 EXPECTED_CSV = """location,source,target,id,fuzzy,context,translator_comments,developer_comments\r
 ,"Hello, world!
@@ -715,7 +777,7 @@ class ImportExportAddTest(ViewTestCase):
             reverse("download", kwargs=self.kw_translation),
             {"format": "csv"},
         )
-        self.assertEqual(response.content.decode(), EXPECTED_CSV)
+        self.assertEqual(response.getvalue().decode(), EXPECTED_CSV)
 
         handle = NamedBytesIO("test.csv", UPLOAD_CSV.encode())
         params = {
@@ -738,7 +800,8 @@ class ImportExportAddTest(ViewTestCase):
             {"format": "csv"},
         )
         self.assertEqual(
-            response.content.decode(), EXPECTED_CSV.replace("Hello, world", "Hi, World")
+            response.getvalue().decode(),
+            EXPECTED_CSV.replace("Hello, world", "Hi, World"),
         )
 
         handle = NamedBytesIO(
@@ -5,9 +5,12 @@
 """Test for translation models."""
 
 import os
+from unittest.mock import patch
 
+from django.core.cache import cache
 from django.core.management.color import no_style
 from django.db import connection, transaction
+from django.db.models import F
 from django.test import LiveServerTestCase, TestCase
 from django.test.utils import override_settings
 
@@ -22,13 +25,16 @@ from weblate.trans.models import (
     ComponentList,
     Project,
     Suggestion,
+    Translation,
     Unit,
     Vote,
 )
 from weblate.trans.tests.utils import RepoTestMixin, create_test_user
 from weblate.utils.django_hacks import immediate_on_commit, immediate_on_commit_leave
 from weblate.utils.files import remove_tree
+from weblate.utils.lock import WeblateLockTimeoutError
 from weblate.utils.state import STATE_TRANSLATED
+from weblate.utils.stats import UNIT_STATS_SHARDS
 
 
 def fixup_languages_seq() -> None:
@@ -207,6 +213,83 @@ class TranslationTest(RepoTestCase):
         self.assertEqual(translation.stats.all, 0)
         self.assertEqual(translation.stats.all_words, 0)
 
+    def test_incremental_stats(self) -> None:
+        component = self.create_component()
+        translation = component.translation_set.get(language_code="cs")
+        user = create_test_user()
+        # Calculate stats for translation and parents
+        self.assertEqual(translation.stats.translated, 0)
+        component_translated = component.stats.translated
+        project_translated = component.project.stats.translated
+        unit = translation.unit_set.get(source="Hello, world!\n")
+        unit.translate(user, "Nazdar svete!\n", STATE_TRANSLATED)
+        translation = component.translation_set.get(language_code="cs")
+        self.assertEqual(translation.stats.translated, 1)
+        self.assertEqual(translation.stats.translated_words, unit.num_words)
+        self.assertEqual(translation.stats.todo, 3)
+        component = Component.objects.get(pk=component.pk)
+        self.assertEqual(component.stats.translated, component_translated + 1)
+        self.assertEqual(component.stats.source_strings, 4)
+        self.assertEqual(component.project.stats.translated, project_translated + 1)
+        # Incremental stats should match full calculation
+        self.assertEqual(translation.stats.verify_stats(), set())
+
+        # Only the shard with the changed string is needed
+        unit = translation.unit_set.get(source="Thank you for using Weblate.")
+        shard = unit.pk % UNIT_STATS_SHARDS
+        cache.delete(
+            translation.stats.get_units_cache_key((shard + 1) % UNIT_STATS_SHARDS)
+        )
+        self.assertTrue(translation.stats.update_units({unit.pk}))
+        # Missing shard triggers full calculation
+        cache.delete(translation.stats.get_units_cache_key(shard))
+        self.assertFalse(translation.stats.update_units({unit.pk}))
+
+    def test_incremental_stats_locked(self) -> None:
+        component = self.create_component()
+        translation = component.translation_set.get(language_code="cs")
+        self.assertEqual(translation.stats.translated, 0)
+        unit = translation.unit_set.get(source="Hello, world!\n")
+        # Locked stats do not fail the edit and are updated in the background
+        with (
+            patch(
+                "weblate.utils.stats.TranslationStats.update_units",
+                side_effect=WeblateLockTimeoutError,
+            ),
+            patch("weblate.utils.tasks.update_translation_stats.delay") as delay,
+        ):
+            unit.translate(create_test_user(), "Nazdar svete!\n", STATE_TRANSLATED)
+        delay.assert_called_once_with(translation.pk)
+
+    def test_sync_batch(self) -> None:
+        component = self.create_component()
+        self.assertFalse(
+            component.source_translation.unit_set.exclude(source_unit=F("pk")).exists()
+        )
+        translation = component.translation_set.get(language_code="cs")
+        self.assertFalse(translation.unit_set.filter(source_unit=None).exists())
+
+        def get_state():
+            return (
+                set(
+                    translation.unit_set.values_list(
+                        "id_hash", "state", "target", "num_words", "position"
+                    )
+                ),
+                set(
+                    Check.objects.filter(unit__translation=translation).values_list(
+                        "unit__id_hash", "name"
+                    )
+                ),
+            )
+
+        batched = get_state()
+        # Loading without batching should give same results
+        translation.unit_set.all().delete()
+        with patch.object(Translation, "start_sync_batch"):
+            translation.check_sync(force=True)
+        self.assertEqual(get_state(), batched)
+
     def test_commit_groupping(self) -> None:
         component = self.create_component()
         translation = component.translation_set.get(language_code="cs")
@@ -3,10 +3,13 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from datetime import timedelta
+from importlib import import_module
 
+from django.apps import apps
 from django.urls import reverse
 from django.utils import timezone
 
+from weblate.trans.models import Change
 from weblate.trans.tests.test_views import ViewTestCase
 from weblate.trans.views.reports import generate_counts, generate_credits
 
@@ -118,6 +121,31 @@ class ReportsTest(BaseReportsTest):
         )
         self.assertEqual(data, COUNTS_DATA)
 
+    def test_counts_legacy(self) -> None:
+        self.add_change()
+        # Changes created before storing the counts
+        for change in Change.objects.filter(details__has_key="words"):
+            del change.details["words"]
+            del change.details["distance"]
+            change.save(update_fields=["details"])
+        # Filled in by the data migration
+        migration = import_module("weblate.trans.migrations.0019_change_work_counts")
+        migration.store_work_counts(apps, None)
+        data = generate_counts(
+            None,
+            timezone.now() - timedelta(days=1),
+            timezone.now() + timedelta(days=1),
+            "",
+            component=self.component,
+        )
+        self.assertEqual(data, COUNTS_DATA)
+        self.assertFalse(
+            Change.objects.content()
+            .filter(unit__isnull=False)
+            .exclude(details__has_key="words")
+            .exists()
+        )
+
 
 class ReportsComponentTest(BaseReportsTest):
     def get_kwargs(self):
@@ -168,6 +196,17 @@ class ReportsComponentTest(BaseReportsTest):
             "</tbody></table>",
         )
 
+    def test_credits_view_csv(self) -> None:
+        response = self.get_credits("csv")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.content.decode().splitlines(),
+            [
+                "Language,Email,Name,Count",
+                "Czech,weblate@example.org,Weblate <b>Test</b>,1",
+            ],
+        )
+
     def get_counts(self, style, **kwargs):
         self.add_change()
         params = {
@@ -209,6 +248,20 @@ class ReportsComponentTest(BaseReportsTest):
         self.assertEqual(response.status_code, 200)
         self.assertJSONEqual(response.content.decode(), COUNTS_DATA)
 
+    def test_counts_view_csv(self) -> None:
+        response = self.get_counts("csv")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["Content-Type"], "text/csv; charset=utf-8")
+        content = b"".join(response.streaming_content).decode()
+        lines = content.splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(lines[0].startswith("Name,Email,Count total,"))
+        self.assertEqual(
+            lines[1],
+            "Weblate <b>Test</b>,weblate@example.org,"
+            "1,14,2,14,2,14,1,14,2,14,2,14,0,0,0,0,0,0,0,0,0,0,0,0",
+        )
+
     def test_counts_view_rst(self) -> None:
         response = self.get_counts("rst")
         self.assertEqual(response.status_code, 200)
@@ -0,0 +1,58 @@
+# Copyright © Michal Čihař <michal@weblate.org>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from weblate.trans.searchresults import SearchResults
+
+
+@patch("weblate.trans.searchresults.SEARCH_RESULTS_CHUNK", 3)
+class SearchResultsTest(SimpleTestCase):
+    def setUp(self) -> None:
+        cache.clear()
+
+    def test_store(self) -> None:
+        stored = SearchResults.create(list(range(10, 20)))
+        results = SearchResults.load(stored.key)
+        self.assertIsNotNone(results)
+        self.assertEqual(len(results), 10)
+        self.assertEqual(results[0], 10)
+        self.assertEqual(results[-1], 19)
+        # Only the needed chunk is fetched
+        self.assertEqual(set(results.chunks), {0, 3})
+        self.assertEqual(results[2:7], [12, 13, 14, 15, 16])
+        self.assertEqual(results[8:100], [18, 19])
+        self.assertEqual(results.index(15), 5)
+        with self.assertRaises(IndexError):
+            results[10]
+        with self.assertRaises(ValueError):
+            results.index(1)
+
+    def test_shared(self) -> None:
+        first = SearchResults.create([1, 2, 3])
+        self.assertEqual(SearchResults.create([1, 2, 3]).key, first.key)
+        self.assertNotEqual(SearchResults.create([1, 2]).key, first.key)
+
+    def test_not_stored(self) -> None:
+        results = SearchResults.create([1, 2, 3, 4], store=False)
+        self.assertIsNone(SearchResults.load(results.key))
+        self.assertEqual(results[1:], [2, 3, 4])
+
+    def test_expired(self) -> None:
+        stored = SearchResults.create(list(range(10)))
+        cache.delete(stored.get_chunk_key(1))
+        results = SearchResults.load(stored.key)
+        self.assertTrue(results.load_chunks(0, 3))
+        self.assertFalse(results.load_chunks(0, 6))
+        with self.assertRaises(ValueError):
+            results.index(9)
+
+    def test_empty(self) -> None:
+        stored = SearchResults.create([])
+        results = SearchResults.load(stored.key)
+        self.assertEqual(len(results), 0)
+        self.assertEqual(results[0:20], [])
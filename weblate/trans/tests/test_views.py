@@ -214,7 +214,7 @@ class ViewTestCase(RepoTestCase):
     def assert_zip(self, response, filename: str | None = None):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response["Content-Type"], "application/zip")
-        with ZipFile(BytesIO(response.content), "r") as zipfile:
+        with ZipFile(BytesIO(response.getvalue()), "r") as zipfile:
             self.assertIsNone(zipfile.testzip())
             if filename is not None:
                 self.assertIn(filename, zipfile.namelist())
@@ -229,7 +229,11 @@ class ViewTestCase(RepoTestCase):
             "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
             "; charset=utf-8",
         )
-        load_workbook(BytesIO(response.content))
+        if response.streaming:
+            content = b"".join(response.streaming_content)
+        else:
+            content = response.content
+        load_workbook(BytesIO(content))
 
     def assert_svg(self, response) -> None:
         """Check whether response is a SVG image."""
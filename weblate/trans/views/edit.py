@@ -46,6 +46,7 @@ from weblate.trans.forms import (
     get_new_unit_form,
 )
 from weblate.trans.models import Change, Comment, Suggestion, Translation, Unit, Vote
+from weblate.trans.searchresults import SEARCH_RESULTS_TTL, SearchResults
 from weblate.trans.tasks import auto_translate
 from weblate.trans.templatetags.translations import (
     try_linkify_filename,
@@ -67,7 +68,8 @@ from weblate.utils.views import (
     show_form_errors,
 )
 
-SESSION_SEARCH_CACHE_TTL = 1800
+# Number of units shown at once in zen mode
+ZEN_SECTION = 20
 
 
 def display_fixups(request, fixups) -> None:
@@ -249,9 +251,18 @@ def search(
 
         session_data = request.session.get(session_key)
         if use_cache and session_data and "offset" in request.GET:
-            search_result.update(request.session[session_key])
-            request.session[session_key]["ttl"] = now + SESSION_SEARCH_CACHE_TTL
-            return search_result
+            results = None
+            if "results" in session_data:
+                results = SearchResults.load(session_data["results"])
+            # Fetch results around the position, zen mode shows a section
+            offset = search_result["offset"]
+            if results is not None and results.load_chunks(
+                offset - 1, offset + ZEN_SECTION - 1
+            ):
+                search_result.update(session_data)
+                search_result["ids"] = results
+                session_data["ttl"] = now + SEARCH_RESULTS_TTL
+                return search_result
 
         query_string = cleaned_data.get("q", "")
         allunits = unit_set.search(query_string, project=project)
@@ -266,19 +277,21 @@ def search(
             messages.warning(request, gettext("No strings found!"))
             return redirect(f"{base.get_absolute_url()}?q={query_string}#search")
 
+        results = SearchResults.create(unit_ids, store=use_cache)
         store_result = {
             "query": search_query,
             "url": search_url,
             "items": search_items,
             "key": session_key,
             "name": str(name),
-            "ids": unit_ids,
-            "ttl": now + SESSION_SEARCH_CACHE_TTL,
+            "results": results.key,
+            "ttl": now + SEARCH_RESULTS_TTL,
         }
         if use_cache:
             request.session[session_key] = store_result
 
         search_result.update(store_result)
+        search_result["ids"] = results
         return search_result
 
 
@@ -856,10 +869,10 @@ def get_zen_unitdata(obj, project, unit_set, request):
         return search_result, None
 
     offset = search_result["offset"] - 1
-    search_result["last_section"] = offset + 20 >= len(search_result["ids"])
+    search_result["last_section"] = offset + ZEN_SECTION >= len(search_result["ids"])
 
     units = unit_set.prefetch_full().get_ordered(
-        search_result["ids"][offset : offset + 20]
+        search_result["ids"][offset : offset + ZEN_SECTION]
     )
 
     unitdata = [
@@ -10,6 +10,7 @@ from django.shortcuts import get_object_or_404, redirect
 from django.utils.translation import gettext, ngettext
 from django.views.decorators.http import require_POST
 
+from weblate.formats.exportcache import export_translation
 from weblate.formats.models import EXPORTERS
 from weblate.trans.exceptions import FailedCommitError, PluralFormsMismatchError
 from weblate.trans.forms import DownloadForm, get_upload_form
@@ -32,10 +33,34 @@ from weblate.utils.views import (
 )
 
 
+def iter_converted(exporter_cls, translations):
+    """Convert translations to the export format one by one."""
+    for translation in translations:
+        exporter = exporter_cls(translation=translation)
+        filename = exporter.get_filename()
+        if not exporter_cls.supports(translation):
+            yield (
+                f"{filename}.skipped",
+                "File format is not compatible with this translation",
+            )
+        else:
+            # The response headers are already sent, so the failure can
+            # only be reported inside the archive
+            try:
+                content = export_translation(translation, exporter_cls)
+            except Exception as error:
+                report_error(
+                    "Download conversion", project=translation.component.project
+                )
+                yield f"{filename}.failed", f"File conversion failed: {error}"
+            else:
+                yield filename, content
+
+
 def download_multi(request, translations, commit_objs, fmt=None, name="translations"):
     filenames = set()
     components = set()
-    extra = {}
+    extra = ()
 
     for obj in commit_objs:
         try:
@@ -52,17 +77,8 @@ def download_multi(request, translations, commit_objs, fmt=None, name="translati
         except KeyError as exc:
             raise Http404(f"Conversion to {fmt} is not supported") from exc
 
-        for translation in translations:
-            exporter = exporter_cls(translation=translation)
-            filename = exporter.get_filename()
-            if not exporter_cls.supports(translation):
-                extra[f"{filename}.skipped"] = (
-                    "File format is not compatible with this translation"
-                )
-            else:
-                units = translation.unit_set.prefetch_full().order_by("position")
-                exporter.add_units(units)
-                extra[filename] = exporter.serialize()
+        # Translations are converted while streaming the archive
+        extra = iter_converted(exporter_cls, translations)
     else:
         for translation in translations:
             # Add translation files
@@ -12,6 +12,7 @@ from django.views.decorators.http import require_POST
 from weblate.checks.flags import Flags
 from weblate.checks.models import Check
 from weblate.trans.models import Change, Component, Project, Translation, Unit
+from weblate.trans.models.component import prefetch_repo_status
 from weblate.trans.util import sort_unicode
 from weblate.utils.views import parse_path
 
@@ -86,7 +87,7 @@ def git_status(request, path):
     if not request.user.has_perm("meta:vcs.status", obj):
         raise PermissionDenied
 
-    repo_components = obj.all_repo_components
+    repo_components = prefetch_repo_status(obj.all_repo_components)
 
     # Filter events from repository
     changes = (
@@ -112,13 +113,15 @@ def git_status(request, path):
             "repositories": repo_components,
             "pending_units": obj.count_pending_units,
             "outgoing_commits": sum(
-                repo.count_repo_outgoing for repo in repo_components
+                repo.repo_status["outgoing"] for repo in repo_components
             ),
             "has_push_branch": any(repo.push_branch for repo in repo_components),
             "push_branch_outgoing_commits": sum(
-                repo.count_push_branch_outgoing for repo in repo_components
+                repo.repo_status["push_branch_outgoing"] for repo in repo_components
+            ),
+            "missing_commits": sum(
+                repo.repo_status["missing"] for repo in repo_components
             ),
-            "missing_commits": sum(repo.count_repo_missing for repo in repo_components),
             "supports_push": any(
                 repo.repository_class.supports_push for repo in repo_components
             ),
@@ -3,17 +3,22 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import csv
+import operator
 from collections import defaultdict
+from itertools import groupby
 
 from django.contrib.auth.decorators import login_required
-from django.http import HttpResponse, JsonResponse
+from django.db.models import KT, Case, Count, IntegerField, Sum, Value, When
+from django.db.models.functions import Cast, Length
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
 from django.utils.html import conditional_escape, format_html, format_html_join
 from django.views.decorators.http import require_POST
 
 from weblate.lang.models import Language
 from weblate.trans.forms import ReportsForm
 from weblate.trans.models import Change, Component, Project
-from weblate.trans.util import count_words, redirect_param
+from weblate.trans.util import redirect_param
 from weblate.utils.views import parse_path, show_form_errors
 
 # Header, two longer fields for name and email, shorter fields for numbers
@@ -94,6 +99,17 @@ def get_credits(request, path=None):
     if form.cleaned_data["style"] == "json":
         return JsonResponse(data=data, safe=False)
 
+    if form.cleaned_data["style"] == "csv":
+        response = HttpResponse(content_type="text/csv; charset=utf-8")
+        response["Content-Disposition"] = "attachment; filename=credits.csv"
+        writer = csv.writer(response)
+        writer.writerow(("Language", "Email", "Name", "Count"))
+        for language in data:
+            for name, authors in language.items():
+                for author in authors:
+                    writer.writerow((name, *author))
+        return response
+
     if form.cleaned_data["style"] == "html":
         wrap_format = "<table><tbody>{}</tbody></table>"
         language_format = """
@@ -170,52 +186,106 @@ COUNT_DEFAULTS = dict.fromkeys(
     0,
 )
 
+COUNT_FIELDS = ("count", "edits", "words", "chars", "t_words", "t_chars")
+
+COUNT_HEADERS = (
+    "Name",
+    "Email",
+    "Count total",
+    "Edits total",
+    "Source words total",
+    "Source chars total",
+    "Target words total",
+    "Target chars total",
+    "Count new",
+    "Edits new",
+    "Source words new",
+    "Source chars new",
+    "Target words new",
+    "Target chars new",
+    "Count approved",
+    "Edits approved",
+    "Source words approved",
+    "Source chars approved",
+    "Target words approved",
+    "Target chars approved",
+    "Count edited",
+    "Edits edited",
+    "Source words edited",
+    "Source chars edited",
+    "Target words edited",
+    "Target chars edited",
+)
+
+# Keys matching COUNT_HEADERS after name and email
+COUNT_KEYS = tuple(
+    f"{field}{suffix}"
+    for suffix in ("", "_new", "_approve", "_edit")
+    for field in COUNT_FIELDS
+)
 
-def generate_counts(user, start_date, end_date, language_code: str, **kwargs):
-    """Generate credits data for given component."""
-    result = {}
-    action_map = {Change.ACTION_NEW: "new", Change.ACTION_APPROVE: "approve"}
 
+def iterate_counts(user, start_date, end_date, language_code: str, **kwargs):
+    """Generate work counts for every author, aggregated in the database."""
     base = Change.objects.content().filter(unit__isnull=False)
     base = base.filter(author=user) if user else base.filter(author__isnull=False)
     if language_code:
         base = base.filter(language__code=language_code)
 
-    changes = base.filter(
-        timestamp__range=(start_date, end_date), **kwargs
-    ).prefetch_related("author", "unit")
-    for change in changes:
-        email = change.author.email
+    rows = (
+        base.filter(timestamp__range=(start_date, end_date), **kwargs)
+        .annotate(
+            kind=Case(
+                When(action=Change.ACTION_NEW, then=Value("new")),
+                When(action=Change.ACTION_APPROVE, then=Value("approve")),
+                default=Value("edit"),
+            )
+        )
+        .values("author__email", "author__full_name", "kind")
+        .annotate(
+            count=Count("id"),
+            edits=Sum(Cast(KT("details__distance"), IntegerField()), default=0),
+            words=Sum("unit__num_words", default=0),
+            chars=Sum(Length("unit__source"), default=0),
+            t_words=Sum(Cast(KT("details__words"), IntegerField()), default=0),
+            t_chars=Sum(Length("target"), default=0),
+        )
+        .order_by("author__email", "kind")
+    )
+
+    for email, items in groupby(
+        rows.iterator(), key=operator.itemgetter("author__email")
+    ):
+        current = {"name": None, "email": email}
+        current.update(COUNT_DEFAULTS)
+        for row in items:
+            current["name"] = row["author__full_name"]
+            for field in COUNT_FIELDS:
+                current[field] += row[field]
+                current[f"{field}_{row['kind']}"] += row[field]
+        yield current
+
 
-        if email not in result:
-            result[email] = current = {"name": change.author.full_name, "email": email}
-            current.update(COUNT_DEFAULTS)
-        else:
-            current = result[email]
+def generate_counts(user, start_date, end_date, language_code: str, **kwargs):
+    """Generate credits data for given component."""
+    return list(iterate_counts(user, start_date, end_date, language_code, **kwargs))
 
-        src_chars = len(change.unit.source)
-        src_words = change.unit.num_words
-        tgt_chars = len(change.target)
-        tgt_words = count_words(change.target, change.language.base_code)
-        edits = change.get_distance()
 
-        current["chars"] += src_chars
-        current["words"] += src_words
-        current["t_chars"] += tgt_chars
-        current["t_words"] += tgt_words
-        current["edits"] += edits
-        current["count"] += 1
+class Echo:
+    """File-like object returning the written value, used to stream CSV."""
 
-        suffix = action_map.get(change.action, "edit")
+    def write(self, value):
+        return value
 
-        current["t_chars_" + suffix] += tgt_chars
-        current["t_words_" + suffix] += tgt_words
-        current["chars_" + suffix] += src_chars
-        current["words_" + suffix] += src_words
-        current["edits_" + suffix] += edits
-        current["count_" + suffix] += 1
 
-    return list(result.values())
+def stream_counts_csv(counts):
+    writer = csv.writer(Echo())
+    yield writer.writerow(COUNT_HEADERS)
+    for item in counts:
+        yield writer.writerow(
+            [item["name"] or "Anonymous", item["email"] or ""]
+            + [item[key] for key in COUNT_KEYS]
+        )
 
 
 @login_required
@@ -236,50 +306,32 @@ def get_counts(request, path=None):
         show_form_errors(request, form)
         return redirect_param(obj or "home", "#reports")
 
-    data = generate_counts(
+    args = (
         None if request.user.has_perm("reports.view", obj) else request.user,
         form.cleaned_data["start_date"],
         form.cleaned_data["end_date"],
         form.cleaned_data["language"],
-        **kwargs,
     )
 
+    if form.cleaned_data["style"] == "csv":
+        response = StreamingHttpResponse(
+            stream_counts_csv(iterate_counts(*args, **kwargs)),
+            content_type="text/csv; charset=utf-8",
+        )
+        response["Content-Disposition"] = "attachment; filename=counts.csv"
+        return response
+
+    data = generate_counts(*args, **kwargs)
+
     if form.cleaned_data["style"] == "json":
         return JsonResponse(data=data, safe=False)
 
-    headers = (
-        "Name",
-        "Email",
-        "Count total",
-        "Edits total",
-        "Source words total",
-        "Source chars total",
-        "Target words total",
-        "Target chars total",
-        "Count new",
-        "Edits new",
-        "Source words new",
-        "Source chars new",
-        "Target words new",
-        "Target chars new",
-        "Count approved",
-        "Edits approved",
-        "Source words approved",
-        "Source chars approved",
-        "Target words approved",
-        "Target chars approved",
-        "Count edited",
-        "Edits edited",
-        "Source words edited",
-        "Source chars edited",
-        "Target words edited",
-        "Target chars edited",
-    )
-
     if form.cleaned_data["style"] == "html":
         start = format_html(
             HTML_HEADING,
-            format_html_join("", "<th>{}</th>", ((header,) for header in headers)),
+            format_html_join(
+                "", "<th>{}</th>", ((header,) for header in COUNT_HEADERS)
+            ),
         )
         row_start = "<tr>"
         cell_name = cell_count = "<td>{0}</td>\n"
@@ -291,8 +343,8 @@ def get_counts(request, path=None):
     else:
         start = "{0}\n{1} {2}\n{0}".format(
             RST_HEADING,
-            " ".join(f"{h:40}" for h in headers[:2]),
-            " ".join(f"{h:24}" for h in headers[2:]),
+            " ".join(f"{h:40}" for h in COUNT_HEADERS[:2]),
+            " ".join(f"{h:24}" for h in COUNT_HEADERS[2:]),
         )
         row_start = ""
         cell_name = "{0:40} "
@@ -315,30 +367,10 @@ def get_counts(request, path=None):
                 (
                     (format_html_or_plain(cell_name, item["name"] or "Anonymous"),),
                     (format_html_or_plain(cell_name, item["email"] or ""),),
-                    (format_html_or_plain(cell_count, item["count"]),),
-                    (format_html_or_plain(cell_count, item["edits"]),),
-                    (format_html_or_plain(cell_count, item["words"]),),
-                    (format_html_or_plain(cell_count, item["chars"]),),
-                    (format_html_or_plain(cell_count, item["t_words"]),),
-                    (format_html_or_plain(cell_count, item["t_chars"]),),
-                    (format_html_or_plain(cell_count, item["count_new"]),),
-                    (format_html_or_plain(cell_count, item["edits_new"]),),
-                    (format_html_or_plain(cell_count, item["words_new"]),),
-                    (format_html_or_plain(cell_count, item["chars_new"]),),
-                    (format_html_or_plain(cell_count, item["t_words_new"]),),
-                    (format_html_or_plain(cell_count, item["t_chars_new"]),),
-                    (format_html_or_plain(cell_count, item["count_approve"]),),
-                    (format_html_or_plain(cell_count, item["edits_approve"]),),
-                    (format_html_or_plain(cell_count, item["words_approve"]),),
-                    (format_html_or_plain(cell_count, item["chars_approve"]),),
-                    (format_html_or_plain(cell_count, item["t_words_approve"]),),
-                    (format_html_or_plain(cell_count, item["t_chars_approve"]),),
-                    (format_html_or_plain(cell_count, item["count_edit"]),),
-                    (format_html_or_plain(cell_count, item["edits_edit"]),),
-                    (format_html_or_plain(cell_count, item["words_edit"]),),
-                    (format_html_or_plain(cell_count, item["chars_edit"]),),
-                    (format_html_or_plain(cell_count, item["t_words_edit"]),),
-                    (format_html_or_plain(cell_count, item["t_chars_edit"]),),
+                    *(
+                        (format_html_or_plain(cell_count, item[key]),)
+                        for key in COUNT_KEYS
+                    ),
                 ),
             )
         )
@@ -135,7 +135,7 @@ def change_component(request, obj):
     else:
         form = ComponentSettingsForm(request, instance=obj)
 
-    if obj.repo_needs_merge():
+    if obj.repo_needs_merge(cached=True):
         messages.warning(
             request,
             gettext(
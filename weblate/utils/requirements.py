@@ -71,6 +71,7 @@ OPTIONAL = [
     "aeidon",
     "iniparse",
     "mysqlclient",
+    "numpy",
 ]
 
 
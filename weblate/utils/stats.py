@@ -5,9 +5,9 @@
 from __future__ import annotations
 
 import time
+from collections import defaultdict
 from datetime import datetime, timedelta
 from itertools import chain
-from operator import itemgetter
 from types import GeneratorType
 from typing import TYPE_CHECKING
 
@@ -26,6 +26,8 @@ from weblate.checks.models import CHECKS
 from weblate.lang.models import Language
 from weblate.trans.mixins import BaseURLMixin
 from weblate.trans.util import translation_percent
+from weblate.utils.data import data_dir
+from weblate.utils.lock import WeblateLock
 from weblate.utils.random import get_random_identifier
 from weblate.utils.site import get_site_url
 from weblate.utils.state import (
@@ -36,6 +38,13 @@ from weblate.utils.state import (
     STATE_TRANSLATED,
 )
 
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 if TYPE_CHECKING:
     from collections.abc import Iterable
 
@@ -100,6 +109,48 @@ SOURCE_MAP = {
     "source_strings": "all",
 }
 
+# Buckets a string can be counted in, the order defines bits in the mask
+# returned by get_unit_stats_mask
+UNIT_BUCKETS = (
+    "all",
+    "fuzzy",
+    "readonly",
+    "nottranslated",
+    "unapproved",
+    "approved",
+    "translated",
+    "todo",
+    "unlabeled",
+    "allchecks",
+    "translated_checks",
+    "dismissed_checks",
+    "suggestions",
+    "nosuggestions",
+    "approved_suggestions",
+    "comments",
+)
+
+UNIT_BUCKET_KEYS = (
+    *UNIT_BUCKETS,
+    *(f"{x}_words" for x in UNIT_BUCKETS),
+    *(f"{x}_chars" for x in UNIT_BUCKETS),
+)
+
+# Changes counts which are summed on the higher levels
+CHANGES_KEYS = ("recent_changes", "monthly_changes", "total_changes")
+
+# Per string stats: mask of buckets, number of words and number of chars
+UnitStatsRow = tuple[int, int, int]
+# Number of cache keys the per string stats of a translation are split into
+UNIT_STATS_SHARDS = 16
+# Number of locks serializing updates of translation stats
+STATS_LOCK_SLOTS = 64
+# Timeout for acquiring lock for updating translation stats
+STATS_LOCK_TIMEOUT = 5
+# Database values: id, state, active checks, dismissed checks, suggestions,
+# labels, comments, number of words and number of chars
+UnitStatsValues = tuple[int, int, int, int, int, int, int, int, int]
+
 
 def zero_stats(keys):
     stats: StatDict = dict.fromkeys(keys, 0)
@@ -109,6 +160,154 @@ def zero_stats(keys):
     return stats
 
 
+def get_unit_buckets(
+    state, active_checks, dismissed_checks, suggestions, labels, comments
+) -> tuple:
+    """
+    Return flags for all UNIT_BUCKETS for a string.
+
+    Only operators working on both scalars and NumPy arrays are used here,
+    so this can be used for vectorized calculation as well.
+    """
+    translated = state >= STATE_TRANSLATED
+    has_checks = active_checks > 0
+    has_suggestions = suggestions > 0
+    return (
+        # All strings, the state is never negative
+        state >= STATE_EMPTY,
+        state == STATE_FUZZY,
+        state == STATE_READONLY,
+        state == STATE_EMPTY,
+        state == STATE_TRANSLATED,
+        state == STATE_APPROVED,
+        translated,
+        state < STATE_TRANSLATED,
+        labels == 0,
+        has_checks,
+        has_checks & ((state == STATE_TRANSLATED) | (state == STATE_APPROVED)),
+        dismissed_checks > 0,
+        has_suggestions,
+        (suggestions == 0) & (state < STATE_TRANSLATED),
+        has_suggestions & (state == STATE_APPROVED),
+        comments > 0,
+    )
+
+
+def get_unit_stats_mask(
+    state: int,
+    active_checks: int,
+    dismissed_checks: int,
+    suggestions: int,
+    labels: int,
+    comments: int,
+) -> int:
+    """Return bitmask of UNIT_BUCKETS the string is counted in."""
+    buckets = get_unit_buckets(
+        state, active_checks, dismissed_checks, suggestions, labels, comments
+    )
+    return sum(1 << offset for offset, bucket in enumerate(buckets) if bucket)
+
+
+def aggregate_unit_stats(
+    rows: Iterable[UnitStatsRow], stats: dict[str, int], sign: int = 1
+) -> None:
+    """Add (or subtract with negative sign) per string stats to the summary."""
+    # Group by mask first, there are typically only few distinct masks
+    masks: dict[int, list[int]] = defaultdict(lambda: [0, 0, 0])
+    for mask, words, chars in rows:
+        summary = masks[mask]
+        summary[0] += 1
+        summary[1] += words
+        summary[2] += chars
+
+    for mask, (strings, words, chars) in masks.items():
+        for offset, name in enumerate(UNIT_BUCKETS):
+            if mask & (1 << offset):
+                stats[name] += sign * strings
+                stats[f"{name}_words"] += sign * words
+                stats[f"{name}_chars"] += sign * chars
+
+
+def summarize_unit_stats(
+    values: Iterable[UnitStatsValues],
+) -> tuple[dict[int, UnitStatsRow], dict[str, int]]:
+    """Calculate per string stats and their summary from database values."""
+    unit_stats = {
+        unit_id: (
+            get_unit_stats_mask(
+                state, active, dismissed, suggestions, labels, comments
+            ),
+            num_words,
+            num_chars,
+        )
+        for (
+            unit_id,
+            state,
+            active,
+            dismissed,
+            suggestions,
+            labels,
+            comments,
+            num_words,
+            num_chars,
+        ) in values
+    }
+    stats = dict.fromkeys(UNIT_BUCKET_KEYS, 0)
+    aggregate_unit_stats(unit_stats.values(), stats)
+    return unit_stats, stats
+
+
+def calculate_unit_stats_numpy(
+    values: list[UnitStatsValues],
+) -> tuple[np.ndarray, dict[str, int]]:
+    """
+    Vectorized variant of summarize_unit_stats.
+
+    The values are loaded into arrays once and all the stats are then
+    calculated using boolean masks. Per string stats are returned as an array
+    with ID, mask, number of words and number of chars columns.
+    """
+    stats = dict.fromkeys(UNIT_BUCKET_KEYS, 0)
+    if not values:
+        return np.empty((0, 4), dtype=np.int64), stats
+    columns = np.array(values, dtype=np.int64)
+    (
+        unit_ids,
+        state,
+        active,
+        dismissed,
+        suggestions,
+        labels,
+        comments,
+        num_words,
+        num_chars,
+    ) = columns.T
+    buckets = get_unit_buckets(state, active, dismissed, suggestions, labels, comments)
+    masks = np.zeros(len(columns), dtype=np.int64)
+    for offset, (name, selected) in enumerate(zip(UNIT_BUCKETS, buckets, strict=True)):
+        masks |= selected.astype(np.int64) << offset
+        stats[name] = int(np.count_nonzero(selected))
+        stats[f"{name}_words"] = int(num_words[selected].sum())
+        stats[f"{name}_chars"] = int(num_chars[selected].sum())
+    return np.column_stack((unit_ids, masks, num_words, num_chars)), stats
+
+
+def get_unit_stats_dict(rows: np.ndarray) -> dict[int, UnitStatsRow]:
+    """Convert array of per string stats to a dictionary."""
+    unit_ids, masks, num_words, num_chars = rows.T.tolist()
+    return dict(
+        zip(unit_ids, zip(masks, num_words, num_chars, strict=True), strict=True)
+    )
+
+
+def summarize_unit_stats_numpy(
+    values: list[UnitStatsValues],
+) -> tuple[dict[int, UnitStatsRow], dict[str, int]]:
+    """Vectorized variant of summarize_unit_stats with the same result."""
+    rows, stats = calculate_unit_stats_numpy(values)
+    return get_unit_stats_dict(rows), stats
+
+
 def prefetch_stats(queryset):
     """Fetch stats from cache for a queryset."""
     # Force evaluating queryset/iterator, we need all objects
@@ -202,8 +401,8 @@ class BaseStats:
         return data
 
     @staticmethod
-    def prefetch_many(stats) -> None:
-        lookup = {i.cache_key: i for i in stats if not i.is_loaded}
+    def prefetch_many(stats, force: bool = False) -> None:
+        lookup = {i.cache_key: i for i in stats if force or not i.is_loaded}
         if not lookup:
             return
         data = cache.get_many(lookup.keys())
@@ -303,6 +502,33 @@ class BaseStats:
         """Save stats to cache."""
         cache.set(self.cache_key, self._data, 30 * 86400)
 
+    def apply_delta(
+        self,
+        delta: dict[str, int],
+        last_changed: datetime | None = None,
+        last_author: int | None = None,
+    ) -> None:
+        """
+        Apply incremental update to already calculated stats.
+
+        Stats which were not yet calculated are left untouched, these are
+        calculated on demand. The update is not locked, any drift caused by
+        concurrent updates is corrected by the periodic stats verification.
+        """
+        self.ensure_loaded()
+        if "all" not in self._data:
+            return
+        for key, value in delta.items():
+            if key in self._data:
+                self._data[key] += value
+        if last_changed is not None and (
+            self._data.get("last_changed") is None
+            or last_changed > self._data["last_changed"]
+        ):
+            self._data["last_changed"] = last_changed
+            self._data["last_author"] = last_author
+        self.save(update_parents=False)
+
     def get_update_objects(self):
         yield GlobalStats()
 
@@ -500,195 +726,128 @@ class TranslationStats(BaseStats):
     def has_review(self):
         return self._object.enable_review
 
-    def _calculate_basic(self) -> None:  # noqa: PLR0914
-        values = (
-            "state",
-            "num_words",
-            "active_checks_count",
-            "dismissed_checks_count",
-            "suggestion_count",
-            "label_count",
-            "comment_count",
-            "num_chars",
+    @cached_property
+    def lock(self) -> WeblateLock:
+        """
+        Lock serializing updates of the translation stats.
+
+        The incremental updates modify stored data, so these can not run
+        concurrently with other updates of the same stats. The locks are
+        shared by several translations to limit the number of lock files.
+        """
+        slot = self._object.pk % STATS_LOCK_SLOTS
+        return WeblateLock(
+            lock_path=data_dir("home"),
+            scope="stats",
+            key=slot,
+            slug=f"stats-{slot}",
+            cache_template="lock:{scope}:{key}",
+            file_template="{slug}.lock",
+            timeout=STATS_LOCK_TIMEOUT,
         )
 
-        # Calculate summary for each unit in the database.
+    def update_stats(self, update_parents: bool = True) -> None:
+        with self.lock:
+            super().update_stats(update_parents=update_parents)
+
+    def get_units_cache_key(self, shard: int) -> str:
+        return f"{self.cache_key}-units-{shard}"
+
+    def delete(self):
+        return cache.delete_many(
+            [
+                self.cache_key,
+                *(
+                    self.get_units_cache_key(shard)
+                    for shard in range(UNIT_STATS_SHARDS)
+                ),
+            ]
+        )
+
+    def store_unit_stats(
+        self, unit_stats: dict[int, UnitStatsRow], shards: Iterable[int]
+    ) -> None:
+        """Store per string stats for given shards."""
+        data: dict[str, dict[int, UnitStatsRow]] = {
+            self.get_units_cache_key(shard): {} for shard in shards
+        }
+        for unit_id, row in unit_stats.items():
+            key = self.get_units_cache_key(unit_id % UNIT_STATS_SHARDS)
+            if key in data:
+                data[key][unit_id] = row
+        cache.set_many(data, 30 * 86400)
+
+    def store_unit_stats_numpy(self, rows: np.ndarray) -> None:
+        """Store per string stats for all shards from an array."""
+        shards = rows[:, 0] % UNIT_STATS_SHARDS
+        cache.set_many(
+            {
+                self.get_units_cache_key(shard): get_unit_stats_dict(
+                    rows[shards == shard]
+                )
+                for shard in range(UNIT_STATS_SHARDS)
+            },
+            30 * 86400,
+        )
+
+    def load_unit_stats(self, shards: set[int]) -> dict[int, UnitStatsRow] | None:
+        """Load per string stats for given shards, None if any of them is missing."""
+        keys = [self.get_units_cache_key(shard) for shard in shards]
+        data = cache.get_many(keys)
+        if len(data) != len(keys):
+            return None
+        result: dict[int, UnitStatsRow] = {}
+        for value in data.values():
+            result.update(value)
+        return result
+
+    def get_unit_stats_values(self, units) -> list[UnitStatsValues]:
+        """Fetch database values needed for per string stats."""
         # We only need presence check, not actual count, but using Exists(OuterRef())
         # creates a subquery for each field, while Count() creates a single join
         # and calculates based on that, what performs better.
-        units = self._object.unit_set.annotate(
-            active_checks_count=Count("check", filter=Q(check__dismissed=False)),
-            dismissed_checks_count=Count("check", filter=Q(check__dismissed=True)),
-            suggestion_count=Count("suggestion"),
-            label_count=Count("source_unit__labels"),
-            comment_count=Count("comment", filter=Q(comment__resolved=False)),
-            num_chars=Length("source"),
-        ).values_list(*values)
-
-        (
-            get_state,
-            get_num_words,
-            get_active_checks_count,
-            get_dismissed_checks_count,
-            get_suggestion_count,
-            get_label_count,
-            get_comment_count,
-            get_num_chars,
-        ) = (itemgetter(i) for i in range(len(values)))
-
-        # Sum stats in Python, this is way faster than conditional sums in the database
-        units_all = units
-        units_fuzzy = [unit for unit in units if get_state(unit) == STATE_FUZZY]
-        units_readonly = [unit for unit in units if get_state(unit) == STATE_READONLY]
-        units_nottranslated = [unit for unit in units if get_state(unit) == STATE_EMPTY]
-        units_unapproved = [
-            unit for unit in units if get_state(unit) == STATE_TRANSLATED
-        ]
-        units_approved = [unit for unit in units if get_state(unit) == STATE_APPROVED]
-        units_translated = [
-            unit for unit in units if get_state(unit) >= STATE_TRANSLATED
-        ]
-        units_todo = [unit for unit in units if get_state(unit) < STATE_TRANSLATED]
-        units_unlabeled = [unit for unit in units if not get_label_count(unit)]
-        units_allchecks = [unit for unit in units if get_active_checks_count(unit)]
-        units_translated_checks = [
-            unit
-            for unit in units
-            if get_active_checks_count(unit)
-            and get_state(unit) in {STATE_TRANSLATED, STATE_APPROVED}
-        ]
-        units_dismissed_checks = [
-            unit for unit in units if get_dismissed_checks_count(unit)
-        ]
-        units_suggestions = [unit for unit in units if get_suggestion_count(unit)]
-        units_nosuggestions = [
-            unit
-            for unit in units
-            if not get_suggestion_count(unit) and get_state(unit) < STATE_TRANSLATED
-        ]
-        units_approved_suggestions = [
-            unit
-            for unit in units
-            if get_suggestion_count(unit) and get_state(unit) == STATE_APPROVED
-        ]
-        units_comments = [unit for unit in units if get_comment_count(unit)]
+        return list(
+            units.annotate(
+                active_checks_count=Count("check", filter=Q(check__dismissed=False)),
+                dismissed_checks_count=Count("check", filter=Q(check__dismissed=True)),
+                suggestion_count=Count("suggestion"),
+                label_count=Count("source_unit__labels"),
+                comment_count=Count("comment", filter=Q(comment__resolved=False)),
+                num_chars=Length("source"),
+            ).values_list(
+                "id",
+                "state",
+                "active_checks_count",
+                "dismissed_checks_count",
+                "suggestion_count",
+                "label_count",
+                "comment_count",
+                "num_words",
+                "num_chars",
+            )
+        )
+
+    def get_unit_stats(self, units) -> dict[int, UnitStatsRow]:
+        """Calculate per string stats for given units queryset."""
+        return summarize_unit_stats(self.get_unit_stats_values(units))[0]
+
+    def _calculate_basic(self) -> None:
+        values = self.get_unit_stats_values(self._object.unit_set.all())
+
+        # Sum stats in Python, this is way faster than conditional sums in the database.
+        # Per string stats are kept for incremental updates, split into several
+        # keys so that update of a string does not need to store all of them.
+        if HAS_NUMPY:
+            rows, stats = calculate_unit_stats_numpy(values)
+            # The per string stats are converted one shard at a time
+            self.store_unit_stats_numpy(rows)
+        else:
+            unit_stats, stats = summarize_unit_stats(values)
+            self.store_unit_stats(unit_stats, range(UNIT_STATS_SHARDS))
 
         # Store in a cache
-        self.store("all", len(units_all))
-        self.store("all_words", sum(get_num_words(unit) for unit in units_all))
-        self.store("all_chars", sum(get_num_chars(unit) for unit in units_all))
-        self.store("fuzzy", len(units_fuzzy))
-        self.store("fuzzy_words", sum(get_num_words(unit) for unit in units_fuzzy))
-        self.store("fuzzy_chars", sum(get_num_chars(unit) for unit in units_fuzzy))
-        self.store("readonly", len(units_readonly))
-        self.store(
-            "readonly_words", sum(get_num_words(unit) for unit in units_readonly)
-        )
-        self.store(
-            "readonly_chars", sum(get_num_chars(unit) for unit in units_readonly)
-        )
-        self.store("translated", len(units_translated))
-        self.store(
-            "translated_words", sum(get_num_words(unit) for unit in units_translated)
-        )
-        self.store(
-            "translated_chars", sum(get_num_chars(unit) for unit in units_translated)
-        )
-        self.store("todo", len(units_todo))
-        self.store("todo_words", sum(get_num_words(unit) for unit in units_todo))
-        self.store("todo_chars", sum(get_num_chars(unit) for unit in units_todo))
-        self.store("nottranslated", len(units_nottranslated))
-        self.store(
-            "nottranslated_words",
-            sum(get_num_words(unit) for unit in units_nottranslated),
-        )
-        self.store(
-            "nottranslated_chars",
-            sum(get_num_chars(unit) for unit in units_nottranslated),
-        )
-        # Review workflow
-        self.store("approved", len(units_approved))
-        self.store(
-            "approved_words", sum(get_num_words(unit) for unit in units_approved)
-        )
-        self.store(
-            "approved_chars", sum(get_num_chars(unit) for unit in units_approved)
-        )
-        self.store("unapproved", len(units_unapproved))
-        self.store(
-            "unapproved_words", sum(get_num_words(unit) for unit in units_unapproved)
-        )
-        self.store(
-            "unapproved_chars", sum(get_num_chars(unit) for unit in units_unapproved)
-        )
-        # Labels
-        self.store("unlabeled", len(units_unlabeled))
-        self.store(
-            "unlabeled_words", sum(get_num_words(unit) for unit in units_unlabeled)
-        )
-        self.store(
-            "unlabeled_chars", sum(get_num_chars(unit) for unit in units_unlabeled)
-        )
-        # Checks
-        self.store("allchecks", len(units_allchecks))
-        self.store(
-            "allchecks_words", sum(get_num_words(unit) for unit in units_allchecks)
-        )
-        self.store(
-            "allchecks_chars", sum(get_num_chars(unit) for unit in units_allchecks)
-        )
-        self.store("translated_checks", len(units_translated_checks))
-        self.store(
-            "translated_checks_words",
-            sum(get_num_words(unit) for unit in units_translated_checks),
-        )
-        self.store(
-            "translated_checks_chars",
-            sum(get_num_chars(unit) for unit in units_translated_checks),
-        )
-        self.store("dismissed_checks", len(units_dismissed_checks))
-        self.store(
-            "dismissed_checks_words",
-            sum(get_num_words(unit) for unit in units_dismissed_checks),
-        )
-        self.store(
-            "dismissed_checks_chars",
-            sum(get_num_chars(unit) for unit in units_dismissed_checks),
-        )
-        # Suggestions
-        self.store("suggestions", len(units_suggestions))
-        self.store(
-            "suggestions_words", sum(get_num_words(unit) for unit in units_suggestions)
-        )
-        self.store(
-            "suggestions_chars", sum(get_num_chars(unit) for unit in units_suggestions)
-        )
-        self.store("nosuggestions", len(units_nosuggestions))
-        self.store(
-            "nosuggestions_words",
-            sum(get_num_words(unit) for unit in units_nosuggestions),
-        )
-        self.store(
-            "nosuggestions_chars",
-            sum(get_num_chars(unit) for unit in units_nosuggestions),
-        )
-        self.store("approved_suggestions", len(units_approved_suggestions))
-        self.store(
-            "approved_suggestions_words",
-            sum(get_num_words(unit) for unit in units_approved_suggestions),
-        )
-        self.store(
-            "approved_suggestions_chars",
-            sum(get_num_chars(unit) for unit in units_approved_suggestions),
-        )
-        # Comments
-        self.store("comments", len(units_comments))
-        self.store(
-            "comments_words", sum(get_num_words(unit) for unit in units_comments)
-        )
-        self.store(
-            "comments_chars", sum(get_num_chars(unit) for unit in units_comments)
-        )
+        for key, value in stats.items():
+            self.store(key, value)
 
         # There is single language here, but it is aggregated at higher levels
         self.store("languages", 1)
@@ -753,6 +912,129 @@ class TranslationStats(BaseStats):
             self.store("monthly_changes", 0)
             self.store("total_changes", 0)
 
+    def update_units(self, unit_ids: set[int]) -> bool:
+        """
+        Incrementally update stats for changed strings.
+
+        The per string stats stored on full calculation are compared with
+        current state of the strings and only the difference is applied here
+        and in all parent stats.
+
+        The translation stats lock is held while calculating and storing the
+        difference, so that concurrent updates of the translation do not lose
+        or duplicate it. The parent stats are updated without locking.
+
+        Returns False when incremental update is not possible and full
+        calculation is needed.
+        """
+        with self.lock:
+            # Always start with fresh data, these might have been updated meanwhile
+            self._data = self.load()
+            self._loaded = True
+            if "all" not in self._data:
+                return False
+            shards = {unit_id % UNIT_STATS_SHARDS for unit_id in unit_ids}
+            unit_stats = self.load_unit_stats(shards)
+            if unit_stats is None:
+                return False
+
+            with sentry_sdk.start_span(
+                op="stats", description=f"UPDATE {self.cache_key}"
+            ):
+                delta = self.calculate_units_delta(unit_ids, unit_stats)
+                self.store_units_delta(delta, unit_stats, shards)
+        return True
+
+    def calculate_units_delta(
+        self, unit_ids: set[int], unit_stats: dict[int, UnitStatsRow]
+    ) -> dict[str, int]:
+        """Calculate difference in stats and update per string stats."""
+        current = self.get_unit_stats(self._object.unit_set.filter(pk__in=unit_ids))
+        added: list[UnitStatsRow] = []
+        removed: list[UnitStatsRow] = []
+        for unit_id in unit_ids:
+            old = unit_stats.get(unit_id)
+            new = current.get(unit_id)
+            if old == new:
+                continue
+            if old is not None:
+                removed.append(old)
+            if new is None:
+                del unit_stats[unit_id]
+            else:
+                unit_stats[unit_id] = new
+                added.append(new)
+
+        delta: dict[str, int] = defaultdict(int)
+        aggregate_unit_stats(added, delta)
+        aggregate_unit_stats(removed, delta, -1)
+
+        # Changes counts are cheap to get
+        previous = {key: self._data.get(key, 0) for key in CHANGES_KEYS}
+        self.fetch_last_change()
+        self.count_changes()
+        for key, value in previous.items():
+            delta[key] += self._data[key] - value
+
+        return {key: value for key, value in delta.items() if value}
+
+    def store_units_delta(
+        self,
+        delta: dict[str, int],
+        unit_stats: dict[int, UnitStatsRow],
+        shards: set[int],
+    ) -> None:
+        """Store updated stats and apply the difference to all parent stats."""
+        # Source strings are counted on language levels for all translations,
+        # but only for source translation on component and higher levels.
+        source_delta = {
+            source: delta[key] for source, key in SOURCE_MAP.items() if key in delta
+        }
+        language_delta = {**delta, **source_delta}
+        component_delta = language_delta if self.is_source else delta
+
+        component_stats = self._object.component.stats
+        language_objects = list(self.get_update_objects(full=False))
+        component_objects = [component_stats, *component_stats.get_update_objects()]
+
+        # Load current data of the parents just before updating them
+        self.prefetch_many([*language_objects, *component_objects], force=True)
+
+        for key, value in delta.items():
+            self._data[key] += value
+
+        # Detailed stats are calculated on demand
+        for key in list(self._data):
+            if key.startswith(("check:", "label:")):
+                del self._data[key]
+
+        self.store_unit_stats(unit_stats, shards)
+        self.save(update_parents=False)
+
+        last_changed = self._data["last_changed"]
+        last_author = self._data["last_author"]
+        for stat in language_objects:
+            stat.apply_delta(language_delta, last_changed, last_author)
+        for stat in component_objects:
+            stat.apply_delta(component_delta, last_changed, last_author)
+
+    def verify_stats(self) -> set[str]:
+        """
+        Verify incrementally updated stats by full calculation.
+
+        The stats are saved afterwards what updates parents as well. Returns
+        keys which were out of sync.
+        """
+        with self.lock:
+            previous = self.load()
+            self._data = {}
+            self._loaded = True
+            self.calculate_basic()
+            self.save()
+        if "all" not in previous:
+            return set()
+        return {key for key in UNIT_BUCKET_KEYS if previous.get(key) != self._data[key]}
+
     def calculate_by_name(self, name: str) -> None:
         super().calculate_by_name(name)
         if name.startswith("check:"):
@@ -8,6 +8,7 @@ import shutil
 import subprocess
 import sys
 import time
+from datetime import timedelta
 from importlib import import_module
 from shutil import copyfile
 
@@ -15,13 +16,14 @@ from celery.schedules import crontab
 from django.conf import settings
 from django.core.cache import cache
 from django.core.management.commands import diffsettings
+from django.utils import timezone
 from ruamel.yaml import YAML
 
 import weblate.utils.version
 from weblate.formats.models import FILE_FORMATS
 from weblate.logger import LOGGER
 from weblate.machinery.models import MACHINERY
-from weblate.trans.models import Component, Translation
+from weblate.trans.models import Change, Component, Translation
 from weblate.trans.util import get_clean_env
 from weblate.utils.backup import backup_lock
 from weblate.utils.celery import app
@@ -74,6 +76,19 @@ def settings_backup() -> None:
             yaml.dump(dict(os.environ), handle)
 
 
+@app.task(
+    trail=False,
+    autoretry_for=(WeblateLockTimeoutError,),
+    retry_backoff=60,
+)
+def update_translation_stats(pk: int) -> None:
+    try:
+        translation = Translation.objects.get(pk=pk)
+    except Translation.DoesNotExist:
+        return
+    translation.stats.update_stats()
+
+
 @app.task(trail=False)
 def update_translation_stats_parents(pk: int) -> None:
     translation = Translation.objects.get(pk=pk)
@@ -86,6 +101,33 @@ def update_language_stats_parents(pk: int) -> None:
     component.stats.update_language_stats_parents()
 
 
+@app.task(trail=False)
+def verify_translation_stats(days: int = 1) -> None:
+    """
+    Verify and repair stats of recently changed translations.
+
+    The stats are updated incrementally on changes, this ensures that any
+    possible drift is corrected.
+    """
+    since = timezone.now() - timedelta(days=days)
+    translation_ids = (
+        Change.objects.filter(timestamp__gte=since)
+        .exclude(translation=None)
+        .values_list("translation", flat=True)
+        .distinct()
+    )
+    for translation in Translation.objects.filter(pk__in=translation_ids).prefetch():
+        try:
+            mismatch = translation.stats.verify_stats()
+        except WeblateLockTimeoutError:
+            # Being updated right now
+            continue
+        if mismatch:
+            translation.log_warning(
+                "repaired out of sync stats: %s", ", ".join(sorted(mismatch))
+            )
+
+
 @app.task(trail=False, autoretry_for=(WeblateLockTimeoutError,))
 def database_backup() -> None:
     if settings.DATABASE_BACKUP == "none":
@@ -179,3 +221,8 @@ def setup_periodic_tasks(sender, **kwargs) -> None:
         crontab(hour=1, minute=30), database_backup.s(), name="database-backup"
     )
     sender.add_periodic_task(60, heartbeat.s(), name="heartbeat")
+    sender.add_periodic_task(
+        crontab(hour=2, minute=15),
+        verify_translation_stats.s(),
+        name="verify-translation-stats",
+    )
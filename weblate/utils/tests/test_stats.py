@@ -0,0 +1,141 @@
+# Copyright © Michal Čihař <michal@weblate.org>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import os
+import random
+import sys
+import time
+from unittest import SkipTest, skipUnless
+
+from django.test import SimpleTestCase
+
+from weblate.utils.state import (
+    STATE_APPROVED,
+    STATE_EMPTY,
+    STATE_FUZZY,
+    STATE_READONLY,
+    STATE_TRANSLATED,
+)
+from weblate.utils.stats import (
+    HAS_NUMPY,
+    UNIT_BUCKET_KEYS,
+    aggregate_unit_stats,
+    calculate_unit_stats_numpy,
+    summarize_unit_stats,
+    summarize_unit_stats_numpy,
+)
+
+STATES = (STATE_EMPTY, STATE_FUZZY, STATE_TRANSLATED, STATE_APPROVED, STATE_READONLY)
+
+
+def generate_values(count: int, seed: int = 42):
+    rng = random.Random(seed)  # noqa: S311
+    return [
+        (
+            unit_id,
+            rng.choice(STATES),
+            rng.randint(0, 2),
+            rng.randint(0, 1),
+            rng.randint(0, 2),
+            rng.randint(0, 1),
+            rng.randint(0, 1),
+            rng.randint(1, 20),
+            rng.randint(1, 200),
+        )
+        for unit_id in range(1, count + 1)
+    ]
+
+
+class UnitStatsTest(SimpleTestCase):
+    def test_summarize(self) -> None:
+        values = [
+            # Empty, with suggestion
+            (1, STATE_EMPTY, 0, 0, 1, 0, 0, 2, 10),
+            # Fuzzy, failing check
+            (2, STATE_FUZZY, 1, 0, 0, 1, 0, 3, 20),
+            # Translated, failing check and comment
+            (3, STATE_TRANSLATED, 1, 0, 0, 0, 1, 4, 30),
+            # Approved, dismissed check and suggestion
+            (4, STATE_APPROVED, 0, 1, 1, 0, 0, 5, 40),
+            # Read-only
+            (5, STATE_READONLY, 0, 0, 0, 0, 0, 6, 50),
+        ]
+        unit_stats, stats = summarize_unit_stats(values)
+        self.assertEqual(set(unit_stats), {1, 2, 3, 4, 5})
+        self.assertEqual(stats["all"], 5)
+        self.assertEqual(stats["all_words"], 20)
+        self.assertEqual(stats["all_chars"], 150)
+        self.assertEqual(stats["nottranslated"], 1)
+        self.assertEqual(stats["fuzzy"], 1)
+        self.assertEqual(stats["todo"], 2)
+        self.assertEqual(stats["todo_words"], 5)
+        self.assertEqual(stats["translated"], 3)
+        self.assertEqual(stats["unapproved"], 1)
+        self.assertEqual(stats["approved"], 1)
+        self.assertEqual(stats["readonly"], 1)
+        self.assertEqual(stats["allchecks"], 2)
+        self.assertEqual(stats["translated_checks"], 1)
+        self.assertEqual(stats["dismissed_checks"], 1)
+        self.assertEqual(stats["suggestions"], 2)
+        self.assertEqual(stats["nosuggestions"], 1)
+        self.assertEqual(stats["approved_suggestions"], 1)
+        self.assertEqual(stats["comments"], 1)
+        self.assertEqual(stats["comments_chars"], 30)
+        self.assertEqual(stats["unlabeled"], 4)
+
+    def test_aggregate_delta(self) -> None:
+        unit_stats, stats = summarize_unit_stats(generate_values(100))
+        changed_stats, _changed = summarize_unit_stats(generate_values(10, seed=1))
+        # Replace first ten strings and apply the difference
+        aggregate_unit_stats((unit_stats[key] for key in changed_stats), stats, -1)
+        aggregate_unit_stats(changed_stats.values(), stats)
+        unit_stats.update(changed_stats)
+        expected = dict.fromkeys(UNIT_BUCKET_KEYS, 0)
+        aggregate_unit_stats(unit_stats.values(), expected)
+        self.assertEqual(stats, expected)
+
+    def test_numpy(self) -> None:
+        if not HAS_NUMPY:
+            raise SkipTest("NumPy not available")
+        values = generate_values(100000)
+        self.assertEqual(
+            summarize_unit_stats_numpy(values), summarize_unit_stats(values)
+        )
+        self.assertEqual(
+            summarize_unit_stats_numpy([]),
+            ({}, dict.fromkeys(UNIT_BUCKET_KEYS, 0)),
+        )
+
+
+@skipUnless("CI_BENCHMARK" in os.environ, "Benchmarks are not enabled")
+class UnitStatsBenchmarkTest(SimpleTestCase):
+    """
+    Compare performance of the Python and the NumPy stats aggregation.
+
+    Only reports timings, run with CI_BENCHMARK environment variable set.
+    """
+
+    count = 100000
+    rounds = 3
+
+    def measure(self, function, values) -> float:
+        result = []
+        for _i in range(self.rounds):
+            start = time.perf_counter()
+            function(values)
+            result.append(time.perf_counter() - start)
+        return min(result)
+
+    def test_benchmark(self) -> None:
+        if not HAS_NUMPY:
+            raise SkipTest("NumPy not available")
+        values = generate_values(self.count)
+        timings = {
+            "python": self.measure(summarize_unit_stats, values),
+            "numpy": self.measure(calculate_unit_stats_numpy, values),
+            "numpy with dict": self.measure(summarize_unit_stats_numpy, values),
+        }
+        for name, timing in timings.items():
+            sys.stderr.write(f"\n{name}: {timing:.3f}s for {self.count} strings")
+        sys.stderr.write("\n")
@@ -2,11 +2,15 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import os
+from io import BytesIO
+from tempfile import TemporaryDirectory
 from unittest import TestCase
+from zipfile import ZipFile
 
 from django.http import HttpRequest
 
-from weblate.utils.views import get_page_limit
+from weblate.utils.views import ZIP_CHUNK_SIZE, get_page_limit, zip_download
 
 
 def fake_request(page, limit):
@@ -25,3 +29,40 @@ class PageLimitTest(TestCase):
 
     def test_valid(self) -> None:
         self.assertEqual((33, 66), get_page_limit(fake_request("33", "66"), 42))
+
+
+class ZipDownloadTest(TestCase):
+    def test_stream(self) -> None:
+        converted = []
+
+        def generate_extra():
+            for name in ("first", "second"):
+                converted.append(name)
+                yield f"{name}.csv", f"{name}\n"
+
+        with TemporaryDirectory() as tempdir:
+            os.makedirs(os.path.join(tempdir, "po"))
+            with open(os.path.join(tempdir, "po", "cs.po"), "wb") as handle:
+                handle.write(b"x" * (ZIP_CHUNK_SIZE * 3))
+            response = zip_download(
+                tempdir,
+                [os.path.join(tempdir, "po"), os.path.join(tempdir, "missing")],
+                extra=generate_extra(),
+            )
+            self.assertTrue(response.streaming)
+            self.assertEqual(
+                response["Content-Disposition"],
+                'attachment; filename="translations.zip"',
+            )
+            # Nothing is generated before streaming
+            self.assertEqual(converted, [])
+            chunks = list(response.streaming_content)
+
+        self.assertGreater(len(chunks), 3)
+        self.assertEqual(converted, ["first", "second"])
+        with ZipFile(BytesIO(b"".join(chunks)), "r") as zipfile:
+            self.assertIsNone(zipfile.testzip())
+            self.assertEqual(
+                zipfile.namelist(), ["po/cs.po", "first.csv", "second.csv"]
+            )
+            self.assertEqual(zipfile.read("second.csv"), b"second\n")
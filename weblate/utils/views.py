@@ -10,7 +10,7 @@ import os
 import time
 from contextlib import suppress
 from typing import TYPE_CHECKING
-from zipfile import ZipFile
+from zipfile import ZipFile, ZipInfo
 
 from django.conf import settings
 from django.core.paginator import EmptyPage, Paginator
@@ -18,9 +18,9 @@ from django.http import (
     FileResponse,
     Http404,
     HttpRequest,
-    HttpResponse,
     HttpResponseBase,
     HttpResponseRedirect,
+    StreamingHttpResponse,
 )
 from django.shortcuts import get_object_or_404
 from django.utils.cache import get_conditional_response
@@ -29,6 +29,7 @@ from django.utils.translation import activate, gettext, gettext_lazy, pgettext_l
 from django.views.decorators.gzip import gzip_page
 from django.views.generic.edit import FormView
 
+from weblate.formats.exportcache import export_translation
 from weblate.formats.models import EXPORTERS, FILE_FORMATS
 from weblate.lang.models import Language
 from weblate.trans.models import Category, Component, Project, Translation, Unit
@@ -38,6 +39,9 @@ from weblate.utils.stats import BaseStats, CategoryLanguage, ProjectLanguage
 from weblate.vcs.git import LocalRepository
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from typing import BinaryIO
+
     from django.db.models import Model
 
     from weblate.trans.mixins import BaseURLMixin
@@ -438,6 +442,10 @@ def import_message(request, count, message_none, message_ok) -> None:
         messages.success(request, message)
 
 
+# Size of chunks when reading files into ZIP archive
+ZIP_CHUNK_SIZE = 65536
+
+
 def iter_files(filenames):
     for filename in filenames:
         if os.path.isdir(filename):
@@ -449,22 +457,76 @@ def iter_files(filenames):
             yield filename
 
 
-def zip_download(
+class ZipStream:
+    """Write-only file-like object collecting ZIP output to be streamed."""
+
+    def __init__(self) -> None:
+        self.chunks: list[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        return
+
+    def pop(self) -> bytes:
+        result = b"".join(self.chunks)
+        self.chunks = []
+        return result
+
+
+def iter_zip(
     root: str,
     filenames: list[str],
-    name: str = "translations",
-    extra: dict[str, bytes] | None = None,
-):
-    response = HttpResponse(content_type="application/zip")
-    with ZipFile(response, "w", strict_timestamps=False) as zipfile:
+    extra: Iterable[tuple[str, str | bytes | BinaryIO]] = (),
+) -> Iterator[bytes]:
+    """
+    Generate ZIP archive content.
+
+    The files are read in chunks and the extra files are consumed one by one,
+    so the memory usage does not depend on the size of the archive.
+    """
+    stream = ZipStream()
+    with ZipFile(stream, "w", strict_timestamps=False) as zipfile:
         for filename in iter_files(filenames):
             try:
-                zipfile.write(filename, arcname=os.path.relpath(filename, root))
+                handle = open(filename, "rb")  # noqa: SIM115
             except FileNotFoundError:
                 continue
-        if extra:
-            for filename, content in extra.items():
+            with handle:
+                zipinfo = ZipInfo.from_file(
+                    filename,
+                    arcname=os.path.relpath(filename, root),
+                    strict_timestamps=False,
+                )
+                with zipfile.open(zipinfo, "w") as target:
+                    while chunk := handle.read(ZIP_CHUNK_SIZE):
+                        target.write(chunk)
+                        yield stream.pop()
+            yield stream.pop()
+        for filename, content in extra:
+            if isinstance(content, str | bytes):
                 zipfile.writestr(filename, content)
+            else:
+                # The size is not known in advance, ZIP64 allows entries over 2 GiB
+                with content, zipfile.open(filename, "w", force_zip64=True) as target:
+                    while chunk := content.read(ZIP_CHUNK_SIZE):
+                        target.write(chunk)
+                        yield stream.pop()
+            yield stream.pop()
+    yield stream.pop()
+
+
+def zip_download(
+    root: str,
+    filenames: list[str],
+    name: str = "translations",
+    extra: Iterable[tuple[str, str | bytes | BinaryIO]] = (),
+):
+    response = StreamingHttpResponse(
+        iter_zip(root, filenames, extra), content_type="application/zip"
+    )
     response["Content-Disposition"] = f'attachment; filename="{name}.zip"'
     return response
 
@@ -501,11 +563,9 @@ def download_translation_file(
         if not exporter_cls.supports(translation):
             raise Http404("File format is not compatible with this translation")
         exporter = exporter_cls(translation=translation)
-        units = translation.unit_set.prefetch_full().order_by("position")
-        if query_string:
-            units = units.search(query_string)
-        exporter.add_units(units)
-        response = exporter.get_response()
+        response = exporter.get_response(
+            content=export_translation(translation, exporter_cls, query_string)
+        )
     else:
         # Force flushing pending units
         try:
@@ -11,6 +11,7 @@ import logging
 import os
 import os.path
 import subprocess
+import time
 from typing import TYPE_CHECKING
 
 from dateutil import parser
@@ -21,6 +22,7 @@ from packaging.version import Version
 
 from weblate.trans.util import get_clean_env, path_separator
 from weblate.utils.errors import add_breadcrumb
+from weblate.utils.hash import calculate_checksum
 from weblate.utils.lock import WeblateLock
 from weblate.vcs.ssh import SSH_WRAPPER
 
@@ -32,6 +34,40 @@ if TYPE_CHECKING:
 
 LOGGER = logging.getLogger("weblate.vcs")
 
+# Hashes of files keyed by path and stat, backed by the Django cache
+BLOB_HASH_CACHE: dict[tuple[str, int, int, int], str] = {}
+BLOB_HASH_CACHE_SIZE = 10000
+BLOB_HASH_CACHE_TIMEOUT = 30 * 86400
+# Files modified recently can change without changing stat
+BLOB_HASH_RACY_NS = 2_000_000_000
+# Cache hit/miss counters not yet stored in the cache
+BLOB_HASH_COUNTERS = {"hits": 0, "misses": 0}
+BLOB_HASH_COUNTERS_FLUSH = 100
+
+
+def count_blob_hash(name: str) -> None:
+    BLOB_HASH_COUNTERS[name] += 1
+    if sum(BLOB_HASH_COUNTERS.values()) >= BLOB_HASH_COUNTERS_FLUSH:
+        flush_blob_hash_counters()
+
+
+def flush_blob_hash_counters() -> None:
+    for name, value in BLOB_HASH_COUNTERS.items():
+        if not value:
+            continue
+        key = f"vcs-blob-hash-{name}"
+        try:
+            cache.incr(key, value)
+        except ValueError:
+            cache.set(key, value, None)
+        BLOB_HASH_COUNTERS[name] = 0
+
+
+def get_blob_hash_stats() -> dict[str, int]:
+    """Return blob hash cache hit and miss counters."""
+    flush_blob_hash_counters()
+    return {name: cache.get(f"vcs-blob-hash-{name}", 0) for name in BLOB_HASH_COUNTERS}
+
 
 class RepositoryError(Exception):
     """Error while working with a repository."""
@@ -457,10 +493,46 @@ class Repository:
             for filename, name in sorted(files):
                 self.update_hash(objhash, filename, name)
         else:
-            self.update_hash(objhash, real_path)
+            return self.get_blob_hash(real_path)
 
         return objhash.hexdigest()
 
+    def get_object_hashes(self, paths: list[str]) -> dict[str, str]:
+        """Return hashes of multiple files, see get_object_hash."""
+        return {path: self.get_object_hash(path) for path in paths}
+
+    @classmethod
+    def get_blob_hash(cls, filename: str) -> str:
+        """
+        Return Git compatible hash of a file.
+
+        The hash is cached based on the file stat, so unchanged files are not
+        read again.
+        """
+        stat = os.lstat(filename)
+        key = (filename, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        cache_key = f"vcs-blob-hash-{calculate_checksum(*map(str, key))}"
+        result = BLOB_HASH_CACHE.get(key)
+        if result is None:
+            result = cache.get(cache_key)
+            if result is not None:
+                BLOB_HASH_CACHE[key] = result
+        if result is not None:
+            count_blob_hash("hits")
+            return result
+
+        count_blob_hash("misses")
+        objhash = hashlib.sha1(usedforsecurity=False)
+        cls.update_hash(objhash, filename)
+        result = objhash.hexdigest()
+
+        if time.time_ns() - stat.st_mtime_ns > BLOB_HASH_RACY_NS:
+            if len(BLOB_HASH_CACHE) >= BLOB_HASH_CACHE_SIZE:
+                BLOB_HASH_CACHE.clear()
+            BLOB_HASH_CACHE[key] = result
+            cache.set(cache_key, result, BLOB_HASH_CACHE_TIMEOUT)
+        return result
+
     def configure_remote(
         self, pull_url: str, push_url: str, branch: str, fast: bool = True
     ) -> None:
@@ -34,6 +34,7 @@ from weblate.utils.lock import WeblateLock, WeblateLockTimeoutError
 from weblate.utils.render import render_template
 from weblate.utils.xml import parse_xml
 from weblate.vcs.base import Repository, RepositoryError
+from weblate.vcs.gitbatch import close_git_batch, get_git_batch
 from weblate.vcs.gpg import get_gpg_sign_key
 
 if TYPE_CHECKING:
@@ -43,6 +44,8 @@ if TYPE_CHECKING:
     from django_stubs_ext import StrOrPromise
     from requests.auth import AuthBase
 
+    from weblate.vcs.gitbatch import GitBatchProcess
+
 
 class GitRepository(Repository):
     """Repository implementation for Git."""
@@ -183,7 +186,74 @@ class GitRepository(Repository):
     def has_git_file(self, name):
         return os.path.exists(os.path.join(self.path, ".git", name))
 
+    def get_batch(self) -> GitBatchProcess | None:
+        """Return long-running process for reading objects, if enabled."""
+        if not settings.VCS_BATCH_TIMEOUT:
+            return None
+        return get_git_batch(
+            self.path, {} if self.local else self._getenv(), settings.VCS_BATCH_TIMEOUT
+        )
+
+    def batch_read(self, name: str) -> tuple[str, str, bytes] | None:
+        """
+        Read object using the long-running process.
+
+        Returns None if the object could not be read this way, the caller is
+        expected to fall back to executing a command in that case.
+        """
+        batch = self.get_batch()
+        if batch is None or "\n" in name:
+            return None
+        try:
+            return batch.read_object(name)
+        except OSError:
+            return None
+
+    def execute(
+        self,
+        args: list[str],
+        needs_lock: bool = True,
+        fullcmd: bool = False,
+        merge_err: bool = True,
+        stdin: str | None = None,
+    ):
+        if needs_lock:
+            # The repository is being modified, do not keep any state from
+            # before the change
+            close_git_batch(self.path)
+        return super().execute(
+            args,
+            needs_lock=needs_lock,
+            fullcmd=fullcmd,
+            merge_err=merge_err,
+            stdin=stdin,
+        )
+
+    def get_last_revision(self):
+        result = self.batch_read("HEAD")
+        if result is not None and result[1] == "commit":
+            return result[0]
+        return super().get_last_revision()
+
+    @cached_property
+    def last_remote_revision(self):
+        """Return last remote revision."""
+        # The upstream is configured to track the remote branch, @{upstream}
+        # can not be used as it terminates the batch process when missing
+        result = self.batch_read(f"refs/remotes/{self.get_remote_branch_name()}")
+        if result is not None and result[1] == "commit":
+            return result[0]
+        return self.execute(
+            self._cmd_last_remote_revision, needs_lock=False, merge_err=False
+        )
+
     def has_rev(self, rev) -> bool:
+        batch = self.get_batch()
+        if batch is not None and "\n" not in rev:
+            try:
+                return batch.read_object(rev) is not None
+            except OSError:
+                pass
         try:
             self.execute(["rev-parse", "--verify", rev], needs_lock=False)
         except RepositoryError:
@@ -470,12 +540,53 @@ class GitRepository(Repository):
 
     def get_file(self, path, revision) -> str:
         """Return content of file at given revision."""
+        result = self.batch_read(f"{revision}:{path}")
+        if result is not None and result[1] == "blob":
+            # Match universal newlines handling of the command output
+            return result[2].decode().replace("\r\n", "\n").replace("\r", "\n")
         return self.execute(
             ["show", f"{revision}:{path}"],
             needs_lock=False,
             merge_err=False,
         )
 
+    def get_object_hashes(self, paths: list[str]) -> dict[str, str]:
+        """
+        Return hashes of multiple files.
+
+        Blob IDs of files unchanged since the last commit are taken from
+        the repository, only the changed, untracked or symlinked files are
+        hashed.
+        """
+        if not paths:
+            return {}
+        try:
+            tree = self.execute(
+                ["ls-tree", "-z", "HEAD", "--", *paths],
+                needs_lock=False,
+                merge_err=False,
+            )
+            changed = set(
+                self.execute(
+                    ["diff", "--name-only", "-z", "HEAD", "--", *paths],
+                    needs_lock=False,
+                    merge_err=False,
+                ).split("\0")
+            )
+        except RepositoryError:
+            # Repository without commits
+            return super().get_object_hashes(paths)
+        result = {}
+        for item in tree.split("\0"):
+            if not item:
+                continue
+            info, name = item.split("\t", 1)
+            mode, kind, objhash = info.split()
+            # Symlinks are resolved by get_object_hash
+            if kind == "blob" and mode != "120000" and name not in changed:
+                result[name] = objhash
+        return {path: result.get(path) or self.get_object_hash(path) for path in paths}
+
     def cleanup(self) -> None:
         """Remove not tracked files from the repository."""
         self.execute(["clean", "-f", "-d"])
@@ -0,0 +1,130 @@
+# Copyright © Michal Čihař <michal@weblate.org>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Long-running Git process for reading repository objects.
+
+Starting a Git process for every read query is expensive, so the objects are
+read using ``git cat-file --batch`` which is kept running for each
+repository. The processes are stopped when idle and whenever the repository
+is modified.
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import subprocess
+import threading
+from time import monotonic
+
+from weblate.utils.errors import add_breadcrumb
+
+# Running processes per repository path
+GIT_BATCH_PROCESSES: dict[str, GitBatchProcess] = {}
+GIT_BATCH_LOCK = threading.Lock()
+
+
+class GitBatchProcess:
+    """Wrapper around git cat-file --batch process."""
+
+    def __init__(self, path: str, env: dict[str, str]) -> None:
+        self.path = path
+        self.env = env
+        self.lock = threading.Lock()
+        self.process: subprocess.Popen | None = None
+        self.pid = os.getpid()
+        self.last_used = monotonic()
+
+    def start(self) -> subprocess.Popen:
+        add_breadcrumb(category="vcs", message="git cat-file --batch", cwd=self.path)
+        return subprocess.Popen(
+            ["git", "cat-file", "--batch"],
+            cwd=self.path,
+            env=self.env,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+
+    def close(self) -> None:
+        with self.lock:
+            process, self.process = self.process, None
+            if process is None:
+                return
+            process.stdin.close()
+            process.stdout.close()
+            if self.pid != os.getpid():
+                # Inherited from the parent process, it is not our child
+                return
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+
+    @staticmethod
+    def communicate(
+        process: subprocess.Popen, name: str
+    ) -> tuple[str, str, bytes] | None:
+        process.stdin.write(f"{name}\n".encode())
+        process.stdin.flush()
+        header = process.stdout.readline()
+        if not header:
+            raise OSError("git cat-file has terminated")
+        if header.endswith((b" missing\n", b" ambiguous\n")):
+            return None
+        objhash, objtype, size = header.decode().split()
+        content = process.stdout.read(int(size))
+        # Skip trailing newline
+        process.stdout.read(1)
+        return (objhash, objtype, content)
+
+    def read_object(self, name: str) -> tuple[str, str, bytes] | None:
+        """
+        Read object from the repository.
+
+        Returns object hash, type and content, or None if it does not exist.
+        """
+        if "\n" in name:
+            raise ValueError("Invalid object name")
+        with self.lock:
+            if self.process is None or self.process.poll() is not None:
+                self.process = self.start()
+            process = self.process
+            try:
+                result = self.communicate(process, name)
+            except (OSError, ValueError):
+                self.process = None
+                process.kill()
+                process.wait()
+                raise OSError("git cat-file has failed") from None
+            self.last_used = monotonic()
+        return result
+
+
+def get_git_batch(path: str, env: dict[str, str], timeout: int) -> GitBatchProcess:
+    """Return batch process for the repository, stopping idle ones."""
+    now = monotonic()
+    with GIT_BATCH_LOCK:
+        for other in list(GIT_BATCH_PROCESSES.values()):
+            if other.pid != os.getpid() or other.last_used < now - timeout:
+                del GIT_BATCH_PROCESSES[other.path]
+                other.close()
+        if path not in GIT_BATCH_PROCESSES:
+            GIT_BATCH_PROCESSES[path] = GitBatchProcess(path, env)
+        return GIT_BATCH_PROCESSES[path]
+
+
+def close_git_batch(path: str | None = None) -> None:
+    """Stop batch process for the repository or all of them."""
+    with GIT_BATCH_LOCK:
+        paths = list(GIT_BATCH_PROCESSES) if path is None else [path]
+        for current in paths:
+            process = GIT_BATCH_PROCESSES.pop(current, None)
+            if process is not None:
+                process.close()
+
+
+atexit.register(close_git_batch)
@@ -26,6 +26,9 @@ class VCSConf(AppConf):
     VCS_API_DELAY = 10
     VCS_FILE_PROTOCOL = False
 
+    # Idle timeout of the long-running Git process for reading objects
+    VCS_BATCH_TIMEOUT = 300
+
     # GitHub username for sending pull requests
     GITHUB_CREDENTIALS = {}
 
@@ -8,9 +8,11 @@ import copy
 import os.path
 import re
 import shutil
+import sys
 import tempfile
+import time
 from typing import Any, NoReturn
-from unittest import SkipTest
+from unittest import SkipTest, skipUnless
 from unittest.mock import patch
 
 import responses
@@ -21,7 +23,7 @@ from responses import matchers
 
 from weblate.trans.models import Component, Project
 from weblate.trans.tests.utils import RepoTestMixin, TempDirMixin
-from weblate.vcs.base import Repository, RepositoryError
+from weblate.vcs.base import Repository, RepositoryError, get_blob_hash_stats
 from weblate.vcs.git import (
     AzureDevOpsRepository,
     BitbucketServerRepository,
@@ -35,6 +37,7 @@ from weblate.vcs.git import (
     PagureRepository,
     SubversionRepository,
 )
+from weblate.vcs.gitbatch import GIT_BATCH_PROCESSES, close_git_batch
 from weblate.vcs.mercurial import HgRepository
 
 
@@ -438,6 +441,38 @@ class VCSGitTest(TestCase, RepoTestMixin, TempDirMixin):
         obj_hash = self.repo.get_object_hash("README.md")
         self.assertEqual(len(obj_hash), 40)
 
+    def test_object_hash_cache(self) -> None:
+        filename = os.path.join(self.tempdir, "README.md")
+        # Make the file old enough to be cached
+        os.utime(filename, (1000000000, 1000000000))
+        obj_hash = self.repo.get_object_hash("README.md")
+        stats = get_blob_hash_stats()
+        self.assertEqual(self.repo.get_object_hash("README.md"), obj_hash)
+        self.assertEqual(get_blob_hash_stats()["hits"], stats["hits"] + 1)
+
+        # Changed content is hashed again
+        with open(filename, "a") as handle:
+            handle.write("\nChanged\n")
+        os.utime(filename, (1000000001, 1000000001))
+        self.assertNotEqual(self.repo.get_object_hash("README.md"), obj_hash)
+        self.assertEqual(get_blob_hash_stats()["misses"], stats["misses"] + 1)
+
+    def test_object_hashes(self) -> None:
+        filenames = ["README.md", "po/cs.po", "untracked.txt"]
+        with open(os.path.join(self.tempdir, "untracked.txt"), "w") as handle:
+            handle.write("Untracked\n")
+        expected = {
+            filename: self.repo.get_object_hash(filename) for filename in filenames
+        }
+        self.assertEqual(self.repo.get_object_hashes(filenames), expected)
+
+        # Changes in the working tree are included
+        with open(os.path.join(self.tempdir, "po/cs.po"), "a") as handle:
+            handle.write("\n")
+        hashes = self.repo.get_object_hashes(filenames)
+        self.assertNotEqual(hashes["po/cs.po"], expected["po/cs.po"])
+        self.assertEqual(hashes["po/cs.po"], self.repo.get_object_hash("po/cs.po"))
+
     def test_configure_remote(self) -> None:
         with self.repo.lock:
             self.repo.configure_remote("pullurl", "pushurl", "branch")
@@ -507,6 +542,110 @@ class VCSGitTest(TestCase, RepoTestMixin, TempDirMixin):
         self.assertEqual(self._remote_branch, self.repo.get_remote_branch(self.tempdir))
 
 
+class VCSGitBatchBaseTest(TestCase, RepoTestMixin, TempDirMixin):
+    def setUp(self) -> None:
+        super().setUp()
+        self.clone_test_repos()
+        self.create_temp()
+        self.repo = GitRepository.clone(
+            self.format_local_path(self.git_repo_path), self.tempdir, "main"
+        )
+
+    def tearDown(self) -> None:
+        close_git_batch(self.repo.path)
+        super().tearDown()
+
+
+class VCSGitBatchTest(VCSGitBatchBaseTest):
+    def test_read(self) -> None:
+        revision = self.repo.execute(
+            ["log", "-n", "1", "--format=format:%H", "HEAD"], needs_lock=False
+        )
+        self.assertEqual(self.repo.get_last_revision(), revision)
+        self.assertIn(self.repo.path, GIT_BATCH_PROCESSES)
+        self.assertEqual(self.repo.last_remote_revision, revision)
+        self.assertEqual(
+            self.repo.get_file("po/cs.po", revision),
+            self.repo.execute(["show", f"{revision}:po/cs.po"], needs_lock=False),
+        )
+        self.assertTrue(self.repo.has_rev(revision))
+        self.assertFalse(self.repo.has_rev("MERGE_HEAD"))
+        with self.assertRaises(RepositoryError):
+            self.repo.get_file("missing.po", revision)
+
+    def test_modify(self) -> None:
+        revision = self.repo.get_last_revision()
+        with self.repo.lock:
+            self.repo.set_committer("Foo Bar", "foo@example.net")
+            with open(os.path.join(self.tempdir, "README.md"), "a") as handle:
+                handle.write("\nChanged\n")
+            self.repo.commit(
+                "Test commit", "Foo Bar <foo@bar.com>", timezone.now(), ["README.md"]
+            )
+            # Stopped when modifying the repository
+            self.assertNotIn(self.repo.path, GIT_BATCH_PROCESSES)
+        self.assertNotEqual(self.repo.get_last_revision(), revision)
+        self.assertTrue(self.repo.has_rev(revision))
+
+    def test_terminated(self) -> None:
+        revision = self.repo.get_last_revision()
+        batch = GIT_BATCH_PROCESSES[self.repo.path]
+        batch.process.kill()
+        batch.process.wait()
+        self.assertEqual(self.repo.get_last_revision(), revision)
+
+    def read_repository(self) -> list:
+        revisions = ["HEAD", "HEAD~1", "MERGE_HEAD", "missing"]
+        filenames = self.repo.execute(
+            ["ls-tree", "-r", "--name-only", "HEAD", "po"], needs_lock=False
+        ).splitlines()
+        return [
+            self.repo.get_last_revision(),
+            [self.repo.has_rev(revision) for revision in revisions],
+            [self.repo.get_file(filename, "HEAD") for filename in filenames],
+        ]
+
+    def test_matches_subprocess(self) -> None:
+        with override_settings(VCS_BATCH_TIMEOUT=0):
+            expected = self.read_repository()
+            self.assertNotIn(self.repo.path, GIT_BATCH_PROCESSES)
+        self.assertEqual(self.read_repository(), expected)
+        self.assertIn(self.repo.path, GIT_BATCH_PROCESSES)
+
+    @override_settings(VCS_BATCH_TIMEOUT=0)
+    def test_disabled(self) -> None:
+        self.assertIsNone(self.repo.get_batch())
+        self.assertIn("msgid", self.repo.get_file("po/cs.po", "HEAD"))
+        self.assertNotIn(self.repo.path, GIT_BATCH_PROCESSES)
+
+
+@skipUnless("CI_BENCHMARK" in os.environ, "Benchmarks are not enabled")
+class VCSGitBatchBenchmarkTest(VCSGitBatchBaseTest):
+    """
+    Compare reading from the repository with and without batch process.
+
+    Only reports timings, run with CI_BENCHMARK environment variable set.
+    """
+
+    count = 50
+
+    def read_repository(self) -> float:
+        start = time.perf_counter()
+        for _i in range(self.count):
+            self.repo.get_file("po/cs.po", "HEAD")
+            self.repo.has_rev("HEAD")
+        return time.perf_counter() - start
+
+    def test_benchmark(self) -> None:
+        with override_settings(VCS_BATCH_TIMEOUT=0):
+            subprocess_time = self.read_repository()
+        batch_time = self.read_repository()
+        sys.stderr.write(
+            f"\ngit subprocess: {subprocess_time:.3f}s, "
+            f"batch: {batch_time:.3f}s for {self.count} reads\n"
+        )
+
+
 class VCSGitForcePushTest(VCSGitTest):
     _class = GitForcePushRepository
 